@@ -37,6 +37,20 @@ from vector_inspector.core.connections.base_connection import VectorDBConnection
 from vector_inspector.core.logging import log_info, log_tracked_error
 from vector_inspector.utils.lazy_imports import get_weaviate_client
 
+# Fixed for every connection, so built once rather than per call
+_SUPPORTED_FILTER_OPERATORS: tuple[dict[str, Any], ...] = (
+    {"name": "=", "server_side": True},
+    {"name": "!=", "server_side": True},
+    {"name": ">", "server_side": True},
+    {"name": ">=", "server_side": True},
+    {"name": "<", "server_side": True},
+    {"name": "<=", "server_side": True},
+    {"name": "in", "server_side": True},
+    {"name": "not in", "server_side": True},
+    {"name": "contains", "server_side": True},
+    {"name": "not contains", "server_side": False},  # Client-side only
+)
+
 
 class WeaviateConnection(VectorDBConnection):
     """Manages connection to Weaviate and provides query interface."""
@@ -569,62 +583,44 @@ class WeaviateConnection(VectorDBConnection):
         try:
             collection = self._client.collections.get(collection_name)
 
-            # Prepare data objects for batch insert
-            weaviate: Any = self._weaviate_module
-            data_objects = []
-
-            for i in range(len(documents)):
-                # Build properties with document and metadata
-                properties = {"document": documents[i]}
+            # Stream each object into the batch as soon as it is built
+            with collection.batch.dynamic() as batch:
+                for i in range(len(documents)):
+                    # Build properties with document and metadata
+                    properties = {"document": documents[i]}
 
-                if metadatas and i < len(metadatas):
-                    # Add metadata fields as properties
-                    properties.update(metadatas[i])
+                    if metadatas and i < len(metadatas):
+                        # Add metadata fields as properties
+                        properties.update(metadatas[i])
 
-                    # Normalize numeric metadata: convert numbers that are
-                    # integer-valued (e.g. 54.0) to plain Python ints so they
-                    # appear as "54" in Weaviate instead of "54.0".
-                    for _k, _v in list(properties.items()):
+                        # Normalize numeric metadata: convert numbers that are
+                        # integer-valued (e.g. 54.0) to plain Python ints so they
+                        # appear as "54" in Weaviate instead of "54.0".
+                        for _k, _v in list(properties.items()):
+                            try:
+                                if isinstance(_v, numbers.Number) and float(_v).is_integer():
+                                    # If it has no fractional part, coerce to int and then to string
+                                    properties[_k] = str(int(_v))
+                            except Exception:
+                                # Be conservative on errors and leave value as-is
+                                continue
+
+                    # Handle UUID for this item
+                    item_uuid = None
+                    if ids and i < len(ids) and ids[i]:
+                        # Try to use provided ID as UUID
                         try:
-                            if isinstance(_v, numbers.Number) and float(_v).is_integer():
-                                # If it has no fractional part, coerce to int and then to string
-                                properties[_k] = str(int(_v))
-                        except Exception:
-                            # Be conservative on errors and leave value as-is
-                            continue
-
-                # Handle UUID for this item
-                item_uuid = None
-                if ids and i < len(ids) and ids[i]:
-                    # Try to use provided ID as UUID
-                    try:
-                        # Validate if it's already a valid UUID
-                        item_uuid = uuid.UUID(ids[i])
-                    except (ValueError, AttributeError):
-                        # Not a valid UUID - generate deterministic UUID from the string
-                        # Using uuid5 ensures same string always generates same UUID
-                        namespace = uuid.UUID("6ba7b810-9dad-11d1-80b4-00c04fd430c8")  # DNS namespace
-                        item_uuid = uuid.uuid5(namespace, ids[i])
-                else:
-                    # No ID provided - generate random UUID
-                    item_uuid = uuid.uuid4()
-
-                # Create data object
-                data_obj = weaviate.classes.data.DataObject(
-                    properties=properties,
-                    vector=embeddings[i],
-                    uuid=item_uuid,
-                )
-                data_objects.append(data_obj)
+                            # Validate if it's already a valid UUID
+                            item_uuid = uuid.UUID(ids[i])
+                        except (ValueError, AttributeError):
+                            # Not a valid UUID - generate deterministic UUID from the string
+                            # Using uuid5 ensures same string always generates same UUID
+                            item_uuid = uuid.uuid5(uuid.NAMESPACE_DNS, ids[i])
+                    else:
+                        # No ID provided - generate random UUID
+                        item_uuid = uuid.uuid4()
 
-            # Batch insert
-            with collection.batch.dynamic() as batch:
-                for obj in data_objects:
-                    batch.add_object(
-                        properties=obj.properties,
-                        vector=obj.vector,
-                        uuid=obj.uuid,
-                    )
+                    batch.add_object(properties=properties, vector=embeddings[i], uuid=item_uuid)
 
             log_info("Added %d items to collection '%s'", len(documents), collection_name)
             return True
@@ -1250,15 +1246,4 @@ class WeaviateConnection(VectorDBConnection):
 
     def get_supported_filter_operators(self) -> list[dict[str, Any]]:
         """Get filter operators supported by Weaviate."""
-        return [
-            {"name": "=", "server_side": True},
-            {"name": "!=", "server_side": True},
-            {"name": ">", "server_side": True},
-            {"name": ">=", "server_side": True},
-            {"name": "<", "server_side": True},
-            {"name": "<=", "server_side": True},
-            {"name": "in", "server_side": True},
-            {"name": "not in", "server_side": True},
-            {"name": "contains", "server_side": True},
-            {"name": "not contains", "server_side": False},  # Client-side only
-        ]
+        return list(_SUPPORTED_FILTER_OPERATORS)
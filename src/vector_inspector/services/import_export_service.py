@@ -1,12 +1,77 @@
 """Service for importing and exporting collection data."""
 
 import json
+import math
+from collections.abc import Iterator
 from typing import Any, Optional
 
 import numpy as np
+import orjson
 import pandas as pd
 
 from vector_inspector.core.logging import log_tracked_error
+from vector_inspector.utils.json_safe import make_json_safe
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Return obj with NaN/Inf floats replaced by None, as orjson writes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _replace_non_finite(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_replace_non_finite(v) for v in obj]
+    return obj
+
+
+def _stdlib_ndjson_line(record: dict[str, Any]) -> bytes:
+    """Encode a record with the stdlib json module in orjson's format."""
+    try:
+        text = json.dumps(record, ensure_ascii=False, separators=(",", ":"), allow_nan=False, default=make_json_safe)
+    except ValueError:
+        # NaN/Inf somewhere in the record: normalize to plain types, then null them out
+        safe = _replace_non_finite(make_json_safe(record))
+        text = json.dumps(safe, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    return (text + "\n").encode("utf-8")
+
+
+def _ndjson_line(record: dict[str, Any]) -> bytes:
+    """Encode a single record as one UTF-8 NDJSON line.
+
+    orjson handles the common case. Records it rejects, such as integers wider
+    than 64 bits, go through the stdlib encoder, which writes the same compact
+    separators and null for NaN/Inf.
+    """
+    try:
+        return orjson.dumps(
+            record,
+            default=make_json_safe,
+            option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+        )
+    except orjson.JSONEncodeError:
+        return _stdlib_ndjson_line(record)
+
+
+def _export_records(data: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Yield one export record per id, with numpy embeddings converted to lists."""
+    ids = data.get("ids", [])
+    documents = data.get("documents", [])
+    metadatas = data.get("metadatas", [])
+    embeddings = data.get("embeddings", [])
+
+    for i, item_id in enumerate(ids):
+        item = {
+            "id": item_id,
+            "document": documents[i] if i < len(documents) else None,
+            "metadata": metadatas[i] if i < len(metadatas) else {},
+        }
+        # Optionally include embeddings (convert numpy arrays to lists)
+        if len(embeddings) > 0 and i < len(embeddings):
+            embedding = embeddings[i]
+            if isinstance(embedding, np.ndarray):
+                embedding = embedding.tolist()
+            item["embedding"] = embedding
+        yield item
 
 
 class ImportExportService:
@@ -26,26 +91,7 @@ class ImportExportService:
         """
         try:
             # Structure data for export
-            export_data = []
-            ids = data.get("ids", [])
-            documents = data.get("documents", [])
-            metadatas = data.get("metadatas", [])
-            embeddings = data.get("embeddings", [])
-
-            for i, item_id in enumerate(ids):
-                item = {
-                    "id": item_id,
-                    "document": documents[i] if i < len(documents) else None,
-                    "metadata": metadatas[i] if i < len(metadatas) else {},
-                }
-                # Optionally include embeddings (convert numpy arrays to lists)
-                if len(embeddings) > 0 and i < len(embeddings):
-                    embedding = embeddings[i]
-                    # Convert numpy array to list if needed
-                    if isinstance(embedding, np.ndarray):
-                        embedding = embedding.tolist()
-                    item["embedding"] = embedding
-                export_data.append(item)
+            export_data = list(_export_records(data))
 
             # Write to file
             with open(file_path, "w", encoding="utf-8") as f:
@@ -63,6 +109,38 @@ class ImportExportService:
             )
             return False
 
+    @staticmethod
+    def export_to_ndjson(data: dict[str, Any], file_path: str) -> bool:
+        """
+        Export collection data to newline-delimited JSON (one record per line).
+
+        Records are encoded and written one at a time, so memory stays flat
+        for large collections instead of building the whole export in memory.
+
+        Args:
+            data: Collection data dictionary with ids, documents, metadatas, embeddings
+            file_path: Path to save NDJSON file
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with open(file_path, "wb") as f:
+                for item in _export_records(data):
+                    f.write(_ndjson_line(item))
+
+            return True
+        except Exception as e:
+            log_tracked_error(
+                "Export to NDJSON failed: %s",
+                e,
+                category="data",
+                operation="export_to_ndjson",
+                error_type=type(e).__name__,
+                exc_info=True,
+            )
+            return False
+
     @staticmethod
     def export_to_csv(data: dict[str, Any], file_path: str, include_embeddings: bool = False) -> bool:
         """
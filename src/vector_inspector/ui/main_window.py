@@ -872,8 +872,7 @@ class MainWindow(InspectorShell):
                 pass
 
         # Display the results
-        self.search_view.search_results = results
-        self.search_view._display_results(results)
+        self.search_view._apply_search_results(results)
 
         # Update status with context if provided
         if context_info:
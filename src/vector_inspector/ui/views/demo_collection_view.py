@@ -32,6 +32,19 @@ from vector_inspector.services import (
 from vector_inspector.state import AppState
 from vector_inspector.ui.components.loading_dialog import LoadingDialog
 
+# Display bounds for truncated table cells
+METADATA_PREVIEW_CHARS = 50
+DOCUMENT_PREVIEW_CHARS = 100
+
+
+def _read_only_item(text: str, max_chars: Optional[int] = None) -> QTableWidgetItem:
+    """Create a non-editable table item, truncating ``text`` to ``max_chars`` plus an ellipsis."""
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars] + "..."
+    item = QTableWidgetItem(text)
+    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+    return item
+
 
 class DemoCollectionView(QWidget):
     """
@@ -271,24 +284,16 @@ class DemoCollectionView(QWidget):
 
         for row, item_id in enumerate(ids):
             # ID column
-            id_item = QTableWidgetItem(str(item_id))
-            id_item.setFlags(id_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 0, id_item)
+            self.table.setItem(row, 0, _read_only_item(str(item_id)))
 
             # Metadata column
             metadata = metadatas[row] if row < len(metadatas) else {}
             metadata_str = str(metadata) if metadata else ""
-            metadata_item = QTableWidgetItem(
-                metadata_str[:50] + "..." if len(metadata_str) > 50 else metadata_str
-            )
-            metadata_item.setFlags(metadata_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 1, metadata_item)
+            self.table.setItem(row, 1, _read_only_item(metadata_str, METADATA_PREVIEW_CHARS))
 
             # Document column
             document = documents[row] if row < len(documents) else ""
             doc_str = str(document) if document else ""
-            doc_item = QTableWidgetItem(doc_str[:100] + "..." if len(doc_str) > 100 else doc_str)
-            doc_item.setFlags(doc_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.table.setItem(row, 2, doc_item)
+            self.table.setItem(row, 2, _read_only_item(doc_str, DOCUMENT_PREVIEW_CHARS))
 
         self.table.resizeColumnsToContents()
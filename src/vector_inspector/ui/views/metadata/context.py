@@ -1,6 +1,7 @@
 """Context and state management for metadata view operations."""
 
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from typing import Any, Optional
 
 # Type aliases using modern built-in generic types (PEP 585)
@@ -65,6 +66,22 @@ class MetadataContext:
         """Check if context has loaded data."""
         return self.current_data is not None and bool(self.current_data.get("ids"))
 
+    @staticmethod
+    def inject_timestamp(
+        metadata: Optional[MetadataDict], key: str, *, overwrite: bool = False, now_iso: Optional[str] = None
+    ) -> MetadataDict:
+        """Stamp metadata[key] with the current UTC time (ISO 8601).
+
+        An existing value is kept unless overwrite is set. Callers stamping
+        many items can pass a precomputed now_iso so every item shares one
+        timestamp and the clock is only read once.
+        """
+        if metadata is None:
+            metadata = {}
+        if overwrite or key not in metadata:
+            metadata[key] = now_iso if now_iso is not None else datetime.now(UTC).isoformat()
+        return metadata
+
     def set_collection(self, collection: str, database: str = "") -> None:
         """Set current collection and reset state."""
         self.current_collection = collection
@@ -212,12 +212,9 @@ def copy_vectors_to_json(
         )
         return
 
-    # Format as JSON (single object if one row, list if multiple)
+    # Format as JSON (always a list, even for a single row)
     try:
-        if len(vectors_data) == 1:
-            json_output = json.dumps(vectors_data[0], indent=2)
-        else:
-            json_output = json.dumps(vectors_data, indent=2)
+        json_output = json.dumps(vectors_data, indent=2)
 
         # Copy to clipboard
         clipboard = QApplication.clipboard()
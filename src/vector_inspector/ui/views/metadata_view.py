@@ -2,7 +2,6 @@
 
 import hashlib
 import time
-from datetime import UTC
 from typing import Any, Optional
 
 from PySide6.QtCore import Qt, QTimer, Signal
@@ -519,12 +518,7 @@ class MetadataView(QWidget):
             # Inject created_at timestamp if checkbox is enabled and not already present
             auto_timestamp = item_data.pop("auto_timestamp", False)
             if auto_timestamp:
-                from datetime import datetime
-
-                if item_data["metadata"] is None:
-                    item_data["metadata"] = {}
-                if "created_at" not in item_data["metadata"]:
-                    item_data["metadata"]["created_at"] = datetime.now(UTC).isoformat()
+                item_data["metadata"] = MetadataContext.inject_timestamp(item_data["metadata"], "created_at")
 
             # Run the DB write in the background so the UI stays responsive.
             self.loading_dialog.show_loading("Adding item…")
@@ -741,11 +735,9 @@ class MetadataView(QWidget):
             # Inject updated_at timestamp if checkbox is enabled
             auto_timestamp = updated_data.pop("auto_timestamp", True)
             if auto_timestamp:
-                from datetime import datetime
-
-                if updated_data["metadata"] is None:
-                    updated_data["metadata"] = {}
-                updated_data["metadata"]["updated_at"] = datetime.now(UTC).isoformat()
+                updated_data["metadata"] = MetadataContext.inject_timestamp(
+                    updated_data["metadata"], "updated_at", overwrite=True
+                )
 
             # Decide whether to generate embeddings on edit or preserve existing
             embeddings_arg = None
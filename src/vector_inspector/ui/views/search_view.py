@@ -54,6 +54,8 @@ class SearchView(QWidget):
     breadcrumb_label: QLabel
     query_input: QTextEdit
     results_table: QTableWidget
+    main_splitter: QSplitter
+    query_section: QWidget
     results_status: QLabel
     refresh_button: QPushButton
     n_results_spin: QSpinBox
@@ -245,6 +247,7 @@ class SearchView(QWidget):
         query_layout.addStretch()
 
         splitter.addWidget(query_widget)
+        self.query_section = query_widget
 
         # Results section
         results_widget = QWidget()
@@ -312,6 +315,8 @@ class SearchView(QWidget):
         splitter.setStretchFactor(0, 1)
         splitter.setStretchFactor(1, 2)
 
+        self.main_splitter = splitter
+
         layout.addWidget(splitter)
         self.setLayout(layout)
 
@@ -413,8 +418,7 @@ class SearchView(QWidget):
             if cached.search_query:
                 self.query_input.setPlainText(cached.search_query)
             if cached.search_results:
-                self.search_results = cached.search_results
-                self._display_results(cached.search_results)
+                self._apply_search_results(cached.search_results)
                 return
 
         log_info("[SearchView] ✗ Cache MISS or no cached search.")
@@ -555,10 +559,7 @@ class SearchView(QWidget):
 
         # Check if results have the expected structure
         if not results.get("ids") or not isinstance(results["ids"], list) or len(results["ids"]) == 0:
-            self.results_status.setText("No results found or query failed")
-            self.results_table.setRowCount(0)
-            if hasattr(self, "details_pane"):
-                self.details_pane.update_item(None)
+            self._clear_results_and_hide_pane("No results found or query failed")
             return
 
         # Apply client-side filters if any
@@ -585,8 +586,7 @@ class SearchView(QWidget):
                 ],
             }
 
-        self.search_results = results
-        self._display_results(results)
+        self._apply_search_results(results)
 
         # Report completion to the status bar (with timing and result count)
         elapsed = time.time() - self._search_start_time
@@ -700,7 +700,11 @@ class SearchView(QWidget):
         except Exception:
             pass  # Best effort telemetry
 
-        self.results_status.setText(f"Search failed: {error_message}")
+        self._clear_results_and_hide_pane(f"Search failed: {error_message}")
+
+    def _clear_results_and_hide_pane(self, status_text: str) -> None:
+        """Empty the results table, show status_text and hide the inline details pane."""
+        self.results_status.setText(status_text)
         self.results_table.setRowCount(0)
         if hasattr(self, "details_pane"):
             self.details_pane.update_item(None)
@@ -875,12 +879,9 @@ class SearchView(QWidget):
             )
             return
 
-        # Format as JSON (single object if one row, list if multiple)
+        # Format as JSON (always a list, even for a single row)
         try:
-            if len(vectors_data) == 1:
-                json_output = json.dumps(vectors_data[0], indent=2)
-            else:
-                json_output = json.dumps(vectors_data, indent=2)
+            json_output = json.dumps(vectors_data, indent=2)
 
             # Copy to clipboard
             clipboard = QApplication.clipboard()
@@ -1045,6 +1046,15 @@ class SearchView(QWidget):
         )
         dlg.show()
 
+    def _apply_search_results(self, results: dict[str, Any]) -> None:
+        """Store results and fill the table without repainting once per cell."""
+        self.search_results = results
+        self.results_table.setUpdatesEnabled(False)
+        try:
+            self._display_results(results)
+        finally:
+            self.results_table.setUpdatesEnabled(True)
+
     def _display_results(self, results: dict[str, Any]):
         """Display search results in table."""
 
@@ -1068,10 +1078,7 @@ class SearchView(QWidget):
         distances = _unwrap("distances")
 
         if not ids:
-            self.results_table.setRowCount(0)
-            self.results_status.setText("No results found")
-            if hasattr(self, "details_pane"):
-                self.details_pane.update_item(None)
+            self._clear_results_and_hide_pane("No results found")
             return
 
         # Determine columns
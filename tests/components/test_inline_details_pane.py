@@ -7,38 +7,129 @@ import json
 from unittest.mock import Mock
 
 import pytest
-from PySide6.QtWidgets import QApplication
 
 from vector_inspector.ui.components.inline_details_pane import (
     CollapsibleSection,
     InlineDetailsPane,
 )
 
+# Immutable payloads built once at import; fixtures hand out shallow copies.
+_SAMPLE_ITEM = {
+    "id": "test-id-123",
+    "document": "This is a test document with some content",
+    "metadata": {
+        "title": "Test Document",
+        "created_at": "2024-01-15T10:30:00",
+        "updated_at": "2024-01-16T14:20:00",
+        "cluster": 2,
+        "category": "test",
+    },
+    "embedding": [0.1, 0.2, 0.3, 0.4, 0.5],
+}
+_SEARCH_ITEM = {**_SAMPLE_ITEM, "rank": 1, "distance": 0.234}
+_LONG_DOC = "A" * 600  # Longer than the 500 char preview limit
+
+# Single decoder reused for every metadata parse in this module
+_decode = json.JSONDecoder().decode
+
 
 @pytest.fixture
 def sample_item_data():
     """Sample item data for testing."""
-    return {
-        "id": "test-id-123",
-        "document": "This is a test document with some content",
-        "metadata": {
-            "title": "Test Document",
-            "created_at": "2024-01-15T10:30:00",
-            "updated_at": "2024-01-16T14:20:00",
-            "cluster": 2,
-            "category": "test",
-        },
-        "embedding": [0.1, 0.2, 0.3, 0.4, 0.5],
-    }
+    return dict(_SAMPLE_ITEM)
 
 
 @pytest.fixture
-def search_item_data(sample_item_data):
+def search_item_data():
     """Sample search result item data."""
-    data = sample_item_data.copy()
-    data["rank"] = 1
-    data["distance"] = 0.234
-    return data
+    return dict(_SEARCH_ITEM)
+
+
+class FakeSettingsService:
+    """Dict-backed SettingsService stand-in; no QSettings or disk I/O."""
+
+    def __init__(self):
+        self._values = {}
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def set(self, key, value):
+        self._values[key] = value
+
+
+_SETTINGS_SERVICE_TARGET = "vector_inspector.ui.components.inline_details_pane.SettingsService"
+
+
+@pytest.fixture
+def fake_settings_service(monkeypatch):
+    """In-memory settings handed to any pane constructed during the test."""
+    settings = FakeSettingsService()
+    monkeypatch.setattr(_SETTINGS_SERVICE_TARGET, lambda: settings)
+    return settings
+
+
+@pytest.fixture(scope="module")
+def _shared_panes(qapp):
+    """One pane per view mode, built once and reused across the module."""
+    # In-memory settings keep the shared panes' state independent of the
+    # user's persisted settings and of other tests.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(_SETTINGS_SERVICE_TARGET, FakeSettingsService)
+        panes = {
+            "data_browser": InlineDetailsPane(view_mode="data_browser"),
+            "search": InlineDetailsPane(view_mode="search"),
+        }
+    yield panes
+    for pane in panes.values():
+        pane.close()
+        pane.deleteLater()
+
+
+def _reset_pane(pane):
+    """Return a shared pane to its freshly-constructed state."""
+    pane.update_item(None)
+    pane._load_state()
+
+
+@pytest.fixture
+def inline_pane_db(_shared_panes):
+    """Shared data-browser pane, reset after each test."""
+    pane = _shared_panes["data_browser"]
+    yield pane
+    _reset_pane(pane)
+
+
+@pytest.fixture
+def inline_pane_search(_shared_panes):
+    """Shared search pane, reset after each test."""
+    pane = _shared_panes["search"]
+    yield pane
+    _reset_pane(pane)
+
+
+class FakeClipboard:
+    """In-memory stand-in for the system clipboard."""
+
+    def __init__(self):
+        self._text = ""
+
+    def setText(self, text):
+        self._text = text
+
+    def text(self):
+        return self._text
+
+
+@pytest.fixture
+def fake_clipboard(monkeypatch):
+    """Route the pane's clipboard writes to memory instead of the OS clipboard."""
+    clipboard = FakeClipboard()
+    monkeypatch.setattr(
+        "vector_inspector.ui.components.inline_details_pane.QApplication.clipboard",
+        staticmethod(lambda: clipboard),
+    )
+    return clipboard
 
 
 # CollapsibleSection Tests
@@ -53,8 +144,8 @@ def test_collapsible_section_creation(qtbot):
     assert section.content_widget.isVisible() is False
 
 
-def test_collapsible_section_toggle(qtbot):
-    """Test toggling a collapsible section."""
+def test_collapsible_section_transitions(qtbot):
+    """Test toggling and programmatically setting collapsed state on one section."""
     section = CollapsibleSection("Test Section")
     qtbot.addWidget(section)
     section.show()  # Show widget for visibility tests
@@ -74,18 +165,15 @@ def test_collapsible_section_toggle(qtbot):
     assert section.content_widget.isVisible() is False
     assert section.toggle_button.text().startswith("▶")
 
-
-def test_collapsible_section_set_collapsed(qtbot):
-    """Test programmatically setting collapsed state."""
-    section = CollapsibleSection("Test Section")
-    qtbot.addWidget(section)
-    section.show()  # Show widget for visibility tests
-
     # Set to expanded
     section.set_collapsed(False)
     assert section.is_collapsed() is False
     assert section.content_widget.isVisible() is True
 
+    # Setting the current state again is a no-op
+    section.set_collapsed(False)
+    assert section.is_collapsed() is False
+
     # Set to collapsed
     section.set_collapsed(True)
     assert section.is_collapsed() is True
@@ -95,10 +183,9 @@ def test_collapsible_section_set_collapsed(qtbot):
 # InlineDetailsPane Tests - Data Browser Mode
 
 
-def test_inline_details_pane_creation_data_browser(qtbot):
+def test_inline_details_pane_creation_data_browser(inline_pane_db):
     """Test creating inline details pane in data browser mode."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
+    pane = inline_pane_db
 
     assert pane.view_mode == "data_browser"
     # In data browser mode, starts visible (not explicitly hidden like search mode)
@@ -109,10 +196,9 @@ def test_inline_details_pane_creation_data_browser(qtbot):
     assert hasattr(pane, "vector_section")
 
 
-def test_inline_details_pane_creation_search(qtbot):
+def test_inline_details_pane_creation_search(inline_pane_search):
     """Test creating inline details pane in search mode."""
-    pane = InlineDetailsPane(view_mode="search")
-    qtbot.addWidget(pane)
+    pane = inline_pane_search
 
     assert pane.view_mode == "search"
     assert pane.isVisible() is False  # Starts hidden in search mode
@@ -120,226 +206,156 @@ def test_inline_details_pane_creation_search(qtbot):
     assert hasattr(pane, "similarity_label")
 
 
-def test_update_item_with_data(qtbot, sample_item_data):
+def test_update_item_with_data(inline_pane_db, sample_item_data):
     """Test updating pane with item data."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane.update_item(sample_item_data)
+    inline_pane_db.update_item(sample_item_data)
 
     # Check header info
-    assert "test-id-123" in pane.id_label.text()
-    assert "5D" in pane.dimension_label.text()  # 5 dimensions
-    assert "Cluster: 2" in pane.cluster_label.text()
+    assert "test-id-123" in inline_pane_db.id_label.text()
+    assert "5D" in inline_pane_db.dimension_label.text()  # 5 dimensions
+    assert "Cluster: 2" in inline_pane_db.cluster_label.text()
 
     # Check document preview
-    assert "This is a test document" in pane.document_preview.toPlainText()
+    assert "This is a test document" in inline_pane_db.document_preview.toPlainText()
 
     # Check metadata (should exclude displayed fields)
-    metadata_text = pane.metadata_text.toPlainText()
-    metadata_dict = json.loads(metadata_text)
+    metadata_text = inline_pane_db.metadata_text.toPlainText()
+    metadata_dict = _decode(metadata_text)
     assert "title" in metadata_dict
     assert "category" in metadata_dict
     assert "cluster" not in metadata_dict  # Shown in header
     assert "created_at" not in metadata_dict  # Shown in header
 
 
-def test_update_item_with_search_data(qtbot, search_item_data):
+def test_update_item_with_search_data(inline_pane_search, search_item_data):
     """Test updating pane with search result data."""
-    pane = InlineDetailsPane(view_mode="search")
-    qtbot.addWidget(pane)
-    pane.update_item(search_item_data)
+    inline_pane_search.update_item(search_item_data)
 
     # Should show pane when data provided
-    assert pane.isVisible() is True
+    assert inline_pane_search.isVisible() is True
 
     # Check search-specific fields
-    assert "Rank: 1" in pane.rank_label.text()
-    assert "Similarity:" in pane.similarity_label.text()
-    assert "0.766" in pane.similarity_label.text()  # 1 - 0.234 = 0.766
-
-
-def test_update_item_clear_display(qtbot, sample_item_data):
-    """Test clearing display with None."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
+    assert "Rank: 1" in inline_pane_search.rank_label.text()
+    assert "Similarity:" in inline_pane_search.similarity_label.text()
+    assert "0.766" in inline_pane_search.similarity_label.text()  # 1 - 0.234 = 0.766
 
-    # First populate with data
-    pane.update_item(sample_item_data)
-    assert "test-id-123" in pane.id_label.text()
 
-    # Clear display
-    pane.update_item(None)
-    assert pane.id_label.text() == "No selection"
-    assert pane.document_preview.toPlainText() == ""
-    assert pane.metadata_text.toPlainText() == ""
-    assert pane.vector_text.toPlainText() == ""
-
-
-def test_update_item_hides_search_pane(qtbot, search_item_data):
+def test_update_item_hides_search_pane(inline_pane_search, search_item_data):
     """Test that search mode pane hides when cleared."""
-    pane = InlineDetailsPane(view_mode="search")
-    qtbot.addWidget(pane)
-
     # Show with data
-    pane.update_item(search_item_data)
-    assert pane.isVisible() is True
+    inline_pane_search.update_item(search_item_data)
+    assert inline_pane_search.isVisible() is True
 
     # Hide when cleared
-    pane.update_item(None)
-    assert pane.isVisible() is False
-
-
-def test_update_item_long_document_truncation(qtbot):
-    """Test that long documents are truncated in preview."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
-    # Create item with very long document
-    long_doc = "A" * 600  # Longer than 500 char limit
-    item = {
-        "id": "test-id",
-        "document": long_doc,
-        "metadata": {},
-        "embedding": [0.1, 0.2],
-    }
-
-    pane.update_item(item)
-    preview_text = pane.document_preview.toPlainText()
-
-    assert len(preview_text) <= 503  # 500 + "..."
-    assert preview_text.endswith("...")
-
-
-def test_update_item_no_document(qtbot):
-    """Test handling item with no document."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
-    item = {
-        "id": "test-id",
-        "document": None,
-        "metadata": {},
-        "embedding": [0.1, 0.2],
-    }
-
-    pane.update_item(item)
-    assert pane.document_preview.toPlainText() == "(No document text)"
-
-
-def test_update_item_no_embedding(qtbot):
-    """Test handling item with no embedding."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
-    item = {
-        "id": "test-id",
-        "document": "Test doc",
-        "metadata": {},
-        "embedding": None,
-    }
-
-    pane.update_item(item)
-    assert pane.vector_text.toPlainText() == "(No embedding)"
-    assert pane.dimension_label.text() == ""
-
-
-def test_update_item_no_metadata(qtbot):
-    """Test handling item with no metadata."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
-    item = {
-        "id": "test-id",
-        "document": "Test doc",
-        "metadata": None,
-        "embedding": [0.1, 0.2],
-    }
+    inline_pane_search.update_item(None)
+    assert inline_pane_search.isVisible() is False
+
+
+@pytest.mark.parametrize(
+    ("item", "expected_preview", "expected_metadata", "expected_vector", "expected_dimension"),
+    [
+        pytest.param(None, "", "", "", "", id="clear_display"),
+        pytest.param(
+            {"id": "test-id", "document": _LONG_DOC, "metadata": {}, "embedding": [0.1, 0.2]},
+            "A" * 500 + "...",
+            "(No metadata)",
+            "[0.1, 0.2]",
+            "2D",
+            id="long_document_truncation",
+        ),
+        pytest.param(
+            {"id": "test-id", "document": None, "metadata": {}, "embedding": [0.1, 0.2]},
+            "(No document text)",
+            "(No metadata)",
+            "[0.1, 0.2]",
+            "2D",
+            id="no_document",
+        ),
+        pytest.param(
+            {"id": "test-id", "document": "Test doc", "metadata": {}, "embedding": None},
+            "Test doc",
+            "(No metadata)",
+            "(No embedding)",
+            "",
+            id="no_embedding",
+        ),
+        pytest.param(
+            {"id": "test-id", "document": "Test doc", "metadata": None, "embedding": [0.1, 0.2]},
+            "Test doc",
+            "(No metadata)",
+            "[0.1, 0.2]",
+            "2D",
+            id="no_metadata",
+        ),
+    ],
+)
+def test_update_item_variants(
+    inline_pane_db, item, expected_preview, expected_metadata, expected_vector, expected_dimension
+):
+    """update_item replaces previously displayed data for partial items and for None."""
+    # Start from a fully populated pane so every field has something to replace
+    inline_pane_db.update_item(_SAMPLE_ITEM)
 
-    pane.update_item(item)
-    assert pane.metadata_text.toPlainText() == "(No metadata)"
+    inline_pane_db.update_item(item)
 
+    expected_id = "No selection" if item is None else f"ID: {item['id']}"
+    assert inline_pane_db.id_label.text() == expected_id
+    assert inline_pane_db.document_preview.toPlainText() == expected_preview
+    assert inline_pane_db.metadata_text.toPlainText() == expected_metadata
+    assert inline_pane_db.vector_text.toPlainText() == expected_vector
+    assert inline_pane_db.dimension_label.text() == expected_dimension
 
-def test_copy_vector_to_clipboard(qtbot, sample_item_data):
-    """Test copying vector to clipboard."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane.update_item(sample_item_data)
 
-    # Trigger copy
-    pane._copy_vector()
+def test_copy_vector_variants(inline_pane_db, sample_item_data, fake_clipboard):
+    """Test copying the vector as plain values and as JSON to the clipboard."""
+    inline_pane_db.update_item(sample_item_data)
 
-    # Check clipboard
-    clipboard = QApplication.clipboard()
-    clipboard_text = clipboard.text()
+    inline_pane_db._copy_vector()
+    clipboard_text = fake_clipboard.text()
     assert "0.1" in clipboard_text
     assert "0.5" in clipboard_text
 
-
-def test_copy_vector_json_to_clipboard(qtbot, sample_item_data):
-    """Test copying vector as JSON to clipboard."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane.update_item(sample_item_data)
-
-    # Trigger copy as JSON
-    pane._copy_vector_json()
-
-    # Check clipboard
-    clipboard = QApplication.clipboard()
-    clipboard_text = clipboard.text()
-    data = json.loads(clipboard_text)
-
-    assert data["id"] == "test-id-123"
-    assert data["dimension"] == 5
-    assert data["vector"] == [0.1, 0.2, 0.3, 0.4, 0.5]
+    inline_pane_db._copy_vector_json()
+    expected = json.dumps({"id": "test-id-123", "vector": [0.1, 0.2, 0.3, 0.4, 0.5], "dimension": 5}, indent=2)
+    assert fake_clipboard.text() == expected
 
 
-def test_open_full_details_signal(qtbot, sample_item_data):
+def test_open_full_details_signal(inline_pane_db, sample_item_data):
     """Test that open_full_details signal is emitted."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane.update_item(sample_item_data)
+    inline_pane_db.update_item(sample_item_data)
 
     # Connect signal to mock
     mock_handler = Mock()
-    pane.open_full_details.connect(mock_handler)
+    inline_pane_db.open_full_details.connect(mock_handler)
 
     # Click the button
-    pane.full_details_btn.click()
+    inline_pane_db.full_details_btn.click()
 
     # Verify signal was emitted
     mock_handler.assert_called_once()
 
 
-def test_state_persistence_save(qtbot, sample_item_data):
+def test_state_persistence_save(inline_pane_db, sample_item_data, fake_settings_service, monkeypatch):
     """Test saving pane state."""
-    from vector_inspector.services.settings_service import SettingsService
-
-    settings = SettingsService()
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane.update_item(sample_item_data)
+    monkeypatch.setattr(inline_pane_db, "settings_service", fake_settings_service)
+    inline_pane_db.update_item(sample_item_data)
 
     # Expand metadata section
-    pane.metadata_section.set_collapsed(False)
+    inline_pane_db.metadata_section.set_collapsed(False)
 
     # Save state
-    pane.save_state()
+    inline_pane_db.save_state()
 
     # Check settings were saved
-    assert settings.get("inline_details_data_browser_metadata_collapsed") is False
-    assert settings.get("inline_details_data_browser_vector_collapsed") is True
+    assert fake_settings_service.get("inline_details_data_browser_metadata_collapsed") is False
+    assert fake_settings_service.get("inline_details_data_browser_vector_collapsed") is True
 
 
-def test_state_persistence_load(qtbot):
+def test_state_persistence_load(qtbot, fake_settings_service):
     """Test loading pane state."""
-    from vector_inspector.services.settings_service import SettingsService
-
-    settings = SettingsService()
-
     # Set saved state
-    settings.set("inline_details_search_metadata_collapsed", False)
-    settings.set("inline_details_search_vector_collapsed", False)
+    fake_settings_service.set("inline_details_search_metadata_collapsed", False)
+    fake_settings_service.set("inline_details_search_vector_collapsed", False)
 
     # Create pane (should load state)
     pane = InlineDetailsPane(view_mode="search")
@@ -350,11 +366,8 @@ def test_state_persistence_load(qtbot):
     assert pane.vector_section.is_collapsed() is False
 
 
-def test_timestamp_formatting(qtbot):
+def test_timestamp_formatting(inline_pane_db):
     """Test timestamp formatting in header."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
     item = {
         "id": "test-id",
         "document": "Test",
@@ -364,18 +377,15 @@ def test_timestamp_formatting(qtbot):
         "embedding": [0.1],
     }
 
-    pane.update_item(item)
+    inline_pane_db.update_item(item)
 
     # Should show formatted timestamp
-    timestamp_text = pane.timestamp_label.text()
+    timestamp_text = inline_pane_db.timestamp_label.text()
     assert "2024-01-15" in timestamp_text or "10:30" in timestamp_text
 
 
-def test_vector_dimension_display(qtbot):
+def test_vector_dimension_display(inline_pane_db):
     """Test vector dimension display in section header."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
     item = {
         "id": "test-id",
         "document": "Test",
@@ -383,10 +393,10 @@ def test_vector_dimension_display(qtbot):
         "embedding": [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7],
     }
 
-    pane.update_item(item)
+    inline_pane_db.update_item(item)
 
     # Vector section title should show dimension
-    section_title = pane.vector_section.toggle_button.text()
+    section_title = inline_pane_db.vector_section.toggle_button.text()
     assert "7-dim" in section_title
 
 
@@ -406,79 +416,62 @@ class BadEmbedding:
         raise ValueError("bad embedding iter")
 
 
-def test_update_item_invalid_timestamp(qtbot):
+def test_update_item_invalid_timestamp(inline_pane_db):
     """invalid timestamp triggers fallback text."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
     item = {
         "id": "test-id",
         "document": "Test doc",
         "metadata": {"created_at": "bad-timestamp"},
         "embedding": [0.1],
     }
-    pane.update_item(item)
-    assert pane.timestamp_label.text() == "bad-timestamp"
+    inline_pane_db.update_item(item)
+    assert inline_pane_db.timestamp_label.text() == "bad-timestamp"
 
 
-def test_update_item_bad_embedding_len(qtbot):
+def test_update_item_bad_embedding_len(inline_pane_db):
     """exception when calculating embedding dimension raises is handled gracefully."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
     item = {
         "id": "test-id",
         "document": "Test doc",
         "metadata": {},
         "embedding": BadEmbedding(),
     }
-    pane.update_item(item)
-    assert pane.dimension_label.text() == ""
+    inline_pane_db.update_item(item)
+    assert inline_pane_db.dimension_label.text() == ""
 
 
-def test_update_item_bad_embedding_display(qtbot):
+def test_update_item_bad_embedding_display(inline_pane_db):
     """exception when displaying vector."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
     item = {
         "id": "test-id",
         "document": "Test doc",
         "metadata": {},
         "embedding": BadEmbedding(),
     }
-    pane.update_item(item)
-    assert pane.vector_text.toPlainText() == "(Unable to display vector)"
+    inline_pane_db.update_item(item)
+    assert inline_pane_db.vector_text.toPlainText() == "(Unable to display vector)"
 
 
-def test_copy_vector_no_current_item(qtbot):
+def test_copy_vector_no_current_item(inline_pane_db):
     """early return in _copy_vector when no current item."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane._copy_vector()  # Should not raise
+    inline_pane_db._copy_vector()  # Should not raise
 
 
-def test_copy_vector_exception(qtbot):
+def test_copy_vector_exception(inline_pane_db):
     """exception raised by embedding in _copy_vector is silenced without crashing."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane._current_item = {"id": "test", "embedding": BadEmbedding()}
-    pane._copy_vector()  # Should not raise
+    inline_pane_db._current_item = {"id": "test", "embedding": BadEmbedding()}
+    inline_pane_db._copy_vector()  # Should not raise
 
 
-def test_copy_vector_json_no_current_item(qtbot):
+def test_copy_vector_json_no_current_item(inline_pane_db):
     """early return in _copy_vector_json when no current item."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane._copy_vector_json()  # Should not raise
+    inline_pane_db._copy_vector_json()  # Should not raise
 
 
-def test_copy_vector_json_exception(qtbot):
+def test_copy_vector_json_exception(inline_pane_db):
     """exception raised by embedding in _copy_vector_json is silenced without crashing."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane._current_item = {"id": "test", "embedding": BadEmbedding()}
-    pane._copy_vector_json()  # Should not raise
+    inline_pane_db._current_item = {"id": "test", "embedding": BadEmbedding()}
+    inline_pane_db._copy_vector_json()  # Should not raise
 
 
 # ---------------------------------------------------------------------------
@@ -486,15 +479,13 @@ def test_copy_vector_json_exception(qtbot):
 # ---------------------------------------------------------------------------
 
 
-def test_file_preview_section_hidden_when_no_paths(qtbot, sample_item_data):
+def test_file_preview_section_hidden_when_no_paths(inline_pane_db, sample_item_data):
     """Section is hidden when metadata has no previewable file paths."""
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane.update_item(sample_item_data)
-    assert pane.file_preview_section.isVisible() is False
+    inline_pane_db.update_item(sample_item_data)
+    assert inline_pane_db.file_preview_section.isVisible() is False
 
 
-def test_file_preview_section_visible_for_image(qtbot, tmp_path):
+def test_file_preview_section_visible_for_image(inline_pane_db, tmp_path):
     """Section is shown when metadata contains an existing image path."""
     img = tmp_path / "photo.png"
     # Create a minimal valid PNG (1×1 white pixel)
@@ -518,9 +509,7 @@ def test_file_preview_section_visible_for_image(qtbot, tmp_path):
 
     img.write_bytes(_minimal_png())
 
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane.update_item(
+    inline_pane_db.update_item(
         {
             "id": "img-1",
             "document": "photo",
@@ -529,17 +518,15 @@ def test_file_preview_section_visible_for_image(qtbot, tmp_path):
         }
     )
 
-    assert pane.file_preview_section.isVisible() is True
+    assert inline_pane_db.file_preview_section.isVisible() is True
 
 
-def test_file_preview_section_visible_for_text(qtbot, tmp_path):
+def test_file_preview_section_visible_for_text(inline_pane_db, tmp_path):
     """Section is shown when metadata contains an existing text file path."""
     txt = tmp_path / "readme.md"
     txt.write_text("# Hello\nWorld\n")
 
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane.update_item(
+    inline_pane_db.update_item(
         {
             "id": "doc-1",
             "document": "readme",
@@ -548,17 +535,15 @@ def test_file_preview_section_visible_for_text(qtbot, tmp_path):
         }
     )
 
-    assert pane.file_preview_section.isVisible() is True
+    assert inline_pane_db.file_preview_section.isVisible() is True
 
 
-def test_file_preview_clears_on_none(qtbot, tmp_path):
+def test_file_preview_clears_on_none(inline_pane_db, tmp_path):
     """File preview section hides when update_item receives None."""
     txt = tmp_path / "readme.md"
     txt.write_text("# Hello\n")
 
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-    pane.update_item(
+    inline_pane_db.update_item(
         {
             "id": "doc-1",
             "document": "readme",
@@ -566,10 +551,10 @@ def test_file_preview_clears_on_none(qtbot, tmp_path):
             "embedding": [0.1],
         }
     )
-    assert pane.file_preview_section.isVisible() is True
+    assert inline_pane_db.file_preview_section.isVisible() is True
 
-    pane.update_item(None)
-    assert pane.file_preview_section.isVisible() is False
+    inline_pane_db.update_item(None)
+    assert inline_pane_db.file_preview_section.isVisible() is False
 
 
 # ---------------------------------------------------------------------------
@@ -577,7 +562,7 @@ def test_file_preview_clears_on_none(qtbot, tmp_path):
 # ---------------------------------------------------------------------------
 
 
-def test_update_item_uuid_in_metadata_does_not_crash(qtbot):
+def test_update_item_uuid_in_metadata_does_not_crash(inline_pane_db):
     """Regression: UUID values in metadata must not raise TypeError (Weaviate).
 
     Weaviate returns UUID objects in metadata fields such as cross-references
@@ -586,9 +571,6 @@ def test_update_item_uuid_in_metadata_does_not_crash(qtbot):
     """
     import uuid
 
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
     item = {
         "id": uuid.UUID("59b15ca8-89d4-47b6-abed-86fae7b46a85"),
         "document": "Weaviate node",
@@ -601,15 +583,15 @@ def test_update_item_uuid_in_metadata_does_not_crash(qtbot):
     }
 
     # Must not raise
-    pane.update_item(item)
+    inline_pane_db.update_item(item)
 
-    metadata_text = pane.metadata_text.toPlainText()
-    parsed = json.loads(metadata_text)
+    metadata_text = inline_pane_db.metadata_text.toPlainText()
+    parsed = _decode(metadata_text)
     assert parsed["node_id"] == "59b15ca8-89d4-47b6-abed-86fae7b46a85"
     assert parsed["ref_id"] == "00000000-0000-0000-0000-000000000001"
 
 
-def test_update_item_mixed_non_serializable_metadata_does_not_crash(qtbot):
+def test_update_item_mixed_non_serializable_metadata_does_not_crash(inline_pane_db):
     """Regression: mixed non-JSON types (UUID, Path, frozenset) must not crash."""
     import enum
     import pathlib
@@ -618,9 +600,6 @@ def test_update_item_mixed_non_serializable_metadata_does_not_crash(qtbot):
     class Status(enum.Enum):
         ACTIVE = "active"
 
-    pane = InlineDetailsPane(view_mode="data_browser")
-    qtbot.addWidget(pane)
-
     item = {
         "id": "test-mixed",
         "document": "doc",
@@ -633,9 +612,9 @@ def test_update_item_mixed_non_serializable_metadata_does_not_crash(qtbot):
         "embedding": [0.1],
     }
 
-    pane.update_item(item)
+    inline_pane_db.update_item(item)
 
-    metadata_text = pane.metadata_text.toPlainText()
-    parsed = json.loads(metadata_text)
+    metadata_text = inline_pane_db.metadata_text.toPlainText()
+    parsed = _decode(metadata_text)
     assert parsed["ref"] == "12345678-1234-5678-1234-567812345678"
     assert parsed["status"] == "active"
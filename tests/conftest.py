@@ -1,5 +1,9 @@
 import logging
 import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
 
 # Ensure headless Qt platform as early as possible to avoid GUI initialization
 # before tests or imported modules can touch Qt.
@@ -29,9 +33,21 @@ def pytest_configure(config):
         from vector_inspector.services.settings_service import SettingsService
         from vector_inspector.services.telemetry_service import TelemetryService
 
+        # Point Path.home at a private temp dir for the whole session, before
+        # the settings singleton is first built, so test runs (and parallel
+        # workers, which each run pytest_configure) never read or write the
+        # user's ~/.vector-inspector/settings.json. Instances re-created after
+        # a test resets SettingsService._instance land there too. A
+        # VI_CONFIG_PATH from the user's shell would bypass home, so drop it.
+        config._vi_settings_dir = Path(tempfile.mkdtemp(prefix="vector-inspector-settings-"))
+        config._vi_home_patch = pytest.MonkeyPatch()
+        config._vi_home_patch.setattr(Path, "home", classmethod(lambda cls: config._vi_settings_dir))
+        config._vi_home_patch.delenv("VI_CONFIG_PATH", raising=False)
+        settings_service = SettingsService()
+
         # Ensure the persistent settings flag is off
         try:
-            SettingsService().set("telemetry.enabled", False)
+            settings_service.set("telemetry.enabled", False)
         except Exception:
             # Best-effort: tests should not fail if settings backend isn't available
             logging.debug("Failed to set telemetry.enabled in SettingsService")
@@ -54,11 +70,19 @@ def pytest_configure(config):
         logging.debug(f"Could not patch telemetry for tests: {_err}")
 
 
-@pytest.fixture
-def fake_provider():
-    """Provide a fresh FakeProvider instance for tests."""
+def pytest_unconfigure(config):
+    """Restore Path.home and remove the temporary home created in pytest_configure."""
+    home_patch = getattr(config, "_vi_home_patch", None)
+    if home_patch is not None:
+        home_patch.undo()
+    settings_dir = getattr(config, "_vi_settings_dir", None)
+    if settings_dir is not None:
+        shutil.rmtree(settings_dir, ignore_errors=True)
+
+
+def _seeded_fake_provider():
+    """A FakeProvider holding the default three-item "test_collection"."""
     provider = FakeProvider()
-    # Populate with a default collection for convenience
     provider.create_collection(
         "test_collection",
         ["doc1", "doc2", "doc3"],  # docs (positional)
@@ -68,6 +92,13 @@ def fake_provider():
     return provider
 
 
+@pytest.fixture
+def fake_provider():
+    """Provide a fresh FakeProvider instance for tests."""
+    # Populate with a default collection for convenience
+    return _seeded_fake_provider()
+
+
 # Add a second fixture for an *empty* provider
 # Useful for tests that need to assert "no collections" or "create first collection".
 
@@ -81,17 +112,16 @@ def empty_fake_provider():
 # This reduces magic strings in tests and keeps things DRY.
 
 
+@pytest.fixture(scope="session")
+def _fake_provider_with_name_blob():
+    """Build the preloaded FakeProvider once and keep a pickled snapshot of it."""
+    return pickle.dumps(_seeded_fake_provider(), protocol=5)
+
+
 @pytest.fixture
-def fake_provider_with_name():
-    provider = FakeProvider()
-    name = "test_collection"
-    provider.create_collection(
-        name,
-        ["doc1", "doc2", "doc3"],  # docs (positional)
-        [{"name": "a"}, {"name": "b"}, {"name": "c"}],  # metadatas
-        [[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]],  # embeddings
-    )
-    return provider, name
+def fake_provider_with_name(_fake_provider_with_name_blob):
+    # Unpickling gives each test its own provider without rebuilding the collection
+    return pickle.loads(_fake_provider_with_name_blob), "test_collection"
 
 
 @pytest.fixture
@@ -167,9 +197,6 @@ def _reset_telemetry_singleton():
     It also purges the shared test-mode queue file so stale events from one
     test cannot affect the next test's singleton initialisation.
     """
-    import tempfile
-    from pathlib import Path
-
     from vector_inspector.services.telemetry_service import TelemetryService
 
     _test_queue = Path(tempfile.gettempdir()) / "vector-inspector-telemetry-test-queue.json"
@@ -249,7 +276,9 @@ def webengine_cleanup(qtbot):
             except Exception:
                 pass
 
-    # Encourage Python to collect Qt wrappers and give Qt a moment to tear down
+    # Encourage Python to collect Qt wrappers, then flush the deleteLater()
+    # calls above. processEvents() alone skips deferred deletes, so post them
+    # explicitly; this drains the queue without a fixed sleep.
     try:
         import gc
 
@@ -257,6 +286,9 @@ def webengine_cleanup(qtbot):
     except Exception:
         pass
     try:
-        qtbot.wait(50)
+        from PySide6.QtCore import QCoreApplication, QEvent
+
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        QCoreApplication.processEvents()
     except Exception:
         pass
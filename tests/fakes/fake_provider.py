@@ -92,7 +92,9 @@ class FakeProvider:
         metadatas = metadatas or [None] * len(docs)
         if ids is None:
             ids = [str(uuid.uuid4()) for _ in docs]
-        embeddings = embeddings or [None] * len(docs)
+        # Avoid a truthiness check: embeddings may be a NumPy array
+        if embeddings is None or len(embeddings) == 0:
+            embeddings = [None] * len(docs)
         self._collections[name] = {
             "ids": ids,
             "documents": docs,
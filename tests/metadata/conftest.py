@@ -0,0 +1,19 @@
+import pytest
+
+from vector_inspector.ui.views.metadata.context import MetadataContext
+
+
+@pytest.fixture
+def make_ctx():
+    """Factory for MetadataContext instances with fields preset by keyword.
+
+    Example:
+        ctx = make_ctx(current_data={"ids": ["a"]}, current_page=2)
+    """
+
+    def _make(connection=None, **fields):
+        # Construct rather than copy a template: list fields such as
+        # client_filters must not be shared between contexts.
+        return MetadataContext(connection=connection, **fields)
+
+    return _make
@@ -1,6 +1,3 @@
-from vector_inspector.ui.views.metadata.context import MetadataContext
-
-
 class DummyCache:
     def __init__(self) -> None:
         self.invalidated = None
@@ -9,26 +6,26 @@ class DummyCache:
         self.invalidated = (database, collection)
 
 
-def test_reset_pagination() -> None:
-    ctx = MetadataContext(connection=None)
-    ctx.current_page = 5
+def test_reset_pagination(make_ctx) -> None:
+    ctx = make_ctx(current_page=5)
     ctx.reset_pagination()
     assert ctx.current_page == 0
 
 
-def test_reset_data() -> None:
-    ctx = MetadataContext(connection=None)
-    ctx.current_data = {"ids": [1, 2]}
-    ctx.current_data_full = {"ids": [1, 2, 3]}
-    ctx._select_id_after_load = "x"
+def test_reset_data(make_ctx) -> None:
+    ctx = make_ctx(
+        current_data={"ids": [1, 2]},
+        current_data_full={"ids": [1, 2, 3]},
+        _select_id_after_load="x",
+    )
     ctx.reset_data()
     assert ctx.current_data is None
     assert ctx.current_data_full is None
     assert ctx._select_id_after_load is None
 
 
-def test_get_item_count_and_has_data() -> None:
-    ctx = MetadataContext(connection=None)
+def test_get_item_count_and_has_data(make_ctx) -> None:
+    ctx = make_ctx()
     # no data
     assert ctx.get_item_count() == 0
     assert not ctx.has_data()
@@ -44,10 +41,8 @@ def test_get_item_count_and_has_data() -> None:
     assert not ctx.has_data()
 
 
-def test_set_collection_resets_state() -> None:
-    ctx = MetadataContext(connection=None)
-    ctx.current_data = {"ids": [1]}
-    ctx.current_page = 3
+def test_set_collection_resets_state(make_ctx) -> None:
+    ctx = make_ctx(current_data={"ids": [1]}, current_page=3)
     ctx.set_collection("col1", "db1")
     assert ctx.current_collection == "col1"
     assert ctx.current_database == "db1"
@@ -55,11 +50,8 @@ def test_set_collection_resets_state() -> None:
     assert ctx.current_page == 0
 
 
-def test_invalidate_cache_calls_cache_manager() -> None:
+def test_invalidate_cache_calls_cache_manager(make_ctx) -> None:
     dummy = DummyCache()
-    ctx = MetadataContext(connection=None)
-    ctx.cache_manager = dummy
-    ctx.current_database = "dbx"
-    ctx.current_collection = "collx"
+    ctx = make_ctx(cache_manager=dummy, current_database="dbx", current_collection="collx")
     ctx.invalidate_cache()
     assert dummy.invalidated == ("dbx", "collx")
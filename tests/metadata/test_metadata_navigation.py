@@ -1,113 +1,156 @@
 """Tests for metadata view navigation and item selection."""
 
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import Mock
 
 import pytest
-from PySide6.QtWidgets import QApplication
 
+from vector_inspector.services import ThreadedTaskRunner
 from vector_inspector.state import AppState
+from vector_inspector.ui.views.metadata import find_updated_item_page
 from vector_inspector.ui.views.metadata.context import MetadataContext
+from vector_inspector.ui.views.metadata.metadata_table import populate_table
+from vector_inspector.ui.views.metadata_view import MetadataView
 
+# Hand-rolled stubs: plain classes are much cheaper than MagicMock's
+# auto-attribute machinery and avoid handing Mock objects to PySide6.
 
-@pytest.fixture
-def qapp():
-    """Ensure QApplication exists for Qt tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
 
+class FakeConnection:
+    """Connection stub serving a fixed, paginated list of ids from get_all_items."""
 
-@pytest.fixture
-def mock_connection():
-    """Create a mock connection."""
-    conn = MagicMock()
-    conn.get_collection_data.return_value = {
-        "ids": ["id1", "id2", "id3"],
-        "documents": ["doc1", "doc2", "doc3"],
-        "metadatas": [{}, {}, {}],
-        "embeddings": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
-    }
-    return conn
+    def __init__(self, all_ids=()):
+        self._all_ids = list(all_ids)
 
+    def get_collection_data(self):
+        return {
+            "ids": ["id1", "id2", "id3"],
+            "documents": ["doc1", "doc2", "doc3"],
+            "metadatas": [{}, {}, {}],
+            "embeddings": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
+        }
 
-@pytest.fixture
-def metadata_context(mock_connection):
-    """Create a MetadataContext with sample data."""
-    ctx = MetadataContext(connection=mock_connection)
-    ctx.current_collection = "test_collection"
-    ctx.current_database = "test_db"
-    ctx.current_data = {
-        "ids": ["id1", "id2", "id3"],
-        "documents": ["doc1", "doc2", "doc3"],
-        "metadatas": [{}, {}, {}],
-        "embeddings": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
-    }
-    ctx.page_size = 3
-    return ctx
+    def get_all_items(self, collection, limit=None, offset=None, where=None):
+        # Honour pagination like a real provider; limit=None means "everything from offset"
+        start = offset or 0
+        stop = start + limit if limit else None
+        ids = self._all_ids[start:stop]
+        return {
+            "ids": ids,
+            "documents": [f"doc{i}" for i in range(start, start + len(ids))],
+        }
 
 
-def test_select_item_by_id_on_current_page(qapp, task_runner, metadata_context):
-    """Test selecting an item that's on the current page."""
-    from vector_inspector.ui.views.metadata_view import MetadataView
+class FakeFilterBuilder:
+    def __init__(self, server_filter=None):
+        self._server_filter = server_filter
 
-    app_state = AppState()
-    app_state.provider = metadata_context.connection
-    view = MetadataView(app_state, task_runner)
-    view.ctx = metadata_context
+    def has_filters(self):
+        return self._server_filter is not None
 
-    # Populate table
-    from vector_inspector.ui.views.metadata.metadata_table import populate_table
+    def get_filters_split(self):
+        return self._server_filter, {}
 
-    populate_table(view.table, metadata_context)
 
-    # Select item by ID that's on current page
-    result = view.select_item_by_id("id2")
+class FakeFilterGroup:
+    def __init__(self, checked):
+        self._checked = checked
 
-    assert result is True
-    # Check that row 1 (index of "id2") is selected
-    selected_rows = view.table.selectionModel().selectedRows()
-    assert len(selected_rows) == 1
-    assert selected_rows[0].row() == 1
+    def isChecked(self):
+        return self._checked
 
 
-def test_select_item_by_id_not_found(qapp, task_runner, metadata_context):
-    """Test selecting an item that doesn't exist."""
-    from vector_inspector.ui.views.metadata_view import MetadataView
+@pytest.fixture
+def mock_connection():
+    """Create a stub connection."""
+    return FakeConnection()
 
-    app_state = AppState()
-    app_state.provider = metadata_context.connection
-    view = MetadataView(app_state, task_runner)
-    view.ctx = metadata_context
 
-    # Try to select non-existent item
-    result = view.select_item_by_id("nonexistent-id")
+def _page_data():
+    return {
+        "ids": ["id1", "id2", "id3"],
+        "documents": ["doc1", "doc2", "doc3"],
+        "metadatas": [{}, {}, {}],
+        "embeddings": [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]],
+    }
+
 
-    assert result is False
+@pytest.fixture
+def metadata_context(make_ctx, mock_connection):
+    """Create a MetadataContext with sample data."""
+    return make_ctx(
+        mock_connection,
+        current_collection="test_collection",
+        current_database="test_db",
+        current_data=_page_data(),
+        page_size=3,
+    )
+
+
+@pytest.fixture(scope="module")
+def _prepopulated_view(qapp):
+    """MetadataView showing a three-item page, populated once per module."""
+    connection = FakeConnection()
+    app_state = AppState()
+    app_state.provider = connection
+    view = MetadataView(app_state, ThreadedTaskRunner())
+    view.ctx = MetadataContext(
+        connection=connection,
+        current_collection="test_collection",
+        current_database="test_db",
+        current_data=_page_data(),
+        page_size=3,
+    )
+    populate_table(view.table, view.ctx)
+    yield view
+    view.deleteLater()
 
 
-def test_select_item_by_id_no_data(qapp, task_runner):
+@pytest.fixture
+def prepopulated_view(_prepopulated_view):
+    """The shared populated view with any selection left by the previous test cleared."""
+    _prepopulated_view.table.clearSelection()
+    return _prepopulated_view
+
+
+@pytest.mark.parametrize(
+    ("item_id", "expected_result", "expected_row"),
+    [
+        pytest.param("id2", True, 1, id="on_current_page"),
+        pytest.param("id3", True, 2, id="last_row"),
+        pytest.param("nonexistent-id", False, None, id="not_found"),
+    ],
+)
+def test_select_item_by_id(prepopulated_view, item_id, expected_result, expected_row):
+    """Items on the current page are selected by row; unknown ids select nothing."""
+    result = prepopulated_view.select_item_by_id(item_id)
+
+    assert result is expected_result
+    selected_rows = prepopulated_view.table.selectionModel().selectedRows()
+    if expected_row is None:
+        assert selected_rows == []
+    else:
+        assert [index.row() for index in selected_rows] == [expected_row]
+
+
+def test_select_item_by_id_no_data(qapp, task_runner, make_ctx):
     """Test selecting an item when no data is loaded."""
-    from vector_inspector.ui.views.metadata_view import MetadataView
-
     app_state = AppState()
     app_state.provider = None
     view = MetadataView(app_state, task_runner)
-    view.ctx = MetadataContext(connection=None)
-    view.ctx.current_data = None
+    view.ctx = make_ctx(current_data=None)
 
     result = view.select_item_by_id("any-id")
 
     assert result is False
 
 
-@patch("vector_inspector.ui.views.metadata.find_updated_item_page")
-def test_select_item_by_id_different_page(mock_find_page, qapp, task_runner, metadata_context):
+def test_select_item_by_id_different_page(monkeypatch, qapp, task_runner, metadata_context):
     """Test selecting an item that's on a different page."""
-    from vector_inspector.ui.views.metadata_view import MetadataView
-
-    # Mock find_updated_item_page to return page 2
-    mock_find_page.return_value = 2
+    # Pretend the item lives on page 2
+    monkeypatch.setattr(
+        "vector_inspector.ui.views.metadata.find_updated_item_page",
+        lambda ctx, item_id: 2,
+    )
 
     app_state = AppState()
     app_state.provider = metadata_context.connection
@@ -128,24 +171,11 @@ def test_select_item_by_id_different_page(mock_find_page, qapp, task_runner, met
     assert result is True
 
 
-def test_find_updated_item_page_helper():
+def test_find_updated_item_page_helper(make_ctx):
     """Test find_updated_item_page helper function."""
-    from vector_inspector.ui.views.metadata import find_updated_item_page
-
-    # Create mock context
-    ctx = MetadataContext(connection=MagicMock())
-    ctx.current_collection = "test_coll"
-    ctx.page_size = 10
-
-    # Mock connection.get_all_items to return data with our target ID
-    def mock_get_all(collection, limit=None, offset=None, where=None):
-        # Return all items when limit=None
-        return {
-            "ids": [f"id{i}" for i in range(30)],  # 30 items total
-            "documents": [f"doc{i}" for i in range(30)],
-        }
-
-    ctx.connection.get_all_items = mock_get_all
+    # Connection returns 30 items total, including our target ID
+    conn = FakeConnection(f"id{i}" for i in range(30))
+    ctx = make_ctx(conn, current_collection="test_coll", page_size=10)
 
     # Find item on page 2 (items 20-29)
     target_id = "id25"
@@ -154,9 +184,9 @@ def test_find_updated_item_page_helper():
     assert page == 2  # Page 2 (0-indexed): id25/10 = 2
 
 
-def test_context_select_id_after_load_flag():
+def test_context_select_id_after_load_flag(make_ctx):
     """Test that _select_id_after_load flag is used correctly."""
-    ctx = MetadataContext(connection=None)
+    ctx = make_ctx()
 
     # Initially None
     assert ctx._select_id_after_load is None
@@ -170,28 +200,26 @@ def test_context_select_id_after_load_flag():
     assert ctx._select_id_after_load is None
 
 
-def test_main_window_handles_view_in_data_browser_signal(qapp, task_runner):
+def test_main_window_handles_view_in_data_browser_signal(qapp, task_runner, make_ctx):
     """Test that MainWindow connects and handles view_in_data_browser signal."""
     # This test requires full MainWindow initialization which is complex
     # Test the core behavior: metadata_view.select_item_by_id is called
-    from vector_inspector.ui.views.metadata_view import MetadataView
-
     # Create a metadata view
-    mock_connection = MagicMock()
+    mock_connection = FakeConnection()
     app_state = AppState()
     app_state.provider = mock_connection
     view = MetadataView(app_state, task_runner)
-    view.ctx = MetadataContext(connection=mock_connection)
-    view.ctx.current_collection = "test_coll"
-    view.ctx.current_data = {
-        "ids": ["test-item-id", "other-id"],
-        "documents": ["doc1", "doc2"],
-        "metadatas": [{}, {}],
-    }
+    view.ctx = make_ctx(
+        mock_connection,
+        current_collection="test_coll",
+        current_data={
+            "ids": ["test-item-id", "other-id"],
+            "documents": ["doc1", "doc2"],
+            "metadatas": [{}, {}],
+        },
+    )
 
     # Populate table
-    from vector_inspector.ui.views.metadata.metadata_table import populate_table
-
     populate_table(view.table, view.ctx)
 
     # Test select_item_by_id directly
@@ -204,12 +232,9 @@ def test_main_window_handles_view_in_data_browser_signal(qapp, task_runner):
     assert selected_rows[0].row() == 0
 
 
-def test_pagination_preserves_selection_state():
+def test_pagination_preserves_selection_state(make_ctx):
     """Test that pagination state is preserved during item selection."""
-    ctx = MetadataContext(connection=MagicMock())
-    ctx.current_page = 0
-    ctx.page_size = 10
-    ctx.current_collection = "coll"
+    ctx = make_ctx(FakeConnection(), current_page=0, page_size=10, current_collection="coll")
 
     # Set target for selection
     ctx._select_id_after_load = "target-id"
@@ -222,62 +247,43 @@ def test_pagination_preserves_selection_state():
     assert ctx.current_page == 3
 
 
-def test_select_item_scrolls_into_view(qapp, task_runner, metadata_context):
+def test_select_item_scrolls_into_view(monkeypatch, prepopulated_view):
     """Test that selecting an item scrolls it into view."""
-    from vector_inspector.ui.views.metadata_view import MetadataView
-
-    app_state = AppState()
-    app_state.provider = metadata_context.connection
-    view = MetadataView(app_state, task_runner)
-    view.ctx = metadata_context
-
-    # Populate table
-    from vector_inspector.ui.views.metadata.metadata_table import populate_table
-
-    populate_table(view.table, metadata_context)
-
     # Mock scrollToItem to verify it's called
-    view.table.scrollToItem = Mock()
+    scroll_to_item = Mock()
+    monkeypatch.setattr(prepopulated_view.table, "scrollToItem", scroll_to_item)
 
     # Select item
-    result = view.select_item_by_id("id3")
+    result = prepopulated_view.select_item_by_id("id3")
 
     assert result is True
     # Verify scrollToItem was called
-    view.table.scrollToItem.assert_called_once()
+    scroll_to_item.assert_called_once()
 
 
-def test_cross_page_navigation_with_filters(qapp, task_runner):
+def test_cross_page_navigation_with_filters(qapp, task_runner, make_ctx):
     """Test that cross-page navigation works with active filters."""
-    from vector_inspector.ui.views.metadata_view import MetadataView
-
-    mock_conn = MagicMock()
-    # Mock get_all_items for find_updated_item_page
-    mock_conn.get_all_items.return_value = {
-        "ids": [f"id{i}" for i in range(30)],
-        "documents": [f"doc{i}" for i in range(30)],
-    }
+    # get_all_items serves find_updated_item_page
+    mock_conn = FakeConnection(f"id{i}" for i in range(30))
 
     app_state = AppState()
     app_state.provider = mock_conn
     view = MetadataView(app_state, task_runner)
-    view.ctx = MetadataContext(connection=mock_conn)
-    view.ctx.current_collection = "coll"
-    view.ctx.page_size = 10
-    view.ctx.current_page = 0
-    view.ctx.current_data = {
-        "ids": [f"id{i}" for i in range(10)],
-        "documents": [f"doc{i}" for i in range(10)],
-        "metadatas": [{} for _ in range(10)],
-    }
-
-    # Mock filter builder
-    view.filter_builder = MagicMock()
-    view.filter_builder.has_filters.return_value = True
-    view.filter_builder.get_filters_split.return_value = ({"key": "value"}, {})
-
-    view.filter_group = MagicMock()
-    view.filter_group.isChecked.return_value = True
+    view.ctx = make_ctx(
+        mock_conn,
+        current_collection="coll",
+        page_size=10,
+        current_page=0,
+        current_data={
+            "ids": [f"id{i}" for i in range(10)],
+            "documents": [f"doc{i}" for i in range(10)],
+            "metadatas": [{} for _ in range(10)],
+        },
+    )
+
+    # Stub filter builder with an active server-side filter
+    view.filter_builder = FakeFilterBuilder(server_filter={"key": "value"})
+    view.filter_group = FakeFilterGroup(checked=True)
 
     # Mock _load_data
     view._load_data = Mock()
@@ -56,9 +56,7 @@ def test_copy_single_vector(mock_qapp, mock_qmsg, mock_table, sample_context):
     json_output = mock_clipboard.setText.call_args[0][0]
 
     data = json.loads(json_output)
-    assert data["id"] == "id1"
-    assert data["vector"] == [0.1, 0.2, 0.3]
-    assert data["dimension"] == 3
+    assert data == [{"id": "id1", "vector": [0.1, 0.2, 0.3], "dimension": 3}]
 
     mock_qmsg.information.assert_called_once()
 
@@ -127,7 +125,7 @@ def test_copy_numpy_array_vector(mock_qapp, mock_qmsg, mock_table):
 
         json_output = mock_clipboard.setText.call_args[0][0]
         data = json.loads(json_output)
-        assert data["vector"] == [0.1, 0.2, 0.3]
+        assert data[0]["vector"] == [0.1, 0.2, 0.3]
     except ImportError:
         pytest.skip("numpy not available")
 
@@ -163,7 +161,7 @@ def test_copy_with_numpy_embeddings_array(mock_qapp, mock_qmsg, mock_table):
         mock_clipboard.setText.assert_called_once()
         json_output = mock_clipboard.setText.call_args[0][0]
         data = json.loads(json_output)
-        assert data["id"] == "id1"
+        assert [d["id"] for d in data] == ["id1"]
     except ImportError:
         pytest.skip("numpy not available")
 
@@ -3,60 +3,95 @@
 Uses pytest-qt's qtbot fixture for proper Qt widget testing.
 """
 
+import warnings
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 from PySide6.QtCore import QObject, Signal
+from PySide6.QtWidgets import QWidget
 
+from vector_inspector.services import ThreadedTaskRunner
 from vector_inspector.state import AppState
+from vector_inspector.ui.views.visualization.plot_panel import PlotEventBridge, PlotPanel
+from vector_inspector.ui.views.visualization_view import VisualizationView
+
+# Reduced coordinates as PlotPanel receives them for 2D and 3D plots
+_REDUCED_2D = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+_REDUCED_3D = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+
+
+class _FakeWebPage:
+    def setWebChannel(self, channel):
+        pass
+
+    def runJavaScript(self, code):
+        pass
+
+
+class _FakeWebSettings:
+    def setAttribute(self, attribute, on):
+        pass
+
+
+class _FakeWebView(QWidget):
+    """Plain QWidget standing in for QWebEngineView; selection tests never render."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._page = _FakeWebPage()
+        self._settings = _FakeWebSettings()
+
+    def page(self):
+        return self._page
+
+    def settings(self):
+        return self._settings
 
 
 @pytest.fixture
-def plot_panel(qtbot, webengine_cleanup):
-    """Create a PlotPanel instance using qtbot for proper Qt widget handling."""
-    from vector_inspector.ui.views.visualization.plot_panel import PlotPanel
+def lite_plot_panel(qtbot, monkeypatch):
+    """PlotPanel with its web view swapped for a plain widget.
 
+    The selection label, buttons and event bridge are built by the real
+    _setup_ui; only the QWebEngineView (by far the costliest part) is faked.
+    """
+    monkeypatch.setattr("vector_inspector.ui.views.visualization.plot_panel.QWebEngineView", _FakeWebView)
     panel = PlotPanel()
-    qtbot.addWidget(panel)  # Register with qtbot for proper cleanup
+    qtbot.addWidget(panel)
+    return panel
 
-    # Give QWebEngineView time to initialize
-    qtbot.waitUntil(lambda: panel.web_view is not None, timeout=3000)
 
-    yield panel
+@pytest.fixture(scope="module")
+def _shared_bridge(qapp):
+    """One PlotEventBridge for the module's bridge tests."""
+    return PlotEventBridge()
 
-    # Explicit cleanup to prevent "Release of profile" warning
-    # Close the web view and its page before test ends
-    if panel.web_view and panel.web_view.page():
-        panel.web_view.setPage(None)
-        panel.web_view.close()
-    panel.deleteLater()
-    qtbot.wait(50)  # Give Qt time to process deletion
 
+@pytest.fixture
+def bridge(_shared_bridge):
+    """The shared bridge, with any handlers a test connected dropped afterwards."""
+    yield _shared_bridge
+    # disconnect() warns rather than raises when nothing is connected
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        _shared_bridge.point_selected.disconnect()
 
-def test_plot_event_bridge_is_qobject():
-    """Test that PlotEventBridge inherits from QObject for QWebChannel."""
-    from vector_inspector.ui.views.visualization.plot_panel import PlotEventBridge
 
-    bridge = PlotEventBridge()
+def test_plot_event_bridge_is_qobject(bridge):
+    """Test that PlotEventBridge inherits from QObject for QWebChannel."""
     assert isinstance(bridge, QObject)
 
 
-def test_plot_event_bridge_has_point_selected_signal():
+def test_plot_event_bridge_has_point_selected_signal(bridge):
     """Test that PlotEventBridge has point_selected signal."""
-    from vector_inspector.ui.views.visualization.plot_panel import PlotEventBridge
-
-    bridge = PlotEventBridge()
     assert hasattr(bridge, "point_selected")
     # Signal emits (int, str) for point_index and point_id
     assert isinstance(bridge.point_selected, Signal)
 
 
-def test_plot_event_bridge_on_point_selected_slot():
+def test_plot_event_bridge_on_point_selected_slot(bridge):
     """Test that onPointSelected slot emits point_selected signal."""
-    from vector_inspector.ui.views.visualization.plot_panel import PlotEventBridge
-
-    bridge = PlotEventBridge()
-
     # Connect signal to mock
     mock_handler = Mock()
     bridge.point_selected.connect(mock_handler)
@@ -68,12 +103,8 @@ def test_plot_event_bridge_on_point_selected_slot():
     mock_handler.assert_called_once_with(5, "test-id-5")
 
 
-def test_plot_event_bridge_on_point_deselect():
+def test_plot_event_bridge_on_point_deselect(bridge):
     """Test that onPointSelected slot handles deselection (negative index)."""
-    from vector_inspector.ui.views.visualization.plot_panel import PlotEventBridge
-
-    bridge = PlotEventBridge()
-
     mock_handler = Mock()
     bridge.point_selected.connect(mock_handler)
 
@@ -83,113 +114,114 @@ def test_plot_event_bridge_on_point_deselect():
     mock_handler.assert_called_once_with(-1, "")
 
 
-def test_plot_panel_has_selection_ui_elements(qtbot, plot_panel):
+def test_plot_panel_has_selection_ui_elements(qtbot, lite_plot_panel):
     """Test that PlotPanel has selection label and view button."""
-    assert plot_panel.selection_label is not None
-    assert plot_panel.view_data_button is not None
-    assert plot_panel.selection_container is not None
+    assert lite_plot_panel.selection_label is not None
+    assert lite_plot_panel.view_data_button is not None
+    assert lite_plot_panel.selection_container is not None
 
 
-def test_plot_panel_view_in_data_browser_signal(qtbot, plot_panel):
+def test_plot_panel_view_in_data_browser_signal(qtbot, lite_plot_panel):
     """Test that PlotPanel has view_in_data_browser signal."""
-    assert hasattr(plot_panel, "view_in_data_browser")
+    assert hasattr(lite_plot_panel, "view_in_data_browser")
 
 
-def test_plot_panel_on_point_selected_updates_ui(qtbot, plot_panel):
+def test_plot_panel_on_point_selected_updates_ui(qtbot, lite_plot_panel):
     """Test that _on_point_selected updates selection label and button state."""
     # Simulate point selection
-    plot_panel._on_point_selected(2, "id3")
+    lite_plot_panel._on_point_selected(2, "id3")
 
     # Check UI was updated
-    assert "id3" in plot_panel.selection_label.text()
-    assert "#3" in plot_panel.selection_label.text()  # Point number (1-indexed)
-    assert plot_panel.view_data_button.isEnabled() is True
-    assert plot_panel._selected_index == 2
-    assert plot_panel._selected_id == "id3"
+    assert "id3" in lite_plot_panel.selection_label.text()
+    assert "#3" in lite_plot_panel.selection_label.text()  # Point number (1-indexed)
+    assert lite_plot_panel.view_data_button.isEnabled() is True
+    assert lite_plot_panel._selected_index == 2
+    assert lite_plot_panel._selected_id == "id3"
 
 
-def test_plot_panel_on_point_deselected_clears_ui(qtbot, plot_panel):
+def test_plot_panel_on_point_deselected_clears_ui(qtbot, lite_plot_panel):
     """Test that _on_point_selected with negative index clears selection."""
     # Select a point first
-    plot_panel._on_point_selected(1, "id2")
-    assert plot_panel._selected_id is not None
+    lite_plot_panel._on_point_selected(1, "id2")
+    assert lite_plot_panel._selected_id is not None
 
     # Deselect
-    plot_panel._on_point_selected(-1, "")
+    lite_plot_panel._on_point_selected(-1, "")
 
     # Check UI was cleared
-    assert "No point selected" in plot_panel.selection_label.text()
-    assert plot_panel.view_data_button.isEnabled() is False
-    assert plot_panel._selected_id is None
+    assert "No point selected" in lite_plot_panel.selection_label.text()
+    assert lite_plot_panel.view_data_button.isEnabled() is False
+    assert lite_plot_panel._selected_id is None
 
 
-def test_plot_panel_on_view_data_clicked_emits_signal(qtbot, plot_panel):
+def test_plot_panel_on_view_data_clicked_emits_signal(qtbot, lite_plot_panel):
     """Test that _on_view_data_clicked emits view_in_data_browser signal."""
-    plot_panel._selected_index = 1
-    plot_panel._selected_id = "id2"
+    lite_plot_panel._selected_index = 1
+    lite_plot_panel._selected_id = "id2"
 
     # Use qtbot's signal spy to verify signal emission
-    with qtbot.waitSignal(plot_panel.view_in_data_browser, timeout=1000) as blocker:
-        plot_panel._on_view_data_clicked()
+    with qtbot.waitSignal(lite_plot_panel.view_in_data_browser, timeout=1000) as blocker:
+        lite_plot_panel._on_view_data_clicked()
 
     # Verify signal was emitted with correct arguments
     assert blocker.args == [1, "id2"]
 
 
-def test_plot_panel_view_data_button_disabled_when_no_selection(qtbot, plot_panel):
+def test_plot_panel_view_data_button_disabled_when_no_selection(qtbot, lite_plot_panel):
     """Test that view button is disabled when no point is selected."""
     # Initially no selection
-    assert plot_panel.view_data_button.isEnabled() is False
-    assert plot_panel._selected_id is None
+    assert lite_plot_panel.view_data_button.isEnabled() is False
+    assert lite_plot_panel._selected_id is None
 
 
-def test_plot_event_bridge_signal_connected_to_panel(qtbot, plot_panel):
+def test_plot_event_bridge_signal_connected_to_panel(qtbot, lite_plot_panel):
     """Test that PlotEventBridge signal is properly connected to panel."""
     # The bridge's signal should trigger panel's _on_point_selected
 
     # Verify initial state
-    assert plot_panel._selected_id is None
+    assert lite_plot_panel._selected_id is None
 
-    # Emit signal from bridge
-    plot_panel._event_bridge.point_selected.emit(3, "test-id-999")
-
-    # Wait for Qt event loop to process
-    qtbot.wait(100)
+    # Emit signal from bridge; bridge and panel share a thread, so the
+    # connection is direct and the slot has run by the time emit() returns
+    lite_plot_panel._event_bridge.point_selected.emit(3, "test-id-999")
 
     # Verify panel received the signal
-    assert plot_panel._selected_index == 3
-    assert plot_panel._selected_id == "test-id-999"
-    assert "test-id-999" in plot_panel.selection_label.text()
+    assert lite_plot_panel._selected_index == 3
+    assert lite_plot_panel._selected_id == "test-id-999"
+    assert "test-id-999" in lite_plot_panel.selection_label.text()
 
 
 def test_selection_container_visibility_2d_plot():
     """Test that selection UI visibility logic checks dimensionality."""
-    import numpy as np
-
     # Test the logic without creating PlotPanel
-    reduced_data_2d = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
-    is_2d = reduced_data_2d.shape[1] == 2
+    is_2d = _REDUCED_2D.shape[1] == 2
     assert is_2d is True
 
 
 def test_selection_container_hidden_3d_plot():
     """Test that selection UI should be hidden for 3D plots."""
-    import numpy as np
-
     # Test the logic
-    reduced_data_3d = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
-    is_2d = reduced_data_3d.shape[1] == 2
+    is_2d = _REDUCED_3D.shape[1] == 2
     assert is_2d is False
 
 
-def test_visualization_view_forwards_signal(qtbot, task_runner, webengine_cleanup):
-    """Test that VisualizationView forwards view_in_data_browser signal."""
-    from vector_inspector.ui.views.visualization_view import VisualizationView
-
+@pytest.fixture(scope="module")
+def visualization_view(qapp):
+    """One VisualizationView (and its web-engine panels) shared by the forwarding tests."""
     app_state = AppState()
     app_state.provider = None
-    view = VisualizationView(app_state, task_runner)
-    qtbot.addWidget(view)
+    view = VisualizationView(app_state, ThreadedTaskRunner())
+
+    yield view
+
+    # Disposes the plot and histogram web views before the widget is deleted
+    view.cleanup_temp_html()
+    view.deleteLater()
+
+
+def test_visualization_view_forwards_signal(qtbot, visualization_view):
+    """Test that VisualizationView forwards view_in_data_browser signal."""
+    view = visualization_view
 
     # Check that signal exists on view
     assert hasattr(view, "view_in_data_browser_requested")
@@ -201,5 +233,3 @@ def test_visualization_view_forwards_signal(qtbot, task_runner, webengine_cleanu
 
     # Verify forwarding (only ID should be forwarded)
     assert blocker.args == ["test-id-123"]
-
-    # Cleanup is handled by pytest-qt and the `webengine_cleanup` fixture
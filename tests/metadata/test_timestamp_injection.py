@@ -1,50 +1,77 @@
 """Tests for automatic timestamp injection in ItemDialog."""
 
-from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
-
 import pytest
-from PySide6.QtWidgets import QApplication
 
 from vector_inspector.ui.components.item_dialog import ItemDialog
+from vector_inspector.ui.views.metadata.context import MetadataContext
+
+# Stand-in for datetime.now(UTC).isoformat() in the mirrored injection logic
+_FROZEN_ISO = "2024-01-01T00:00:00+00:00"
+_EXISTING_TS = "2023-05-15T10:30:00Z"
+
+_EDIT_ITEM = {
+    "id": "test-1",
+    "document": "Test document",
+    "metadata": {"foo": "bar"},
+}
+
+
+# One dialog per mode, shared by the module: the tests only read labels and
+# fill the inputs, and teardown puts the inputs back.
+
+
+@pytest.fixture(scope="module")
+def _item_dialog_add(qapp):
+    dialog = ItemDialog(parent=None, item_data=None)
+    yield dialog
+    dialog.deleteLater()
+
+
+@pytest.fixture(scope="module")
+def _item_dialog_edit(qapp):
+    dialog = ItemDialog(parent=None, item_data=dict(_EDIT_ITEM))
+    yield dialog
+    dialog.deleteLater()
+
+
+@pytest.fixture
+def item_dialog_add(_item_dialog_add):
+    """Add-mode ItemDialog with empty inputs."""
+    yield _item_dialog_add
+    _item_dialog_add.id_input.clear()
+    _item_dialog_add.document_input.clear()
+    _item_dialog_add.metadata_input.clear()
+    _item_dialog_add.auto_timestamp_checkbox.setChecked(False)
 
 
 @pytest.fixture
-def qapp():
-    """Ensure QApplication exists for Qt tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-    # Don't quit here as other tests may still need it
+def item_dialog_edit(_item_dialog_edit):
+    """Edit-mode ItemDialog populated from _EDIT_ITEM."""
+    yield _item_dialog_edit
+    _item_dialog_edit.auto_timestamp_checkbox.setChecked(False)
 
 
-def test_add_dialog_has_timestamp_checkbox(qapp):
+def test_add_dialog_has_timestamp_checkbox(item_dialog_add):
     """Test that add dialog includes timestamp checkbox with correct label."""
-    dialog = ItemDialog(parent=None, item_data=None)
+    dialog = item_dialog_add
 
     assert dialog.auto_timestamp_checkbox is not None
     assert "created_at" in dialog.auto_timestamp_checkbox.text()
     assert dialog.auto_timestamp_checkbox.isChecked() is False  # Default disabled
 
 
-def test_edit_dialog_has_timestamp_checkbox(qapp):
+def test_edit_dialog_has_timestamp_checkbox(item_dialog_edit):
     """Test that edit dialog includes timestamp checkbox with correct label."""
-    item_data = {
-        "id": "test-1",
-        "document": "Test document",
-        "metadata": {"foo": "bar"},
-    }
-    dialog = ItemDialog(parent=None, item_data=item_data)
+    dialog = item_dialog_edit
 
     assert dialog.auto_timestamp_checkbox is not None
     assert "updated_at" in dialog.auto_timestamp_checkbox.text()
     assert dialog.is_edit_mode is True
 
 
-def test_get_item_data_includes_auto_timestamp_flag(qapp):
+def test_get_item_data_includes_auto_timestamp_flag(item_dialog_add):
     """Test that get_item_data returns the auto_timestamp flag."""
-    dialog = ItemDialog(parent=None, item_data=None)
+    dialog = item_dialog_add
     dialog.id_input.setText("test-id")
     dialog.document_input.setPlainText("Test document")
     dialog.metadata_input.setPlainText('{"key": "value"}')
@@ -59,9 +86,9 @@ def test_get_item_data_includes_auto_timestamp_flag(qapp):
     assert item_data["metadata"] == {"key": "value"}
 
 
-def test_get_item_data_auto_timestamp_disabled(qapp):
+def test_get_item_data_auto_timestamp_disabled(item_dialog_add):
     """Test that get_item_data respects unchecked auto_timestamp."""
-    dialog = ItemDialog(parent=None, item_data=None)
+    dialog = item_dialog_add
     dialog.id_input.setText("test-id-2")
     dialog.document_input.setPlainText("Another doc")
     dialog.auto_timestamp_checkbox.setChecked(False)
@@ -72,136 +99,78 @@ def test_get_item_data_auto_timestamp_disabled(qapp):
     assert item_data["auto_timestamp"] is False
 
 
-def test_timestamp_checkbox_default_state(qapp):
+def test_timestamp_checkbox_default_state(item_dialog_add, item_dialog_edit):
     """Test that timestamp checkbox defaults to disabled."""
     # Add dialog
-    add_dialog = ItemDialog(parent=None, item_data=None)
-    assert add_dialog.auto_timestamp_checkbox.isChecked() is False
+    assert item_dialog_add.auto_timestamp_checkbox.isChecked() is False
 
     # Edit dialog
-    edit_dialog = ItemDialog(parent=None, item_data={"id": "x", "document": "y", "metadata": {}})
-    assert edit_dialog.auto_timestamp_checkbox.isChecked() is False
-
-
-@patch("vector_inspector.ui.views.metadata_view.QMessageBox")
-def test_metadata_view_respects_timestamp_toggle_on_add(mock_qmsg):
-    """Test that metadata view only adds created_at when checkbox is enabled."""
-    from vector_inspector.ui.views.metadata.context import MetadataContext
-
-    # Mock connection
-    mock_connection = MagicMock()
-    mock_connection.add_items.return_value = True
-
-    ctx = MetadataContext(connection=mock_connection)
-    ctx.current_collection = "test_collection"
-
-    # Simulate ItemDialog returning data with auto_timestamp=True
-    item_data_enabled = {
-        "id": "test-1",
-        "document": "Test doc",
-        "metadata": {"foo": "bar"},
-        "auto_timestamp": True,
-    }
-
-    # Remove auto_timestamp and inject created_at (mimicking metadata_view logic)
-    auto_timestamp = item_data_enabled.pop("auto_timestamp", True)
-    if auto_timestamp:
-        if item_data_enabled["metadata"] is None:
-            item_data_enabled["metadata"] = {}
-        if "created_at" not in item_data_enabled["metadata"]:
-            item_data_enabled["metadata"]["created_at"] = datetime.now(UTC).isoformat()
-
-    assert "created_at" in item_data_enabled["metadata"]
-    assert "foo" in item_data_enabled["metadata"]
-
-    # Now test with auto_timestamp=False
-    item_data_disabled = {
-        "id": "test-2",
-        "document": "Test doc 2",
-        "metadata": {"bar": "baz"},
-        "auto_timestamp": False,
-    }
-
-    auto_timestamp = item_data_disabled.pop("auto_timestamp", True)
-    if auto_timestamp:
-        if item_data_disabled["metadata"] is None:
-            item_data_disabled["metadata"] = {}
-        if "created_at" not in item_data_disabled["metadata"]:
-            item_data_disabled["metadata"]["created_at"] = datetime.now(UTC).isoformat()
-
-    # Should NOT have created_at
-    assert "created_at" not in item_data_disabled["metadata"]
-    assert "bar" in item_data_disabled["metadata"]
-
-
-@patch("vector_inspector.ui.views.metadata_view.QMessageBox")
-def test_metadata_view_respects_timestamp_toggle_on_edit(mock_qmsg):
-    """Test that metadata view only adds updated_at when checkbox is enabled."""
-    from vector_inspector.ui.views.metadata.context import MetadataContext
-
-    # Mock connection
-    mock_connection = MagicMock()
-    mock_connection.update_items.return_value = True
-
-    ctx = MetadataContext(connection=mock_connection)
-    ctx.current_collection = "test_collection"
-
-    # Simulate ItemDialog returning data with auto_timestamp=True
-    updated_data_enabled = {
-        "id": "test-1",
-        "document": "Updated doc",
-        "metadata": {"existing": "value"},
-        "auto_timestamp": True,
-    }
-
-    # Remove auto_timestamp and inject updated_at (mimicking metadata_view logic)
-    auto_timestamp = updated_data_enabled.pop("auto_timestamp", True)
-    if auto_timestamp:
-        if updated_data_enabled["metadata"] is None:
-            updated_data_enabled["metadata"] = {}
-        updated_data_enabled["metadata"]["updated_at"] = datetime.now(UTC).isoformat()
-
-    assert "updated_at" in updated_data_enabled["metadata"]
-    assert "existing" in updated_data_enabled["metadata"]
-
-    # Now test with auto_timestamp=False
-    updated_data_disabled = {
-        "id": "test-2",
-        "document": "Updated doc 2",
-        "metadata": {"existing": "value"},
-        "auto_timestamp": False,
-    }
-
-    auto_timestamp = updated_data_disabled.pop("auto_timestamp", True)
-    if auto_timestamp:
-        if updated_data_disabled["metadata"] is None:
-            updated_data_disabled["metadata"] = {}
-        updated_data_disabled["metadata"]["updated_at"] = datetime.now(UTC).isoformat()
-
-    # Should NOT have updated_at
-    assert "updated_at" not in updated_data_disabled["metadata"]
-    assert "existing" in updated_data_disabled["metadata"]
-
-
-def test_timestamp_not_overwritten_if_already_present(qapp):
-    """Test that existing created_at in metadata is preserved."""
-    existing_timestamp = "2023-05-15T10:30:00Z"
-
-    item_data = {
-        "id": "test-preserve",
-        "document": "Test",
-        "metadata": {"created_at": existing_timestamp, "other": "data"},
-        "auto_timestamp": True,
-    }
-
-    # Simulate the logic from metadata_view._add_item
-    auto_timestamp = item_data.pop("auto_timestamp", True)
-    if auto_timestamp:
-        if item_data["metadata"] is None:
-            item_data["metadata"] = {}
-        if "created_at" not in item_data["metadata"]:
-            item_data["metadata"]["created_at"] = datetime.now(UTC).isoformat()
-
-    # Should preserve the existing timestamp
-    assert item_data["metadata"]["created_at"] == existing_timestamp
-    assert item_data["metadata"]["other"] == "data"
+    assert item_dialog_edit.auto_timestamp_checkbox.isChecked() is False
+
+
+# metadata_view pops the flag with these defaults: False on add, True on edit
+_AUTO_TIMESTAMP_DEFAULTS = {"created_at": False, "updated_at": True}
+
+
+def _apply_auto_timestamp(item_data, field, overwrite):
+    """Mirror of the metadata_view add (created_at) / edit (updated_at) flag handling."""
+    if item_data.pop("auto_timestamp", _AUTO_TIMESTAMP_DEFAULTS[field]):
+        item_data["metadata"] = MetadataContext.inject_timestamp(
+            item_data["metadata"], field, overwrite=overwrite, now_iso=_FROZEN_ISO
+        )
+
+
+@pytest.mark.parametrize(
+    ("metadata", "auto_timestamp", "field", "overwrite", "expected"),
+    [
+        pytest.param({"foo": "bar"}, True, "created_at", False, {"foo": "bar", "created_at": _FROZEN_ISO}, id="add"),
+        pytest.param({"bar": "baz"}, False, "created_at", False, {"bar": "baz"}, id="add-disabled"),
+        pytest.param(
+            {"created_at": _EXISTING_TS, "other": "data"},
+            True,
+            "created_at",
+            False,
+            {"created_at": _EXISTING_TS, "other": "data"},
+            id="add-keeps-existing",
+        ),
+        pytest.param(None, True, "created_at", False, {"created_at": _FROZEN_ISO}, id="add-no-metadata"),
+        pytest.param({"foo": "bar"}, None, "created_at", False, {"foo": "bar"}, id="add-no-flag"),
+        pytest.param(
+            {"existing": "value"}, True, "updated_at", True, {"existing": "value", "updated_at": _FROZEN_ISO}, id="edit"
+        ),
+        pytest.param({"existing": "value"}, False, "updated_at", True, {"existing": "value"}, id="edit-disabled"),
+        pytest.param(
+            {"updated_at": _EXISTING_TS}, True, "updated_at", True, {"updated_at": _FROZEN_ISO}, id="edit-overwrites"
+        ),
+        pytest.param(
+            {"existing": "value"},
+            None,
+            "updated_at",
+            True,
+            {"existing": "value", "updated_at": _FROZEN_ISO},
+            id="edit-no-flag",
+        ),
+    ],
+)
+def test_metadata_view_timestamp_injection(metadata, auto_timestamp, field, overwrite, expected):
+    """created_at/updated_at are only injected when the checkbox flag is set."""
+    # Copy so the parametrized dict is not mutated across runs
+    metadata = dict(metadata) if metadata is not None else None
+    item_data = {"id": "test-1", "document": "Test doc", "metadata": metadata}
+    # None leaves the flag out, exercising the add/edit defaults
+    if auto_timestamp is not None:
+        item_data["auto_timestamp"] = auto_timestamp
+
+    _apply_auto_timestamp(item_data, field, overwrite)
+
+    assert "auto_timestamp" not in item_data
+    assert item_data["metadata"] == expected
+
+
+def test_inject_timestamp_uses_current_utc_time():
+    """Without now_iso the stamp is a timezone-aware ISO timestamp."""
+    from datetime import datetime
+
+    metadata = MetadataContext.inject_timestamp(None, "created_at")
+
+    assert datetime.fromisoformat(metadata["created_at"]).utcoffset() is not None
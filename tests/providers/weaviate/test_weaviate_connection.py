@@ -1,79 +1,121 @@
 """Tests for Weaviate connection provider."""
 
 import uuid
-from unittest.mock import MagicMock, patch
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import MagicMock, create_autospec, patch
 
 import pytest
 
 from vector_inspector.core.connections.weaviate_connection import WeaviateConnection
 
+# The module-scoped client mocks and get_weaviate_client patch are built once
+# per worker; keep the module on one xdist worker under --dist loadgroup
+pytestmark = pytest.mark.xdist_group(name="weaviate_connection")
 
-@pytest.fixture
-def mock_weaviate_client(monkeypatch):
-    """Mock the Weaviate client for testing."""
-    from unittest.mock import MagicMock
+# When the real client is installed, the config and auth sub-mocks are specced
+# against it so tests fail if the code drifts from the weaviate API
+try:
+    import weaviate as _real_weaviate
+except ImportError:
+    _real_weaviate = None
 
-    # Create mock Weaviate module
-    mock_weaviate = MagicMock()
-    mock_client = MagicMock()
+# Valid, distinct UUID strings; no test depends on their values
+_UUIDS = tuple(str(uuid.uuid4()) for _ in range(2))
+
+
+def _weaviate_object(object_uuid, document, key, vector, distance=None):
+    """A Weaviate result object carrying a document, one metadata key and a vector."""
+    return SimpleNamespace(
+        uuid=object_uuid,
+        properties={"document": document, "key": key},
+        metadata=SimpleNamespace(distance=distance),
+        vector=vector,
+    )
+
+
+def _make_batching_collection():
+    """A mock collection whose batch.dynamic() context yields the returned mock batch."""
+    collection = MagicMock()
+    batch = MagicMock()
+    collection.batch.dynamic.return_value = nullcontext(batch)
+    return collection, batch
 
-    # Configure mock client
+
+def _configure_weaviate_mocks(mock_weaviate, mock_client):
+    """Apply the default behaviour of a reachable local Weaviate server."""
     mock_client.is_ready.return_value = True
     mock_client.connect.return_value = None
     mock_client.close.return_value = None
+    mock_client.collections.list_all.return_value = {}
+    mock_client.collections.get.return_value = MagicMock()
 
-    # Mock collections
-    mock_collections = MagicMock()
-    mock_collections.list_all.return_value = {}
-    mock_client.collections = mock_collections
-
-    # Mock connection params
-    mock_connection_params = MagicMock()
-    mock_weaviate.connect.ConnectionParams.from_url.return_value = mock_connection_params
-
-    # Mock WeaviateClient constructor
+    mock_weaviate.connect.ConnectionParams.from_url.return_value = MagicMock()
     mock_weaviate.WeaviateClient.return_value = mock_client
 
-    # Mock auth
-    mock_weaviate.auth = MagicMock()
 
-    # Mock config
-    mock_config = MagicMock()
-    mock_weaviate.config = mock_config
+@pytest.fixture(scope="module")
+def _shared_weaviate_mocks():
+    """Mock Weaviate module and client, built and patched in once per module."""
+    mock_weaviate = MagicMock()
+    mock_client = MagicMock()
+    if _real_weaviate is not None:
+        mock_weaviate.config = create_autospec(_real_weaviate.config)
+        mock_weaviate.auth = create_autospec(_real_weaviate.auth)
 
     # Patch the lazy import
-    def mock_get_weaviate_client():
-        return mock_weaviate
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "vector_inspector.core.connections.weaviate_connection.get_weaviate_client",
+            lambda: mock_weaviate,
+        )
+        yield mock_weaviate, mock_client
 
-    monkeypatch.setattr(
-        "vector_inspector.core.connections.weaviate_connection.get_weaviate_client",
-        mock_get_weaviate_client,
-    )
 
+@pytest.fixture
+def mock_weaviate_client(_shared_weaviate_mocks):
+    """Mock the Weaviate client for testing; calls and configuration from earlier tests are reset."""
+    mock_weaviate, mock_client = _shared_weaviate_mocks
+    # return_value=True would also reset the MagicMock magic methods, so
+    # clear calls and side effects and re-apply the return values instead
+    mock_weaviate.reset_mock(side_effect=True)
+    mock_client.reset_mock(side_effect=True)
+    _configure_weaviate_mocks(mock_weaviate, mock_client)
     return mock_weaviate, mock_client
 
 
-def test_weaviate_connection_init():
-    """Test Weaviate connection initialization."""
+@pytest.fixture
+def connected_conn(mock_weaviate_client):
+    """A local WeaviateConnection already connected through the mocked client."""
     conn = WeaviateConnection(host="localhost", port=8080)
-    assert conn.host == "localhost"
-    assert conn.port == 8080
-    assert conn._client is None
-
-
-def test_weaviate_connection_with_url():
-    """Test Weaviate connection initialization with URL."""
-    conn = WeaviateConnection(url="https://my-weaviate.weaviate.network")
-    assert conn.url == "https://my-weaviate.weaviate.network"
+    conn.connect()
+    return conn
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        pytest.param({"host": "localhost", "port": 8080}, {"host": "localhost", "port": 8080}, id="host-port"),
+        pytest.param(
+            {"url": "https://my-weaviate.weaviate.network"},
+            {"url": "https://my-weaviate.weaviate.network"},
+            id="url",
+        ),
+        pytest.param(
+            {"url": "https://my-weaviate.weaviate.network", "api_key": "my-secret-key"},
+            {"api_key": "my-secret-key"},
+            id="api-key",
+        ),
+    ],
+)
+def test_weaviate_connection_init(kwargs, expected):
+    """Test Weaviate connection initialization for local, URL and API key setups."""
+    conn = WeaviateConnection(**kwargs)
+    for attr, value in expected.items():
+        assert getattr(conn, attr) == value
     assert conn._client is None
 
 
-def test_weaviate_connection_with_api_key():
-    """Test Weaviate connection initialization with API key."""
-    conn = WeaviateConnection(url="https://my-weaviate.weaviate.network", api_key="my-secret-key")
-    assert conn.api_key == "my-secret-key"
-
-
 def test_weaviate_connect_success(mock_weaviate_client):
     """Test successful connection to Weaviate."""
     _mock_weaviate, mock_client = mock_weaviate_client
@@ -97,19 +139,17 @@ def test_weaviate_connect_failure(mock_weaviate_client):
     assert conn.is_connected is False
 
 
-def test_weaviate_disconnect(mock_weaviate_client):
+def test_weaviate_disconnect(connected_conn, mock_weaviate_client):
     """Test disconnecting from Weaviate."""
     _mock_weaviate, mock_client = mock_weaviate_client
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    conn.disconnect()
+    connected_conn.disconnect()
 
-    assert conn._client is None
+    assert connected_conn._client is None
     mock_client.close.assert_called_once()
 
 
-def test_weaviate_list_collections(mock_weaviate_client):
+def test_weaviate_list_collections(connected_conn, mock_weaviate_client):
     """Test listing collections."""
     _mock_weaviate, mock_client = mock_weaviate_client
     mock_client.collections.list_all.return_value = {
@@ -117,16 +157,12 @@ def test_weaviate_list_collections(mock_weaviate_client):
         "TestCollection2": MagicMock(),
     }
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    collections = conn.list_collections()
+    collections = connected_conn.list_collections()
 
-    assert "TestCollection1" in collections
-    assert "TestCollection2" in collections
-    assert len(collections) == 2
+    assert set(collections) == {"TestCollection1", "TestCollection2"}
 
 
-def test_weaviate_create_collection(mock_weaviate_client):
+def test_weaviate_create_collection(connected_conn, mock_weaviate_client):
     """Test creating a collection."""
     mock_weaviate, mock_client = mock_weaviate_client
 
@@ -135,87 +171,87 @@ def test_weaviate_create_collection(mock_weaviate_client):
     mock_weaviate.classes = MagicMock()
     mock_weaviate.classes.config = mock_classes_config
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    result = conn.create_collection("TestCollection", vector_size=384, distance="Cosine")
+    result = connected_conn.create_collection("TestCollection", vector_size=384, distance="Cosine")
 
     assert result is True
     mock_client.collections.create.assert_called_once()
 
 
-def test_weaviate_delete_collection(mock_weaviate_client):
+def test_weaviate_delete_collection(connected_conn, mock_weaviate_client):
     """Test deleting a collection."""
     _mock_weaviate, mock_client = mock_weaviate_client
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    result = conn.delete_collection("TestCollection")
+    result = connected_conn.delete_collection("TestCollection")
 
     assert result is True
     mock_client.collections.delete.assert_called_once_with("TestCollection")
 
 
-def test_weaviate_add_items_with_embeddings(mock_weaviate_client):
+def test_weaviate_add_items_with_embeddings(connected_conn, mock_weaviate_client):
     """Test adding items with pre-computed embeddings."""
     _mock_weaviate, mock_client = mock_weaviate_client
 
-    # Mock collection
-    mock_collection = MagicMock()
-    mock_batch = MagicMock()
-    mock_batch.__enter__ = MagicMock(return_value=mock_batch)
-    mock_batch.__exit__ = MagicMock(return_value=False)
-    mock_collection.batch.dynamic.return_value = mock_batch
+    mock_collection, mock_batch = _make_batching_collection()
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-
     documents = ["doc1", "doc2"]
     embeddings = [[0.1, 0.2], [0.3, 0.4]]
     ids = ["id1", "id2"]
 
-    result = conn.add_items("TestCollection", documents=documents, embeddings=embeddings, ids=ids)
+    result = connected_conn.add_items("TestCollection", documents=documents, embeddings=embeddings, ids=ids)
 
     assert result is True
+    assert mock_batch.add_object.call_count == 2
 
 
-def test_weaviate_add_items_empty_documents(mock_weaviate_client):
-    """Test adding empty documents list."""
-    _mock_weaviate, _mock_client = mock_weaviate_client
+@pytest.mark.parametrize("count", [1, 100, 1000])
+def test_weaviate_add_items_batch_sizes(connected_conn, mock_weaviate_client, count):
+    """Every item goes into one dynamic batch, whatever the batch size."""
+    _mock_weaviate, mock_client = mock_weaviate_client
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
+    mock_collection, mock_batch = _make_batching_collection()
+    mock_client.collections.get.return_value = mock_collection
+
+    documents = ["doc"] * count
+    embeddings = [[0.1, 0.2]] * count
+    ids = [_UUIDS[0]] * count
 
-    result = conn.add_items("TestCollection", documents=[], embeddings=[])
+    result = connected_conn.add_items("TestCollection", documents=documents, embeddings=embeddings, ids=ids)
+
+    assert result is True
+    mock_collection.batch.dynamic.assert_called_once()
+    assert mock_batch.add_object.call_count == count
+    assert mock_batch.add_object.call_args.kwargs == {
+        "properties": {"document": "doc"},
+        "vector": [0.1, 0.2],
+        "uuid": uuid.UUID(_UUIDS[0]),
+    }
+
+
+def test_weaviate_add_items_empty_documents(connected_conn):
+    """Test adding empty documents list."""
+    result = connected_conn.add_items("TestCollection", documents=[], embeddings=[])
 
     assert result is False
 
 
-def test_weaviate_add_items_auto_embed(mock_weaviate_client):
+def test_weaviate_add_items_auto_embed(connected_conn, mock_weaviate_client):
     """Test adding items with automatic embedding generation."""
     _mock_weaviate, mock_client = mock_weaviate_client
 
-    # Mock collection
-    mock_collection = MagicMock()
-    mock_batch = MagicMock()
-    mock_batch.__enter__ = MagicMock(return_value=mock_batch)
-    mock_batch.__exit__ = MagicMock(return_value=False)
-    mock_collection.batch.dynamic.return_value = mock_batch
+    mock_collection, _mock_batch = _make_batching_collection()
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-
     documents = ["doc1", "doc2"]
 
     # Mock compute_embeddings_for_documents
-    with patch.object(conn, "compute_embeddings_for_documents", return_value=[[0.1, 0.2], [0.3, 0.4]]):
-        result = conn.add_items("TestCollection", documents=documents)
+    with patch.object(connected_conn, "compute_embeddings_for_documents", return_value=[[0.1, 0.2], [0.3, 0.4]]):
+        result = connected_conn.add_items("TestCollection", documents=documents)
 
     assert result is True
 
 
-def test_weaviate_get_collection_info(mock_weaviate_client):
+def test_weaviate_get_collection_info(connected_conn, mock_weaviate_client):
     """Test getting collection info."""
     _mock_weaviate, mock_client = mock_weaviate_client
 
@@ -232,16 +268,14 @@ def test_weaviate_get_collection_info(mock_weaviate_client):
 
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    info = conn.get_collection_info("TestCollection")
+    info = connected_conn.get_collection_info("TestCollection")
 
     assert info is not None
     assert info["name"] == "TestCollection"
     assert info["count"] == 10
 
 
-def test_weaviate_count_collection(mock_weaviate_client):
+def test_weaviate_count_collection(connected_conn, mock_weaviate_client):
     """Test counting items in collection."""
     _mock_weaviate, mock_client = mock_weaviate_client
 
@@ -252,14 +286,12 @@ def test_weaviate_count_collection(mock_weaviate_client):
     mock_collection.aggregate.over_all.return_value = mock_aggregate
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    count = conn.count_collection("TestCollection")
+    count = connected_conn.count_collection("TestCollection")
 
     assert count == 42
 
 
-def test_weaviate_query_collection(mock_weaviate_client):
+def test_weaviate_query_collection(connected_conn, mock_weaviate_client):
     """Test querying collection."""
     _mock_weaviate, mock_client = mock_weaviate_client
 
@@ -267,23 +299,13 @@ def test_weaviate_query_collection(mock_weaviate_client):
     mock_collection = MagicMock()
 
     # Mock query response
-    mock_obj = MagicMock()
-    mock_obj.uuid = uuid.uuid4()
-    mock_obj.properties = {"document": "test doc", "key": "value"}
-    mock_obj.metadata.distance = 0.5
-    mock_obj.vector = [0.1, 0.2]
-
-    mock_response = MagicMock()
-    mock_response.objects = [mock_obj]
+    mock_response = SimpleNamespace(objects=[_weaviate_object(_UUIDS[0], "test doc", "value", [0.1, 0.2], 0.5)])
     mock_collection.query.near_vector.return_value = mock_response
 
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-
     query_embeddings = [[0.5, 0.5]]
-    result = conn.query_collection("TestCollection", query_embeddings=query_embeddings, n_results=5)
+    result = connected_conn.query_collection("TestCollection", query_embeddings=query_embeddings, n_results=5)
 
     assert result is not None
     assert "ids" in result
@@ -291,7 +313,7 @@ def test_weaviate_query_collection(mock_weaviate_client):
     assert len(result["ids"]) == 1
 
 
-def test_weaviate_get_all_items(mock_weaviate_client):
+def test_weaviate_get_all_items(connected_conn, mock_weaviate_client):
     """Test getting all items from collection."""
     _mock_weaviate, mock_client = mock_weaviate_client
 
@@ -299,34 +321,25 @@ def test_weaviate_get_all_items(mock_weaviate_client):
     mock_collection = MagicMock()
 
     # Mock objects
-    mock_obj1 = MagicMock()
-    mock_obj1.uuid = uuid.uuid4()
-    mock_obj1.properties = {"document": "doc1", "key": "val1"}
-    mock_obj1.vector = [0.1, 0.2]
-
-    mock_obj2 = MagicMock()
-    mock_obj2.uuid = uuid.uuid4()
-    mock_obj2.properties = {"document": "doc2", "key": "val2"}
-    mock_obj2.vector = [0.3, 0.4]
-
-    mock_response = MagicMock()
-    mock_response.objects = [mock_obj1, mock_obj2]
+    mock_response = SimpleNamespace(
+        objects=[
+            _weaviate_object(_UUIDS[0], "doc1", "val1", [0.1, 0.2]),
+            _weaviate_object(_UUIDS[1], "doc2", "val2", [0.3, 0.4]),
+        ]
+    )
     mock_collection.query.fetch_objects.return_value = mock_response
 
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    result = conn.get_all_items("TestCollection", limit=10)
+    result = connected_conn.get_all_items("TestCollection", limit=10)
 
     assert result is not None
     assert len(result["ids"]) == 2
     assert len(result["documents"]) == 2
-    assert "doc1" in result["documents"]
-    assert "doc2" in result["documents"]
+    assert set(result["documents"]) == {"doc1", "doc2"}
 
 
-def test_weaviate_update_items(mock_weaviate_client):
+def test_weaviate_update_items(connected_conn, mock_weaviate_client):
     """Test updating items in collection."""
     _mock_weaviate, mock_client = mock_weaviate_client
 
@@ -334,19 +347,14 @@ def test_weaviate_update_items(mock_weaviate_client):
     mock_collection = MagicMock()
 
     # Mock existing object
-    mock_existing = MagicMock()
-    mock_existing.properties = {"document": "old doc", "key": "old value"}
-    mock_existing.vector = [0.1, 0.2]
+    mock_existing = SimpleNamespace(properties={"document": "old doc", "key": "old value"}, vector=[0.1, 0.2])
     mock_collection.query.fetch_object_by_id.return_value = mock_existing
 
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-
     # Use a valid UUID string
-    test_uuid = str(uuid.uuid4())
-    result = conn.update_items(
+    test_uuid = _UUIDS[0]
+    result = connected_conn.update_items(
         "TestCollection",
         ids=[test_uuid],
         documents=["new doc"],
@@ -358,7 +366,7 @@ def test_weaviate_update_items(mock_weaviate_client):
     mock_collection.data.update.assert_called_once()
 
 
-def test_weaviate_delete_items_by_id(mock_weaviate_client):
+def test_weaviate_delete_items_by_id(connected_conn, mock_weaviate_client):
     """Test deleting items by ID."""
     _mock_weaviate, mock_client = mock_weaviate_client
 
@@ -366,81 +374,61 @@ def test_weaviate_delete_items_by_id(mock_weaviate_client):
     mock_collection = MagicMock()
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-
     # Use valid UUID strings
-    test_uuid1 = str(uuid.uuid4())
-    test_uuid2 = str(uuid.uuid4())
-    result = conn.delete_items("TestCollection", ids=[test_uuid1, test_uuid2])
+    test_uuid1, test_uuid2 = _UUIDS[:2]
+    result = connected_conn.delete_items("TestCollection", ids=[test_uuid1, test_uuid2])
 
     assert result is True
     assert mock_collection.data.delete_by_id.call_count == 2
 
 
-def test_weaviate_add_items_handles_exception(mock_weaviate_client):
+def test_weaviate_add_items_handles_exception(connected_conn, mock_weaviate_client):
     """If batch add raises, add_items should return False."""
     mock_weaviate, mock_client = mock_weaviate_client
 
-    mock_collection = MagicMock()
-    mock_batch = MagicMock()
-    mock_batch.__enter__ = MagicMock(return_value=mock_batch)
-    mock_batch.__exit__ = MagicMock(return_value=False)
+    mock_collection, mock_batch = _make_batching_collection()
     # make add raise
     mock_batch.add_object.side_effect = Exception("batch add fail")
-    mock_collection.batch.dynamic.return_value = mock_batch
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    res = conn.add_items("TestCollection", documents=["d"], embeddings=[[0.1, 0.2]], ids=["i"])
+    res = connected_conn.add_items("TestCollection", documents=["d"], embeddings=[[0.1, 0.2]], ids=["i"])
     assert res is False
 
 
-def test_weaviate_query_handles_exception(mock_weaviate_client):
+def test_weaviate_query_handles_exception(connected_conn, mock_weaviate_client):
     mock_weaviate, mock_client = mock_weaviate_client
     mock_collection = MagicMock()
     mock_collection.query.near_vector.side_effect = Exception("query fail")
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    res = conn.query_collection("TestCollection", query_embeddings=[[0.1, 0.2]])
+    res = connected_conn.query_collection("TestCollection", query_embeddings=[[0.1, 0.2]])
     assert res is None
 
 
-def test_weaviate_delete_handles_exception(mock_weaviate_client):
+def test_weaviate_delete_handles_exception(connected_conn, mock_weaviate_client):
     mock_weaviate, mock_client = mock_weaviate_client
     mock_collection = MagicMock()
     mock_collection.data.delete_by_id.side_effect = Exception("delete fail")
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    res = conn.delete_items("TestCollection", ids=[str(uuid.uuid4())])
+    res = connected_conn.delete_items("TestCollection", ids=[_UUIDS[0]])
     # Weaviate's delete_items logs failures per-id but returns True (best-effort).
     assert res is True
 
 
-def test_weaviate_get_all_items_handles_exception(mock_weaviate_client):
+def test_weaviate_get_all_items_handles_exception(connected_conn, mock_weaviate_client):
     mock_weaviate, mock_client = mock_weaviate_client
     mock_collection = MagicMock()
     mock_collection.query.fetch_objects.side_effect = Exception("fetch fail")
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    res = conn.get_all_items("TestCollection", limit=10)
+    res = connected_conn.get_all_items("TestCollection", limit=10)
     assert res is None
 
 
-def test_weaviate_get_connection_info(mock_weaviate_client):
+def test_weaviate_get_connection_info(connected_conn):
     """Test getting connection info."""
-    _mock_weaviate, _mock_client = mock_weaviate_client
-
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-    info = conn.get_connection_info()
+    info = connected_conn.get_connection_info()
 
     assert info["provider"] == "Weaviate"
     assert info["connected"] is True
@@ -469,67 +457,66 @@ def test_weaviate_supported_filter_operators(mock_weaviate_client):
     assert len(operators) > 0
     assert any(op["name"] == "=" for op in operators)
     assert any(op["name"] == "in" for op in operators)
-
-
-def test_weaviate_embedded_mode_init():
-    """Test Weaviate embedded mode initialization."""
-    conn = WeaviateConnection(
-        mode="embedded",
-        persistence_directory="/tmp/weaviate_test",
-        embedded_version="1.28.0",
-    )
-    assert conn.mode == "embedded"
-    assert conn.persistence_directory == "/tmp/weaviate_test"
-    assert conn.embedded_version == "1.28.0"
-
-
-def test_weaviate_embedded_mode_connection(mock_weaviate_client):
-    """Test connecting to Weaviate in embedded mode."""
-    mock_weaviate, mock_client = mock_weaviate_client
-
-    # Mock embedded options
-    mock_embedded_options = MagicMock()
-    mock_weaviate.embedded.EmbeddedOptions.return_value = mock_embedded_options
-
-    conn = WeaviateConnection(
-        mode="embedded",
-        persistence_directory="/tmp/weaviate_test",
-    )
-    result = conn.connect()
-
-    assert result is True
-    assert conn.is_connected is True
-    # Verify embedded options were used
-    mock_weaviate.embedded.EmbeddedOptions.assert_called_once()
-
-
-def test_weaviate_embedded_mode_auto_detect():
-    """Test auto-detection of embedded mode from persistence_directory."""
-    # Connection without mode but with persistence_directory should be detected as embedded
-    conn = WeaviateConnection(persistence_directory="/tmp/weaviate_test")
-
-    # Check that get_connection_info recognizes it as embedded
-    info = conn.get_connection_info()
-    assert info["mode"] == "embedded"
-    assert info["persistence_directory"] == "/tmp/weaviate_test"
-
-
-def test_weaviate_embedded_mode_connection_info(mock_weaviate_client):
-    """Test connection info for embedded mode."""
-    _mock_weaviate, _mock_client = mock_weaviate_client
-
-    conn = WeaviateConnection(
-        mode="embedded",
-        persistence_directory="/tmp/weaviate_test",
-        embedded_version="1.28.0",
-    )
-    conn.connect()
-    info = conn.get_connection_info()
-
-    assert info["provider"] == "Weaviate"
-    assert info["mode"] == "embedded"
-    assert info["persistence_directory"] == "/tmp/weaviate_test"
-    assert info["version"] == "1.28.0"
+    # Each caller gets its own list, so FilterBuilder edits cannot leak
+    assert conn.get_supported_filter_operators() is not operators
+
+
+_EMBEDDED_DIR = "/tmp/weaviate_test"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "connect", "attrs", "info"),
+    [
+        pytest.param(
+            {"mode": "embedded", "persistence_directory": _EMBEDDED_DIR, "embedded_version": "1.28.0"},
+            False,
+            {"mode": "embedded", "persistence_directory": _EMBEDDED_DIR, "embedded_version": "1.28.0"},
+            {},
+            id="init",
+        ),
+        pytest.param(
+            # No mode, but a persistence_directory is detected as embedded
+            {"persistence_directory": _EMBEDDED_DIR},
+            False,
+            {},
+            {"mode": "embedded", "persistence_directory": _EMBEDDED_DIR},
+            id="auto-detect",
+        ),
+        pytest.param(
+            {"mode": "embedded", "persistence_directory": _EMBEDDED_DIR},
+            True,
+            {"is_connected": True},
+            {},
+            id="connect",
+        ),
+        pytest.param(
+            {"mode": "embedded", "persistence_directory": _EMBEDDED_DIR, "embedded_version": "1.28.0"},
+            True,
+            {},
+            {
+                "provider": "Weaviate",
+                "mode": "embedded",
+                "persistence_directory": _EMBEDDED_DIR,
+                "version": "1.28.0",
+            },
+            id="connection-info",
+        ),
+    ],
+)
+def test_weaviate_embedded_mode(request, kwargs, connect, attrs, info):
+    """Test embedded mode construction, connection and connection info."""
+    conn = WeaviateConnection(**kwargs)
+    if connect:
+        mock_weaviate, _mock_client = request.getfixturevalue("mock_weaviate_client")
+        assert conn.connect() is True
+        # Verify embedded options were used
+        mock_weaviate.embedded.EmbeddedOptions.assert_called_once()
+
+    for attr, value in attrs.items():
+        assert getattr(conn, attr) == value
+    connection_info = conn.get_connection_info()
+    for key, value in info.items():
+        assert connection_info[key] == value
 
 
 def test_weaviate_embedded_collections(mock_weaviate_client):
@@ -548,10 +535,10 @@ def test_weaviate_embedded_collections(mock_weaviate_client):
     conn.connect()
     collections = conn.list_collections()
 
-    assert "EmbeddedCollection" in collections
+    assert set(collections) == {"EmbeddedCollection"}
 
 
-def test_weaviate_delete_where_and_ids_precedence(mock_weaviate_client):
+def test_weaviate_delete_where_and_ids_precedence(connected_conn, mock_weaviate_client):
     """Ensure Weaviate delete uses delete_many for filters and delete_by_id for ids."""
     mock_weaviate, mock_client = mock_weaviate_client
 
@@ -559,19 +546,15 @@ def test_weaviate_delete_where_and_ids_precedence(mock_weaviate_client):
     mock_collection = MagicMock()
     mock_client.collections.get.return_value = mock_collection
 
-    conn = WeaviateConnection(host="localhost", port=8080)
-    conn.connect()
-
     # Delete by where -> should call delete_many
-    res = conn.delete_items("TestCollection", where={"type": "remove"})
+    res = connected_conn.delete_items("TestCollection", where={"type": "remove"})
     assert res is True
     assert mock_collection.data.delete_many.called
 
     mock_collection.data.delete_many.reset_mock()
 
     # Delete by ids -> should call delete_by_id for each id
-    u1 = str(uuid.uuid4())
-    u2 = str(uuid.uuid4())
-    res2 = conn.delete_items("TestCollection", ids=[u1, u2])
+    u1, u2 = _UUIDS[:2]
+    res2 = connected_conn.delete_items("TestCollection", ids=[u1, u2])
     assert res2 is True
     assert mock_collection.data.delete_by_id.call_count == 2
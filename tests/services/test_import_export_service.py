@@ -4,13 +4,24 @@ import json
 
 import pandas as pd
 
+# Export verification only needs column names and a cell or two; pyarrow's
+# readers are cheaper than a full pandas round-trip for that.
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+
 from vector_inspector.services.import_export_service import ImportExportService
 
 
-def test_export_to_json(tmp_path, fake_provider_with_name):
+@pytest.fixture(scope="module")
+def svc():
+    """ImportExportService is stateless, so one instance serves the whole module."""
+    return ImportExportService()
+
+
+def test_export_to_json(tmp_path, fake_provider_with_name, svc):
     """Test exporting collection data to JSON format."""
     conn, collection_name = fake_provider_with_name
-    svc = ImportExportService()
 
     # Get data from FakeProvider
     data = conn.get_all_items(collection_name)
@@ -32,10 +43,89 @@ def test_export_to_json(tmp_path, fake_provider_with_name):
     assert "embedding" in exported[0]
 
 
-def test_export_to_csv_without_embeddings(tmp_path, fake_provider_with_name):
+def test_export_to_ndjson(tmp_path, fake_provider_with_name, svc):
+    """Test exporting collection data to newline-delimited JSON."""
+    conn, collection_name = fake_provider_with_name
+
+    data = conn.get_all_items(collection_name)
+
+    ndjson_path = tmp_path / "export.ndjson"
+    success = svc.export_to_ndjson(data, str(ndjson_path))
+    assert success is True
+
+    # One record per line
+    with open(ndjson_path, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+
+    assert len(records) == len(data["ids"])
+    assert [r["id"] for r in records] == list(data["ids"])
+    assert records[0]["document"] in data["documents"]
+    assert "metadata" in records[0]
+    assert "embedding" in records[0]
+
+
+def test_export_to_ndjson_with_numpy_embeddings(tmp_path, svc):
+    """export_to_ndjson serializes numpy array embeddings."""
+    import numpy as np
+
+    data = {
+        "ids": ["id1", "id2"],
+        "documents": ["doc1", "doc2"],
+        "metadatas": [{"key": "val"}, {}],
+        "embeddings": [np.array([0.5, 0.25]), np.array([1.0, 2.0])],
+    }
+    ndjson_path = tmp_path / "numpy_test.ndjson"
+    assert svc.export_to_ndjson(data, str(ndjson_path)) is True
+
+    lines = ndjson_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["embedding"] == [0.5, 0.25]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def ndjson_encoder(request, monkeypatch):
+    """Run an NDJSON test with orjson and again with only the stdlib fallback."""
+    from vector_inspector.services import import_export_service
+
+    if request.param == "stdlib":
+        monkeypatch.setattr(import_export_service, "_ndjson_line", import_export_service._stdlib_ndjson_line)
+    return request.param
+
+
+def test_export_to_ndjson_non_json_metadata(tmp_path, svc, ndjson_encoder):
+    """Decimal, set and int-key metadata encode the same with and without orjson."""
+    from decimal import Decimal
+
+    data = {
+        "ids": ["id1"],
+        "documents": ["doc1"],
+        "metadatas": [{"price": Decimal("1.5"), "tags": {"a"}, "by_rank": {1: "first"}}],
+    }
+    ndjson_path = tmp_path / "safe.ndjson"
+    assert svc.export_to_ndjson(data, str(ndjson_path)) is True
+
+    record = json.loads(ndjson_path.read_text(encoding="utf-8"))
+    assert record["metadata"] == {"price": 1.5, "tags": ["a"], "by_rank": {"1": "first"}}
+
+
+def test_export_to_ndjson_nan_and_big_int(tmp_path, svc, ndjson_encoder):
+    """NaN becomes null and ints wider than 64 bits survive under either encoder."""
+    data = {
+        "ids": ["id1"],
+        "documents": ["doc1"],
+        "metadatas": [{"score": float("nan"), "big": 2**70}],
+    }
+    ndjson_path = tmp_path / "edge.ndjson"
+    assert svc.export_to_ndjson(data, str(ndjson_path)) is True
+
+    line = ndjson_path.read_text(encoding="utf-8")
+    assert '"score":null' in line
+    assert json.loads(line)["metadata"] == {"score": None, "big": 2**70}
+
+
+def test_export_to_csv_without_embeddings(tmp_path, fake_provider_with_name, svc):
     """Test exporting collection data to CSV without embeddings."""
     conn, collection_name = fake_provider_with_name
-    svc = ImportExportService()
 
     data = conn.get_all_items(collection_name)
 
@@ -46,19 +136,18 @@ def test_export_to_csv_without_embeddings(tmp_path, fake_provider_with_name):
     assert csv_path.exists()
 
     # Verify content
-    df = pd.read_csv(csv_path)
-    assert len(df) == 3
-    assert "id" in df.columns
-    assert "document" in df.columns
-    assert "embedding" not in df.columns
+    tbl = pa_csv.read_csv(csv_path)
+    assert tbl.num_rows == 3
+    assert "id" in tbl.column_names
+    assert "document" in tbl.column_names
+    assert "embedding" not in tbl.column_names
     # Check metadata columns
-    assert any(col.startswith("metadata_") for col in df.columns)
+    assert any(col.startswith("metadata_") for col in tbl.column_names)
 
 
-def test_export_to_csv_with_embeddings(tmp_path, fake_provider_with_name):
+def test_export_to_csv_with_embeddings(tmp_path, fake_provider_with_name, svc):
     """Test exporting collection data to CSV with embeddings."""
     conn, collection_name = fake_provider_with_name
-    svc = ImportExportService()
 
     data = conn.get_all_items(collection_name)
 
@@ -68,17 +157,16 @@ def test_export_to_csv_with_embeddings(tmp_path, fake_provider_with_name):
     assert success is True
 
     # Verify content
-    df = pd.read_csv(csv_path)
-    assert "embedding" in df.columns
+    tbl = pa_csv.read_csv(csv_path)
+    assert "embedding" in tbl.column_names
     # Embeddings should be JSON-encoded strings
-    emb = json.loads(df["embedding"].iloc[0])
+    emb = json.loads(tbl.column("embedding")[0].as_py())
     assert isinstance(emb, list)
 
 
-def test_export_to_parquet(tmp_path, fake_provider_with_name):
+def test_export_to_parquet(tmp_path, fake_provider_with_name, svc):
     """Test exporting collection data to Parquet format."""
     conn, collection_name = fake_provider_with_name
-    svc = ImportExportService()
 
     data = conn.get_all_items(collection_name)
 
@@ -89,17 +177,15 @@ def test_export_to_parquet(tmp_path, fake_provider_with_name):
     assert parquet_path.exists()
 
     # Verify content
-    df = pd.read_parquet(parquet_path)
-    assert len(df) == 3
-    assert "id" in df.columns
-    assert "document" in df.columns
-    assert "embedding" in df.columns
+    tbl = pq.read_table(parquet_path)
+    assert tbl.num_rows == 3
+    assert "id" in tbl.column_names
+    assert "document" in tbl.column_names
+    assert "embedding" in tbl.column_names
 
 
-def test_import_from_json(tmp_path, fake_provider):
+def test_import_from_json(tmp_path, fake_provider, svc):
     """Test importing collection data from JSON format."""
-    svc = ImportExportService()
-
     # Create sample JSON file
     sample_data = [
         {"id": "1", "document": "test1", "metadata": {"type": "a"}, "embedding": [0.1, 0.2]},
@@ -121,10 +207,8 @@ def test_import_from_json(tmp_path, fake_provider):
     assert len(result["embeddings"]) == 2
 
 
-def test_import_from_csv(tmp_path):
+def test_import_from_csv(tmp_path, svc):
     """Test importing collection data from CSV format."""
-    svc = ImportExportService()
-
     # Create sample CSV file
     df = pd.DataFrame(
         {
@@ -148,10 +232,8 @@ def test_import_from_csv(tmp_path):
     assert result["embeddings"][0] == [0.1, 0.2]
 
 
-def test_import_from_parquet(tmp_path):
+def test_import_from_parquet(tmp_path, svc):
     """Test importing collection data from Parquet format."""
-    svc = ImportExportService()
-
     # Create sample Parquet file
     df = pd.DataFrame(
         {
@@ -174,10 +256,9 @@ def test_import_from_parquet(tmp_path):
     assert len(result["embeddings"]) == 2
 
 
-def test_export_import_roundtrip_json(tmp_path, fake_provider_with_name):
+def test_export_import_roundtrip_json(tmp_path, fake_provider_with_name, svc):
     """Test that export then import preserves data (JSON)."""
     conn, collection_name = fake_provider_with_name
-    svc = ImportExportService()
 
     # Export original data
     original_data = conn.get_all_items(collection_name)
@@ -193,10 +274,9 @@ def test_export_import_roundtrip_json(tmp_path, fake_provider_with_name):
     assert len(imported["embeddings"]) == len(original_data["embeddings"])
 
 
-def test_export_import_roundtrip_parquet(tmp_path, fake_provider_with_name):
+def test_export_import_roundtrip_parquet(tmp_path, fake_provider_with_name, svc):
     """Test that export then import preserves data (Parquet)."""
     conn, collection_name = fake_provider_with_name
-    svc = ImportExportService()
 
     # Export original data
     original_data = conn.get_all_items(collection_name)
@@ -211,10 +291,9 @@ def test_export_import_roundtrip_parquet(tmp_path, fake_provider_with_name):
     assert set(imported["ids"]) == set(original_data["ids"])
 
 
-def test_import_and_add_to_provider(tmp_path, empty_fake_provider):
+def test_import_and_add_to_provider(tmp_path, empty_fake_provider, svc):
     """Test importing data and adding it to a FakeProvider collection."""
     conn = empty_fake_provider
-    svc = ImportExportService()
 
     # Create sample JSON
     sample_data = [
@@ -256,11 +335,10 @@ def test_import_and_add_to_provider(tmp_path, empty_fake_provider):
     assert items["metadatas"][0]["source"] == "import"
 
 
-def test_export_to_json_with_numpy_embeddings(tmp_path):
+def test_export_to_json_with_numpy_embeddings(tmp_path, svc):
     """export_to_json converts numpy array embeddings to lists."""
     import numpy as np
 
-    svc = ImportExportService()
     data = {
         "ids": ["id1"],
         "documents": ["doc1"],
@@ -277,11 +355,10 @@ def test_export_to_json_with_numpy_embeddings(tmp_path):
     assert exported[0]["embedding"] == [0.1, 0.2, 0.3]
 
 
-def test_export_to_csv_with_numpy_embeddings(tmp_path):
+def test_export_to_csv_with_numpy_embeddings(tmp_path, svc):
     """export_to_csv converts numpy array embeddings when included."""
     import numpy as np
 
-    svc = ImportExportService()
     data = {
         "ids": ["id1", "id2"],
         "documents": ["doc1", "doc2"],
@@ -292,19 +369,16 @@ def test_export_to_csv_with_numpy_embeddings(tmp_path):
     result = svc.export_to_csv(data, str(csv_path), include_embeddings=True)
     assert result is True
 
-    import pandas as pd
-
-    df = pd.read_csv(csv_path)
-    assert "embedding" in df.columns
-    emb = json.loads(df["embedding"].iloc[0])
+    tbl = pa_csv.read_csv(csv_path)
+    assert "embedding" in tbl.column_names
+    emb = json.loads(tbl.column("embedding")[0].as_py())
     assert isinstance(emb, list)
 
 
-def test_export_to_parquet_with_numpy_embeddings(tmp_path):
+def test_export_to_parquet_with_numpy_embeddings(tmp_path, svc):
     """export_to_parquet converts numpy array embeddings."""
     import numpy as np
 
-    svc = ImportExportService()
     data = {
         "ids": ["id1"],
         "documents": ["doc1"],
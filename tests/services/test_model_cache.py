@@ -1,10 +1,9 @@
 """Tests for embedding model disk caching."""
 
-import json
+import os
 import shutil
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
 
@@ -21,30 +20,86 @@ from vector_inspector.core.model_cache import (
 
 
 @pytest.fixture
-def temp_cache_dir(monkeypatch):
+def temp_cache_dir(tmp_path, monkeypatch):
     """Create a temporary cache directory for testing."""
-    temp_dir = Path(tempfile.mkdtemp(prefix="test_model_cache_"))
-
     # Mock the cache directory getter
-    monkeypatch.setattr("vector_inspector.core.model_cache.get_cache_dir", lambda: temp_dir)
+    monkeypatch.setattr("vector_inspector.core.model_cache.get_cache_dir", lambda: tmp_path)
+
+    return tmp_path
+
+
+_SETTINGS_SERVICE_TARGET = "vector_inspector.services.settings_service.SettingsService"
+
+
+class FakeCacheSettings:
+    """Stateless SettingsService stand-in answering every lookup with one value."""
+
+    def __init__(self, value):
+        self._value = value
 
-    yield temp_dir
+    def get(self, key, default=None):
+        return self._value
 
-    # Cleanup
-    if temp_dir.exists():
-        shutil.rmtree(temp_dir)
+
+# Shared instances: they hold no per-test state, so one of each is enough.
+_CACHE_ENABLED = FakeCacheSettings(True)
+_CACHE_DISABLED = FakeCacheSettings(False)
 
 
 @pytest.fixture
 def mock_settings_enabled(monkeypatch):
     """Mock settings service to enable caching."""
-    mock_settings = Mock()
-    mock_settings.get.return_value = True
-
     # Patch where SettingsService is actually imported and used
-    with patch("vector_inspector.services.settings_service.SettingsService") as MockSettings:
-        MockSettings.return_value = mock_settings
-        yield mock_settings
+    monkeypatch.setattr(_SETTINGS_SERVICE_TARGET, lambda: _CACHE_ENABLED)
+    return _CACHE_ENABLED
+
+
+@pytest.fixture
+def mock_settings_disabled(monkeypatch):
+    """Mock settings service to disable caching."""
+    monkeypatch.setattr(_SETTINGS_SERVICE_TARGET, lambda: _CACHE_DISABLED)
+    return _CACHE_DISABLED
+
+
+# Pre-serialized cache_metadata.json; only original_name varies per model.
+# Test model names contain no JSON-special characters, so plain formatting is safe.
+_CACHE_METADATA_TEMPLATE = (
+    '{{"original_name": "{name}", "model_type": "sentence-transformer", "cached_at": "2024-01-01T00:00:00"}}'
+)
+
+
+def _make_cached_model(model_name, *, with_config=True, model_bytes=0):
+    """Lay out a cache entry for ``model_name`` and return its directory."""
+    cache_path = get_model_cache_path(model_name)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    (cache_path / "cache_metadata.json").write_bytes(_CACHE_METADATA_TEMPLATE.format(name=model_name).encode())
+    if with_config:
+        (cache_path / "config.json").write_bytes(b"{}")
+    if model_bytes:
+        # Extend an empty file instead of writing data: stat() reports the full
+        # size, which is all get_cache_info looks at.
+        model_file = cache_path / "model.bin"
+        model_file.touch()
+        os.truncate(model_file, model_bytes)
+    return cache_path
+
+
+@pytest.fixture(scope="session")
+def fake_saved_dirs(tmp_path_factory):
+    """What save_pretrained would write for a model and for a CLIP processor, built once."""
+    model_dir = tmp_path_factory.mktemp("fake_saved_model")
+    (model_dir / "config.json").write_bytes(b"{}")
+    (model_dir / "model.safetensors").write_bytes(b"fake model data")
+
+    processor_dir = tmp_path_factory.mktemp("fake_saved_processor")
+    (processor_dir / "preprocessor_config.json").write_bytes(b"{}")
+
+    return SimpleNamespace(model=model_dir, processor=processor_dir)
+
+
+def _copy_saved_dir(source):
+    """save_pretrained stand-in that copies a prebuilt directory to the target path."""
+    return lambda path: shutil.copytree(source, path, dirs_exist_ok=True)
 
 
 def test_sanitize_model_name():
@@ -75,62 +130,30 @@ def test_is_cached_not_exists(temp_cache_dir, mock_settings_enabled):
     assert not is_cached("nonexistent-model")
 
 
-def test_is_cached_with_valid_cache(temp_cache_dir, mock_settings_enabled):
-    """Test is_cached returns True for valid cached model."""
+@pytest.fixture
+def cached_model(temp_cache_dir, mock_settings_enabled):
+    """A valid cache entry, as ``(model_name, cache_path)``."""
     model_name = "test-model"
-    cache_path = get_model_cache_path(model_name)
-    cache_path.mkdir(parents=True, exist_ok=True)
+    return model_name, _make_cached_model(model_name)
 
-    # Create metadata
-    metadata = {
-        "original_name": model_name,
-        "model_type": "sentence-transformer",
-        "cached_at": "2024-01-01T00:00:00",
-    }
-    metadata_file = cache_path / "cache_metadata.json"
-    with open(metadata_file, "w") as f:
-        json.dump(metadata, f)
 
-    # Create a dummy model file (config.json)
-    config_file = cache_path / "config.json"
-    config_file.write_text("{}")
+@pytest.mark.parametrize(
+    ("lookup", "returns_path"),
+    [
+        pytest.param(is_cached, False, id="is_cached"),
+        pytest.param(load_cached_path, True, id="load_cached_path"),
+    ],
+)
+def test_lookup_valid_cache(cached_model, lookup, returns_path):
+    """is_cached and load_cached_path both recognise a valid cached model."""
+    model_name, cache_path = cached_model
 
-    assert is_cached(model_name)
+    assert lookup(model_name) == (cache_path if returns_path else True)
 
 
-def test_is_cached_disabled(temp_cache_dir):
+def test_is_cached_disabled(temp_cache_dir, mock_settings_disabled):
     """Test is_cached returns False when caching is disabled."""
-    # Mock settings to disable cache
-    mock_settings = Mock()
-    mock_settings.get.return_value = False
-
-    with patch("vector_inspector.services.settings_service.SettingsService") as MockSettings:
-        MockSettings.return_value = mock_settings
-        assert not is_cached("any-model")
-
-
-def test_load_cached_path_returns_path(temp_cache_dir, mock_settings_enabled):
-    """Test load_cached_path returns path for cached model."""
-    model_name = "test-model"
-    cache_path = get_model_cache_path(model_name)
-    cache_path.mkdir(parents=True, exist_ok=True)
-
-    # Create metadata
-    metadata = {
-        "original_name": model_name,
-        "model_type": "sentence-transformer",
-        "cached_at": "2024-01-01T00:00:00",
-    }
-    metadata_file = cache_path / "cache_metadata.json"
-    with open(metadata_file, "w") as f:
-        json.dump(metadata, f)
-
-    # Create model file
-    config_file = cache_path / "config.json"
-    config_file.write_text("{}")
-
-    result = load_cached_path(model_name)
-    assert result == cache_path
+    assert not is_cached("any-model")
 
 
 def test_load_cached_path_returns_none_not_cached(temp_cache_dir, mock_settings_enabled):
@@ -138,20 +161,13 @@ def test_load_cached_path_returns_none_not_cached(temp_cache_dir, mock_settings_
     assert load_cached_path("nonexistent-model") is None
 
 
-def test_save_model_to_cache_with_save_pretrained(temp_cache_dir, mock_settings_enabled):
+def test_save_model_to_cache_with_save_pretrained(temp_cache_dir, mock_settings_enabled, fake_saved_dirs):
     """Test saving a model that has save_pretrained method."""
     model_name = "test-model"
 
-    # Create mock model with save_pretrained that creates files
+    # Create mock model whose save_pretrained lays down model files
     mock_model = Mock()
-
-    def mock_save(path):
-        # Simulate save_pretrained creating model files
-        Path(path).mkdir(parents=True, exist_ok=True)
-        (Path(path) / "config.json").write_text("{}")
-        (Path(path) / "model.safetensors").write_bytes(b"fake model data")
-
-    mock_model.save_pretrained = Mock(side_effect=mock_save)
+    mock_model.save_pretrained = Mock(side_effect=_copy_saved_dir(fake_saved_dirs.model))
 
     result = save_model_to_cache(mock_model, model_name, "sentence-transformer")
 
@@ -160,27 +176,15 @@ def test_save_model_to_cache_with_save_pretrained(temp_cache_dir, mock_settings_
     mock_model.save_pretrained.assert_called_once()
 
 
-def test_save_model_to_cache_tuple(temp_cache_dir, mock_settings_enabled):
+def test_save_model_to_cache_tuple(temp_cache_dir, mock_settings_enabled, fake_saved_dirs):
     """Test saving a tuple (model, processor) like CLIP."""
     model_name = "test-clip-model"
 
     # Create mock model and processor
     mock_model = Mock()
     mock_processor = Mock()
-
-    def mock_model_save(path):
-        # Simulate model save_pretrained
-        Path(path).mkdir(parents=True, exist_ok=True)
-        (Path(path) / "config.json").write_text("{}")
-        (Path(path) / "model.safetensors").write_bytes(b"fake model")
-
-    def mock_processor_save(path):
-        # Simulate processor save_pretrained
-        Path(path).mkdir(parents=True, exist_ok=True)
-        (Path(path) / "preprocessor_config.json").write_text("{}")
-
-    mock_model.save_pretrained = Mock(side_effect=mock_model_save)
-    mock_processor.save_pretrained = Mock(side_effect=mock_processor_save)
+    mock_model.save_pretrained = Mock(side_effect=_copy_saved_dir(fake_saved_dirs.model))
+    mock_processor.save_pretrained = Mock(side_effect=_copy_saved_dir(fake_saved_dirs.processor))
 
     result = save_model_to_cache((mock_model, mock_processor), model_name, "clip")
 
@@ -203,40 +207,22 @@ def test_save_model_to_cache_no_method(temp_cache_dir, mock_settings_enabled):
     assert not is_cached(model_name)
 
 
-def test_save_model_to_cache_disabled(temp_cache_dir):
+def test_save_model_to_cache_disabled(temp_cache_dir, mock_settings_disabled):
     """Test saving does nothing when caching is disabled."""
-    # Mock settings to disable cache
-    mock_settings = Mock()
-    mock_settings.get.return_value = False
-
-    with patch("vector_inspector.services.settings_service.SettingsService") as MockSettings:
-        MockSettings.return_value = mock_settings
-
-        mock_model = Mock()
-        mock_model.save_pretrained = Mock()
+    mock_model = Mock()
+    mock_model.save_pretrained = Mock()
 
-        result = save_model_to_cache(mock_model, "test-model", "sentence-transformer")
+    result = save_model_to_cache(mock_model, "test-model", "sentence-transformer")
 
-        assert not result
-        mock_model.save_pretrained.assert_not_called()
+    assert not result
+    mock_model.save_pretrained.assert_not_called()
 
 
 def test_clear_cache_all(temp_cache_dir, mock_settings_enabled):
     """Test clearing all cached models."""
     # Create some cached models
     for i in range(3):
-        model_name = f"test-model-{i}"
-        cache_path = get_model_cache_path(model_name)
-        cache_path.mkdir(parents=True, exist_ok=True)
-
-        metadata = {
-            "original_name": model_name,
-            "model_type": "sentence-transformer",
-            "cached_at": "2024-01-01T00:00:00",
-        }
-        metadata_file = cache_path / "cache_metadata.json"
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f)
+        _make_cached_model(f"test-model-{i}", with_config=False)
 
     assert temp_cache_dir.exists()
 
@@ -253,20 +239,7 @@ def test_clear_cache_specific_model(temp_cache_dir, mock_settings_enabled):
 
     # Create two cached models
     for model_name in [model1, model2]:
-        cache_path = get_model_cache_path(model_name)
-        cache_path.mkdir(parents=True, exist_ok=True)
-
-        metadata = {
-            "original_name": model_name,
-            "model_type": "sentence-transformer",
-            "cached_at": "2024-01-01T00:00:00",
-        }
-        metadata_file = cache_path / "cache_metadata.json"
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f)
-
-        config_file = cache_path / "config.json"
-        config_file.write_text("{}")
+        _make_cached_model(model_name)
 
     assert is_cached(model1)
     assert is_cached(model2)
@@ -293,22 +266,7 @@ def test_get_cache_info_with_models(temp_cache_dir, mock_settings_enabled):
     """Test get_cache_info with cached models."""
     # Create some cached models
     for i in range(2):
-        model_name = f"test-model-{i}"
-        cache_path = get_model_cache_path(model_name)
-        cache_path.mkdir(parents=True, exist_ok=True)
-
-        metadata = {
-            "original_name": model_name,
-            "model_type": "sentence-transformer",
-            "cached_at": "2024-01-01T00:00:00",
-        }
-        metadata_file = cache_path / "cache_metadata.json"
-        with open(metadata_file, "w") as f:
-            json.dump(metadata, f)
-
-        # Create a dummy file with known size
-        dummy_file = cache_path / "model.bin"
-        dummy_file.write_bytes(b"x" * 1024 * 100)  # 100 KB
+        _make_cached_model(f"test-model-{i}", with_config=False, model_bytes=1024 * 100)  # 100 KB
 
     info = get_cache_info()
 
@@ -318,11 +276,14 @@ def test_get_cache_info_with_models(temp_cache_dir, mock_settings_enabled):
     assert info["total_size_mb"] > 0
 
 
-def test_is_cache_enabled_default():
+def test_is_cache_enabled_default(monkeypatch):
     """Test is_cache_enabled returns True by default (no settings)."""
-    with patch("vector_inspector.services.settings_service.SettingsService") as mock_service:
-        mock_service.side_effect = Exception("No settings")
-        assert is_cache_enabled()
+
+    def _no_settings():
+        raise Exception("No settings")
+
+    monkeypatch.setattr(_SETTINGS_SERVICE_TARGET, _no_settings)
+    assert is_cache_enabled()
 
 
 def test_atomic_save_on_error(temp_cache_dir, mock_settings_enabled):
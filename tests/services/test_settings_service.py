@@ -7,14 +7,10 @@ from vector_inspector.services.settings_service import SettingsService
 
 
 @pytest.fixture()
-def temp_home(tmp_path):
+def temp_home(tmp_path, monkeypatch):
     # Monkeypatch Path.home() to point to a temporary directory for isolation
-    original_home = Path.home
-    Path.home = lambda: tmp_path  # type: ignore
-    try:
-        yield tmp_path
-    finally:
-        Path.home = original_home  # restore
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: tmp_path))
+    return tmp_path
 
 
 def test_last_connection_roundtrip(temp_home):
@@ -1,28 +1,112 @@
-def make_fake_connection(success=True, raise_exc=False):
-    class Fake:
-        def __init__(self):
-            self.connected = False
+import warnings
 
-        def connect(self):
-            if raise_exc:
-                raise RuntimeError("connect fail")
-            self.connected = success
-            return success
+import pytest
 
-        def list_collections(self):
-            if raise_exc:
-                raise RuntimeError("list fail")
-            return ["c1", "c2"]
+from vector_inspector.ui.views import connection_view as mod
+
+
+class FakeConnection:
+    """Connection stub whose connect() returns success, or raises when raise_exc is set."""
+
+    def __init__(self, success=True, raise_exc=False):
+        self.success = success
+        self.raise_exc = raise_exc
+        self.connected = False
+
+    def connect(self):
+        if self.raise_exc:
+            raise RuntimeError("connect fail")
+        self.connected = self.success
+        return self.success
+
+    def list_collections(self):
+        if self.raise_exc:
+            raise RuntimeError("list fail")
+        return ["c1", "c2"]
+
+    def disconnect(self):
+        self.connected = False
+
+
+_DIALOG_LINE_EDITS = (
+    "path_input",
+    "host_input",
+    "port_input",
+    "database_input",
+    "user_input",
+    "password_input",
+    "api_key_input",
+)
+
+
+# Widget construction dominates these tests, so one ConnectionDialog and one
+# ConnectionView are shared by the module. Tests that must patch
+# SettingsService before construction still build their own.
+
+
+@pytest.fixture(scope="module")
+def _shared_dialog(qapp):
+    dialog = mod.ConnectionDialog()
+    initial = {
+        "provider_index": dialog.provider_combo.currentIndex(),
+        "type_radio": dialog.button_group.checkedButton(),
+        "texts": {name: getattr(dialog, name).text() for name in _DIALOG_LINE_EDITS},
+        "auto_connect": dialog.auto_connect_check.isChecked(),
+    }
+    yield dialog, initial
+    dialog.deleteLater()
+
+
+@pytest.fixture
+def dialog(_shared_dialog):
+    """Shared ConnectionDialog; provider, connection type and inputs are restored afterwards."""
+    dialog, initial = _shared_dialog
+    yield dialog
+    dialog.provider_combo.setCurrentIndex(initial["provider_index"])
+    initial["type_radio"].setChecked(True)
+    for name, text in initial["texts"].items():
+        getattr(dialog, name).setText(text)
+    dialog.auto_connect_check.setChecked(initial["auto_connect"])
+    # Re-derive provider and enabled fields from the restored widgets
+    dialog._on_provider_changed()
+    dialog._on_type_changed()
 
-        def disconnect(self):
-            self.connected = False
 
-    return Fake()
+@pytest.fixture(scope="module")
+def provider_indices(_shared_dialog):
+    """Provider id -> combo index, read once from the shared dialog."""
+    combo = _shared_dialog[0].provider_combo
+    return {combo.itemData(i): i for i in range(combo.count())}
+
+
+@pytest.fixture(scope="module")
+def _shared_view(qapp):
+    view = mod.ConnectionView()
+    yield view
+    view.deleteLater()
+
+
+@pytest.fixture
+def view(_shared_view):
+    """Shared ConnectionView, returned to the disconnected state afterwards."""
+    yield _shared_view
+    _shared_view.loading_dialog.hide_loading()
+    _shared_view.connection = None
+    _shared_view.connection_thread = None
+    _shared_view.status_label.setText("Status: Not connected")
+    _shared_view.connect_button.setEnabled(True)
+    _shared_view.disconnect_button.setEnabled(False)
+    # Drop the receivers tests attached; disconnect() warns when there are none
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        try:
+            _shared_view.connection_changed.disconnect()
+        except (RuntimeError, TypeError):
+            pass
 
 
 def test_connection_thread_success(monkeypatch):
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    fake = make_fake_connection(success=True)
+    fake = FakeConnection(success=True)
     t = mod.ConnectionThread(fake)
     captured = {}
 
@@ -37,8 +121,7 @@ def test_connection_thread_success(monkeypatch):
 
 
 def test_connection_thread_exception(monkeypatch):
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    fake = make_fake_connection(raise_exc=True)
+    fake = FakeConnection(raise_exc=True)
     t = mod.ConnectionThread(fake)
     captured = {}
 
@@ -50,13 +133,9 @@ def test_connection_thread_exception(monkeypatch):
     assert captured.get("ok") is False
 
 
-def test_get_connection_config_and_browse(monkeypatch, tmp_path, qtbot):
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    dialog = mod.ConnectionDialog()
-    qtbot.addWidget(dialog)
+def test_get_connection_config_and_browse(monkeypatch, tmp_path, dialog, provider_indices):
     # Pinecone branch
-    idx = dialog.provider_combo.findData("pinecone")
-    dialog.provider_combo.setCurrentIndex(idx)
+    dialog.provider_combo.setCurrentIndex(provider_indices["pinecone"])
     dialog.api_key_input.setText("key123")
     cfg = dialog.get_connection_config()
     assert cfg["provider"] == "pinecone"
@@ -74,71 +153,39 @@ def test_get_connection_config_and_browse(monkeypatch, tmp_path, qtbot):
     assert dialog.path_input.text() != ""
 
 
-def test_provider_changes_enable_fields(qtbot):
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    dialog = mod.ConnectionDialog()
-    qtbot.addWidget(dialog)
-    # pgvector enables host/port/database fields
-    idx = dialog.provider_combo.findData("pgvector")
-    dialog.provider_combo.setCurrentIndex(idx)
+@pytest.mark.parametrize(
+    ("provider", "field_states"),
+    [
+        pytest.param(
+            "pgvector",
+            {"host_input": True, "database_input": True, "path_input": False, "api_key_input": False},
+            id="pgvector",
+        ),
+        pytest.param(
+            "pinecone",
+            {"api_key_input": True, "path_input": False, "host_input": False, "database_input": False},
+            id="pinecone",
+        ),
+        pytest.param(
+            # else branch: connection type radios are enabled, PgVector fields are not
+            "qdrant",
+            {"persistent_radio": True, "http_radio": True, "ephemeral_radio": True, "database_input": False},
+            id="qdrant",
+        ),
+    ],
+)
+def test_provider_changes_enable_fields(dialog, provider_indices, provider, field_states):
+    """Switching provider enables exactly the fields that provider uses."""
+    dialog.provider_combo.setCurrentIndex(provider_indices[provider])
     dialog._on_provider_changed()
-    assert dialog.host_input.isEnabled()
-    assert dialog.database_input.isEnabled()
 
+    for name, enabled in field_states.items():
+        assert getattr(dialog, name).isEnabled() is enabled, name
 
-def test_connect_with_config_success(monkeypatch, qtbot):
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
 
-    # Replace real connection classes with simple fakes
-    class FakeConn:
-        def __init__(self, **kwargs):
-            self.host = kwargs.get("host")
-            self.port = kwargs.get("port")
-            self.path = kwargs.get("path")
-            self.is_connected = True
-
-        def connect(self):
-            return True
-
-        def list_collections(self):
-            return ["x"]
-
-        def disconnect(self):
-            self.is_connected = False
-
-    monkeypatch.setattr(mod, "ChromaDBConnection", FakeConn)
-    monkeypatch.setattr(mod, "QdrantConnection", FakeConn)
-    monkeypatch.setattr(mod, "PgVectorConnection", FakeConn)
-    monkeypatch.setattr(mod, "PineconeConnection", FakeConn)
-
-    # Fake thread that immediately emits finished
-    class Emittable:
-        def __init__(self):
-            self._cb = None
-
-        def connect(self, cb):
-            self._cb = cb
-
-        def emit(self, *a, **k):
-            if self._cb:
-                self._cb(*a, **k)
-
-    class FakeThread:
-        def __init__(self, connection):
-            self.connection = connection
-            self.finished = Emittable()
-
-        def start(self):
-            try:
-                self.finished.emit(True, ["a", "b"])  # type: ignore
-            except Exception:
-                pass
-
-    # Monkeypatch ConnectionThread used in _connect_with_config
-    monkeypatch.setattr(mod, "ConnectionThread", FakeThread)
-
-    view = mod.ConnectionView()
-    qtbot.addWidget(view)
+def test_connect_with_config_success(monkeypatch, view):
+    # Replace real connection classes and ConnectionThread with synchronous fakes
+    _make_fake_connection_view_dependencies(monkeypatch, mod)
 
     # Connect with chromadb persistent
     cfg = {"provider": "chromadb", "type": "persistent", "path": "./data"}
@@ -147,11 +194,7 @@ def test_connect_with_config_success(monkeypatch, qtbot):
     assert "Connected" in view.status_label.text()
 
 
-def test_connect_with_config_missing_api_key(monkeypatch, qtbot):
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    view = mod.ConnectionView()
-    qtbot.addWidget(view)
-
+def test_connect_with_config_missing_api_key(monkeypatch, view):
     # QMessageBox is imported lazily inside _connect_with_config, so patch it on
     # the PySide6.QtWidgets module (a Python module object, not a Shiboken type).
     import PySide6.QtWidgets as _qtw
@@ -171,8 +214,7 @@ def test_connect_with_config_missing_api_key(monkeypatch, qtbot):
 
 def test_connection_thread_connect_returns_false():
     """connect() returns False (no exception) emits finished(False, [])."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    fake = make_fake_connection(success=False)
+    fake = FakeConnection(success=False)
     t = mod.ConnectionThread(fake)
     captured = {}
 
@@ -186,60 +228,21 @@ def test_connection_thread_connect_returns_false():
     assert captured.get("cols") == []
 
 
-def test_on_provider_changed_port_updates(qtbot):
+def test_on_provider_changed_port_updates(dialog, provider_indices):
     """switching provider updates port defaults."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    dialog = mod.ConnectionDialog()
-    qtbot.addWidget(dialog)
-
     # Start at chromadb with default port 8000
     dialog.port_input.setText("8000")
-    idx = dialog.provider_combo.findData("qdrant")
-    dialog.provider_combo.setCurrentIndex(idx)  # triggers _on_provider_changed
+    dialog.provider_combo.setCurrentIndex(provider_indices["qdrant"])  # triggers _on_provider_changed
     # Qdrant with port "8000" → changes to "6333"
     assert dialog.port_input.text() == "6333"
 
     # Switch back to chromadb: port "6333" → "8000"
-    idx = dialog.provider_combo.findData("chromadb")
-    dialog.provider_combo.setCurrentIndex(idx)
+    dialog.provider_combo.setCurrentIndex(provider_indices["chromadb"])
     assert dialog.port_input.text() == "8000"
 
 
-def test_on_provider_changed_pinecone_branch(qtbot):
-    """switching to Pinecone disables path/host/port, enables api_key."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    dialog = mod.ConnectionDialog()
-    qtbot.addWidget(dialog)
-
-    idx = dialog.provider_combo.findData("pinecone")
-    dialog.provider_combo.setCurrentIndex(idx)
-    dialog._on_provider_changed()
-
-    assert not dialog.path_input.isEnabled()
-    assert not dialog.host_input.isEnabled()
-    assert dialog.api_key_input.isEnabled()
-
-
-def test_on_provider_changed_qdrant_else_branch(qtbot):
-    """else branch for qdrant provider enables radio buttons."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    dialog = mod.ConnectionDialog()
-    qtbot.addWidget(dialog)
-
-    idx = dialog.provider_combo.findData("qdrant")
-    dialog.provider_combo.setCurrentIndex(idx)
-
-    assert dialog.persistent_radio.isEnabled()
-    assert dialog.http_radio.isEnabled()
-    assert dialog.ephemeral_radio.isEnabled()
-
-
-def test_on_type_changed_pinecone(qtbot):
+def test_on_type_changed_pinecone(dialog):
     """_on_type_changed for pinecone enables api_key, disables rest."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    dialog = mod.ConnectionDialog()
-    qtbot.addWidget(dialog)
-
     dialog.provider = "pinecone"
     dialog._on_type_changed()
 
@@ -248,12 +251,8 @@ def test_on_type_changed_pinecone(qtbot):
     assert not dialog.database_input.isEnabled()
 
 
-def test_on_type_changed_pgvector(qtbot):
+def test_on_type_changed_pgvector(dialog):
     """_on_type_changed for pgvector enables host/port/db."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    dialog = mod.ConnectionDialog()
-    qtbot.addWidget(dialog)
-
     dialog.provider = "pgvector"
     dialog._on_type_changed()
 
@@ -262,12 +261,8 @@ def test_on_type_changed_pgvector(qtbot):
     assert dialog.database_input.isEnabled()
 
 
-def test_on_type_changed_http_and_ephemeral(qtbot):
+def test_on_type_changed_http_and_ephemeral(dialog):
     """_on_type_changed for http and ephemeral."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    dialog = mod.ConnectionDialog()
-    qtbot.addWidget(dialog)
-
     dialog.provider = "chromadb"
     dialog.http_radio.setChecked(True)
     dialog._on_type_changed()
@@ -280,14 +275,9 @@ def test_on_type_changed_http_and_ephemeral(qtbot):
     assert not dialog.path_input.isEnabled()
 
 
-def test_get_connection_config_pgvector(qtbot):
+def test_get_connection_config_pgvector(dialog, provider_indices):
     """get_connection_config PgVector branch."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    dialog = mod.ConnectionDialog()
-    qtbot.addWidget(dialog)
-
-    idx = dialog.provider_combo.findData("pgvector")
-    dialog.provider_combo.setCurrentIndex(idx)
+    dialog.provider_combo.setCurrentIndex(provider_indices["pgvector"])
     dialog.port_input.setText("5432")
     cfg = dialog.get_connection_config()
     assert cfg["provider"] == "pgvector"
@@ -295,14 +285,10 @@ def test_get_connection_config_pgvector(qtbot):
     assert cfg["port"] == 5432
 
 
-def test_get_connection_config_http_and_ephemeral(qtbot):
+def test_get_connection_config_http_and_ephemeral(dialog, provider_indices):
     """get_connection_config http and ephemeral branches."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
-    dialog = mod.ConnectionDialog()
-    qtbot.addWidget(dialog)
-
     # HTTP branch
-    dialog.provider_combo.setCurrentIndex(dialog.provider_combo.findData("chromadb"))
+    dialog.provider_combo.setCurrentIndex(provider_indices["chromadb"])
     dialog.http_radio.setChecked(True)
     dialog.host_input.setText("my-host")
     dialog.port_input.setText("9000")
@@ -319,7 +305,6 @@ def test_get_connection_config_http_and_ephemeral(qtbot):
 
 def test_load_last_connection_cloud(monkeypatch, qtbot):
     """_load_last_connection cloud (Pinecone) branch."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
 
     class FakeSettings:
         def get_last_connection(self):
@@ -337,7 +322,6 @@ def test_load_last_connection_cloud(monkeypatch, qtbot):
 
 def test_load_last_connection_pgvector(monkeypatch, qtbot):
     """_load_last_connection pgvector branch."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
 
     class FakeSettings:
         def get_last_connection(self):
@@ -365,7 +349,6 @@ def test_load_last_connection_pgvector(monkeypatch, qtbot):
 
 def test_load_last_connection_http(monkeypatch, qtbot):
     """_load_last_connection http branch."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
 
     class FakeSettings:
         def get_last_connection(self):
@@ -391,7 +374,6 @@ def test_load_last_connection_http(monkeypatch, qtbot):
 
 def test_load_last_connection_ephemeral(monkeypatch, qtbot):
     """_load_last_connection ephemeral branch + auto_connect."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
 
     class FakeSettings:
         def get_last_connection(self):
@@ -455,50 +437,34 @@ def _make_fake_connection_view_dependencies(monkeypatch, mod):
     return FakeConn, SyncThread
 
 
-def test_connect_with_config_qdrant_persistent(monkeypatch, qtbot):
+def test_connect_with_config_qdrant_persistent(monkeypatch, view):
     """_connect_with_config qdrant persistent branch."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
     _make_fake_connection_view_dependencies(monkeypatch, mod)
 
-    view = mod.ConnectionView()
-    qtbot.addWidget(view)
-
     view._connect_with_config({"provider": "qdrant", "type": "persistent", "path": "./data"})
     assert "Connected" in view.status_label.text()
 
 
-def test_connect_with_config_qdrant_http(monkeypatch, qtbot):
+def test_connect_with_config_qdrant_http(monkeypatch, view):
     """_connect_with_config qdrant http branch."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
     _make_fake_connection_view_dependencies(monkeypatch, mod)
 
-    view = mod.ConnectionView()
-    qtbot.addWidget(view)
-
     view._connect_with_config({"provider": "qdrant", "type": "http", "host": "host", "port": 6333, "api_key": "k"})
     assert "Connected" in view.status_label.text()
 
 
-def test_connect_with_config_qdrant_ephemeral(monkeypatch, qtbot):
+def test_connect_with_config_qdrant_ephemeral(monkeypatch, view):
     """_connect_with_config qdrant ephemeral branch."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
     _make_fake_connection_view_dependencies(monkeypatch, mod)
 
-    view = mod.ConnectionView()
-    qtbot.addWidget(view)
-
     view._connect_with_config({"provider": "qdrant", "type": "ephemeral"})
     assert "Connected" in view.status_label.text()
 
 
-def test_connect_with_config_pgvector(monkeypatch, qtbot):
+def test_connect_with_config_pgvector(monkeypatch, view):
     """_connect_with_config pgvector branch."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
     _make_fake_connection_view_dependencies(monkeypatch, mod)
 
-    view = mod.ConnectionView()
-    qtbot.addWidget(view)
-
     view._connect_with_config(
         {
             "provider": "pgvector",
@@ -512,14 +478,10 @@ def test_connect_with_config_pgvector(monkeypatch, qtbot):
     assert "Connected" in view.status_label.text()
 
 
-def test_on_connection_finished_failure(monkeypatch, qtbot):
+def test_on_connection_finished_failure(monkeypatch, view):
     """_on_connection_finished failure path."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
     _make_fake_connection_view_dependencies(monkeypatch, mod)
 
-    view = mod.ConnectionView()
-    qtbot.addWidget(view)
-
     emitted = []
     view.connection_changed.connect(lambda ok: emitted.append(ok))
     view._on_connection_finished(False, [])
@@ -530,14 +492,10 @@ def test_on_connection_finished_failure(monkeypatch, qtbot):
     assert emitted == [False]
 
 
-def test_disconnect(monkeypatch, qtbot):
+def test_disconnect(monkeypatch, view):
     """_disconnect updates UI and emits signal."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
     _make_fake_connection_view_dependencies(monkeypatch, mod)
 
-    view = mod.ConnectionView()
-    qtbot.addWidget(view)
-
     # First connect
     view._connect_with_config({"provider": "chromadb", "type": "persistent", "path": "./data"})
 
@@ -553,7 +511,6 @@ def test_disconnect(monkeypatch, qtbot):
 
 def test_try_auto_connect(monkeypatch, qtbot):
     """_try_auto_connect connects when auto_connect is True."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
     _make_fake_connection_view_dependencies(monkeypatch, mod)
 
     class FakeSettings:
@@ -571,9 +528,8 @@ def test_try_auto_connect(monkeypatch, qtbot):
     assert "Connected" in view.status_label.text()
 
 
-def test_show_connection_dialog_accepted(monkeypatch, qtbot):
+def test_show_connection_dialog_accepted(monkeypatch, view):
     """show_connection_dialog when dialog is accepted."""
-    mod = __import__("vector_inspector.ui.views.connection_view", fromlist=["*"])
     _make_fake_connection_view_dependencies(monkeypatch, mod)
 
     captured_config = {}
@@ -592,8 +548,6 @@ def test_show_connection_dialog_accepted(monkeypatch, qtbot):
 
     monkeypatch.setattr(mod, "ConnectionDialog", FakeDialog)
 
-    view = mod.ConnectionView()
-    qtbot.addWidget(view)
     view.show_connection_dialog()
 
     assert "Connected" in view.status_label.text()
@@ -6,7 +6,7 @@ import pytest
 
 from vector_inspector.services import ThreadedTaskRunner
 from vector_inspector.state import AppState
-from vector_inspector.ui.views.demo_collection_view import DemoCollectionView
+from vector_inspector.ui.views.demo_collection_view import DOCUMENT_PREVIEW_CHARS, DemoCollectionView
 
 
 @pytest.fixture
@@ -161,9 +161,9 @@ def test_demo_view_populates_table_correctly(demo_view, app_state):
     assert demo_view.table.item(0, 0).text() == "id1"
     assert demo_view.table.item(1, 0).text() == "id2"
 
-    # Check that long document is truncated
-    doc_text = demo_view.table.item(1, 2).text()
-    assert len(doc_text) <= 103  # 100 chars + "..."
+    # Check that long document is truncated to the preview bound plus ellipsis
+    assert demo_view.table.item(0, 2).text() == "Short doc"
+    assert demo_view.table.item(1, 2).text() == "A" * DOCUMENT_PREVIEW_CHARS + "..."
 
 
 def test_demo_view_integration_with_task_runner(demo_view, app_state, task_runner, qtbot):
@@ -1,82 +1,143 @@
-def make_fake_connection(return_info=None, raise_exc=False):
-    class Fake:
-        def __init__(self):
-            self.is_connected = True
-            self.id = "fake-db"
-            self.name = "fake"
-
-        def get_collection_info(self, name):
-            if raise_exc:
-                raise RuntimeError("boom")
-            return return_info
-
-        def get_embedding_model(self, coll):
-            return None
+from unittest.mock import MagicMock
 
-        def list_collections(self):
-            return ["a", "b"]
+import pytest
 
-    return Fake()
+from vector_inspector.services import settings_service
+from vector_inspector.ui import dialogs
+from vector_inspector.ui.components import loading_dialog
+from vector_inspector.ui.views import info_panel as mod
 
+# Keep the tests on one xdist worker to avoid rebuilding the shared InfoPanel per worker
+pytestmark = pytest.mark.xdist_group(name="qt_info_panel")
 
-def make_fake_app_state():
-    class S:
-        def __init__(self):
-            self.provider = None
-            self.cache_manager = type(
-                "C",
-                (),
-                {"get": lambda *a, **k: None, "invalidate": lambda *a, **k: None, "update": lambda *a, **k: None},
-            )()
-            self.database = "conn-id"
 
-            # simple signals
-            class Sig:
-                def connect(self, fn):
-                    pass
+class FakeConnection:
+    """Connection stub returning return_info from get_collection_info, or raising when raise_exc is set."""
 
-            self.provider_changed = Sig()
-            self.collection_changed = Sig()
+    def __init__(self, return_info=None, raise_exc=False):
+        self.return_info = return_info
+        self.raise_exc = raise_exc
+        self.is_connected = True
+        self.id = "fake-db"
+        self.name = "fake"
 
-    return S()
+    def get_collection_info(self, name):
+        if self.raise_exc:
+            raise RuntimeError("boom")
+        return self.return_info
 
+    def get_embedding_model(self, coll):
+        return None
 
-def test_model_config_thread_success(monkeypatch):
-    mod = __import__("vector_inspector.ui.views.info_panel", fromlist=["*"])
-    conn = make_fake_connection(return_info={"vector_dimension": 128})
-    t = mod.ModelConfigPreparationThread(conn, "coll")
+    def list_collections(self):
+        return ["a", "b"]
+
+
+class _Sig:
+    def connect(self, fn):
+        pass
+
+
+class _Emittable:
+    """Signal stub that calls its one connected callback synchronously on emit()."""
+
+    def __init__(self):
+        self._cb = None
+
+    def connect(self, cb):
+        self._cb = cb
+
+    def emit(self, *a, **k):
+        if self._cb:
+            self._cb(*a, **k)
+
+
+class _NullCache:
+    def get(self, *a, **k):
+        return None
+
+    def invalidate(self, *a, **k):
+        pass
+
+    def update(self, *a, **k):
+        pass
+
+
+class FakeAppState:
+    """AppState stub with no provider, a no-op cache manager and inert signals."""
+
+    def __init__(self):
+        self.provider = None
+        self.cache_manager = _NullCache()
+        self.database = "conn-id"
+        self.provider_changed = _Sig()
+        self.collection_changed = _Sig()
+
+
+def _stub_connection(get_embedding_model=None, **attrs):
+    """Connection mock limited to attrs plus get_embedding_model, which returns the given model."""
+    conn = MagicMock(spec=[*attrs, "get_embedding_model"])
+    for name, value in attrs.items():
+        setattr(conn, name, value)
+    conn.get_embedding_model.return_value = get_embedding_model
+    return conn
 
-    captured = {}
 
-    def on_finished(info):
-        captured["info"] = info
+def _stub_cache(cached=None):
+    """Cache manager mock whose get() returns cached."""
+    cache = MagicMock(spec=["get", "invalidate", "update"])
+    cache.get.return_value = cached
+    return cache
 
-    t.finished.connect(on_finished)
-    # run synchronously
-    t.run()
-    assert "info" in captured
 
+# InfoPanel construction builds every row widget, so one panel is shared by the
+# module and its per-collection state is reset after each test.
 
-def test_model_config_thread_error(monkeypatch):
-    mod = __import__("vector_inspector.ui.views.info_panel", fromlist=["*"])
-    conn = make_fake_connection(raise_exc=True)
+
+@pytest.fixture(scope="module")
+def _shared_panel(qapp):
+    panel = mod.InfoPanel(FakeAppState(), None)
+    yield panel, panel.cache_manager
+    panel.deleteLater()
+
+
+@pytest.fixture
+def panel(_shared_panel):
+    """Shared InfoPanel; connection, collection and cache manager are restored afterwards."""
+    panel, cache_manager = _shared_panel
+    yield panel
+    panel.connection = None
+    panel.cache_manager = cache_manager
+    panel.connection_id = ""
+    panel.current_collection = ""
+    panel.current_database = ""
+    panel.model_config_thread = None
+    panel.collection_info_thread = None
+
+
+def test_model_config_thread_success(qtbot):
+    conn = FakeConnection(return_info={"vector_dimension": 128})
     t = mod.ModelConfigPreparationThread(conn, "coll")
 
-    captured = {}
+    with qtbot.waitSignal(t.finished, timeout=3000) as blocker:
+        t.start()
+    t.wait()
+
+    assert blocker.args[0]["vector_dimension"] == 128
+
+
+def test_model_config_thread_error(qtbot):
+    conn = FakeConnection(raise_exc=True)
+    t = mod.ModelConfigPreparationThread(conn, "coll")
 
-    def on_error(msg):
-        captured["err"] = msg
+    with qtbot.waitSignal(t.error, timeout=3000) as blocker:
+        t.start()
+    t.wait()
 
-    t.error.connect(on_error)
-    t.run()
-    assert "err" in captured
+    assert "boom" in blocker.args[0]
 
 
-def test_refresh_database_info_no_connection(qtbot):
-    mod = __import__("vector_inspector.ui.views.info_panel", fromlist=["*"])
-    app_state = make_fake_app_state()
-    panel = mod.InfoPanel(app_state, None)
-    qtbot.addWidget(panel)
+def test_refresh_database_info_no_connection(panel):
     # Ensure no provider
     panel.connection = None
     panel.refresh_database_info()
@@ -84,98 +145,50 @@ def test_refresh_database_info_no_connection(qtbot):
     assert "Not connected" in panel.provider_label.property("value_label").text()
 
 
-def test_refresh_database_info_with_backend(qtbot):
-    mod = __import__("vector_inspector.ui.views.info_panel", fromlist=["*"])
-    app_state = make_fake_app_state()
-    fake = make_fake_connection(return_info={"vector_dimension": 64})
-    panel = mod.InfoPanel(app_state, None)
-    qtbot.addWidget(panel)
+def test_refresh_database_info_with_backend(panel):
+    fake = FakeConnection(return_info={"vector_dimension": 64})
     panel.connection = fake
     panel.refresh_database_info()
     # collections count should update
     assert panel.collections_count_label.property("value_label").text() in ("2",)
 
 
-def test_display_collection_info_provider_variants(qtbot, monkeypatch):
-    mod = __import__("vector_inspector.ui.views.info_panel", fromlist=["*"])
-    app_state = make_fake_app_state()
-    panel = mod.InfoPanel(app_state, None)
-    qtbot.addWidget(panel)
+def test_display_collection_info_provider_variants(panel, monkeypatch):
 
     # Chroma-like backend
     class Chroma:
         pass
 
-    panel.connection = type(
-        "CI",
-        (),
-        {
-            "database": Chroma(),
-            "is_connected": True,
-            "name": "c",
-            "id": "cid",
-            "get_embedding_model": lambda self, coll: None,
-        },
-    )()
+    panel.connection = _stub_connection(database=Chroma(), is_connected=True, name="c", id="cid")
     info = {"vector_dimension": 32, "metadata_fields": ["a", "b"], "count": 10}
     panel.current_collection = "coll"
     panel._display_collection_info(info)
     assert "No metadata fields" not in panel.schema_label.text()
 
 
-def test_set_collection_cache_hit(monkeypatch, qtbot):
-    mod = __import__("vector_inspector.ui.views.info_panel", fromlist=["*"])
-    app_state = make_fake_app_state()
-
+def test_set_collection_cache_hit(monkeypatch, panel):
     # fake cached object
     class Cached:
         def __init__(self, data):
             self.user_inputs = {"collection_info": data}
 
-    cache = type(
-        "C",
-        (),
-        {
-            "get": staticmethod(lambda a, b: Cached({"vector_dimension": 16, "metadata_fields": []})),
-            "invalidate": lambda *a, **k: None,
-            "update": lambda *a, **k: None,
-        },
-    )()
-    app_state.cache_manager = cache
-    panel = mod.InfoPanel(app_state, None)
-    qtbot.addWidget(panel)
+    panel.cache_manager = _stub_cache(Cached({"vector_dimension": 16, "metadata_fields": []}))
     panel.set_collection("coll", "dbid")
     # Should have set current_collection and shown auto-detect or similar
     assert panel.current_collection == "coll"
 
 
-def test_refresh_collection_info_uses_thread(monkeypatch, qtbot):
-    mod = __import__("vector_inspector.ui.views.info_panel", fromlist=["*"])
-    app_state = make_fake_app_state()
-    panel = mod.InfoPanel(app_state, None)
-    qtbot.addWidget(panel)
-
+def test_refresh_collection_info_uses_thread(monkeypatch, panel):
     # fake connection
-    fake_conn = make_fake_connection(return_info={"vector_dimension": 8})
+    fake_conn = FakeConnection(return_info={"vector_dimension": 8})
     panel.connection = fake_conn
     panel.current_collection = "coll"
 
     # Replace CollectionInfoLoadThread with one that immediately emits finished
-    class Emittable:
-        def __init__(self):
-            self._cb = None
-
-        def connect(self, cb):
-            self._cb = cb
-
-        def emit(self, *a, **k):
-            if self._cb:
-                self._cb(*a, **k)
-
     class FakeLoad:
         def __init__(self, connection, collection_name, parent=None):
-            self.finished = Emittable()
-            self.error = Emittable()
+            self.finished = _Emittable()
+            self.error = _Emittable()
 
         def start(self):
             try:
@@ -188,11 +201,7 @@ def test_refresh_collection_info_uses_thread(monkeypatch, qtbot):
     assert panel.collection_info_thread is not None
 
 
-def test_update_embedding_model_display_variants(monkeypatch, qtbot):
-    mod = __import__("vector_inspector.ui.views.info_panel", fromlist=["*"])
-    app_state = make_fake_app_state()
-    panel = mod.InfoPanel(app_state, None)
-    qtbot.addWidget(panel)
+def test_update_embedding_model_display_variants(monkeypatch, panel):
 
     # Case 1: embedding_model present in collection_info
     ci = {"embedding_model": "m1", "embedding_model_type": "stored"}
@@ -201,9 +210,7 @@ def test_update_embedding_model_display_variants(monkeypatch, qtbot):
     assert panel.clear_embedding_btn.isEnabled()
 
     # Case 2: connection can detect model
-    panel.connection = type(
-        "C", (), {"get_embedding_model": lambda self, c: "detected-model", "name": "x", "id": "cid"}
-    )()
+    panel.connection = _stub_connection("detected-model", name="x", id="cid")
     panel.current_collection = "coll"
     panel._update_embedding_model_display({})
     assert "detected" in panel.embedding_model_label.text()
@@ -213,31 +220,20 @@ def test_update_embedding_model_display_variants(monkeypatch, qtbot):
         def get_embedding_model(self, profile, coll):
             return {"model": "smod", "type": "user"}
 
-    monkeypatch.setattr("vector_inspector.services.settings_service.SettingsService", DummySettings)
-    panel.connection = type("C2", (), {"name": "p", "id": "cid", "get_embedding_model": lambda self, c: None})()
+    monkeypatch.setattr(settings_service, "SettingsService", DummySettings)
+    panel.connection = _stub_connection(name="p", id="cid")
     panel.current_collection = "coll"
     panel._update_embedding_model_display({})
     assert "smod" in panel.embedding_model_label.text()
 
 
-def test_clear_embedding_model_and_update_state(monkeypatch, qtbot):
-    mod = __import__("vector_inspector.ui.views.info_panel", fromlist=["*"])
-    app_state = make_fake_app_state()
+def test_clear_embedding_model_and_update_state(monkeypatch, panel):
     # make cache manager spy
     invocations = {}
-    cache = type(
-        "C",
-        (),
-        {
-            "get": lambda *a, **k: None,
-            "invalidate": lambda *a, **k: invocations.setdefault("invalidated", (a[0], a[1]) if len(a) >= 2 else a),
-            "update": lambda *a, **k: None,
-        },
-    )()
-    app_state.cache_manager = cache
-    panel = mod.InfoPanel(app_state, None)
-    qtbot.addWidget(panel)
-    panel.connection = type("Conn", (), {"id": "cid", "name": "p", "is_connected": True})()
+    cache = _stub_cache()
+    panel.cache_manager = cache
+    panel.connection = MagicMock(spec=["id", "name", "is_connected"], id="cid", is_connected=True)
+    panel.connection.name = "p"
     panel.current_collection = "coll"
 
     # Stub CollectionInfoLoadThread so _clear_embedding_model's set_collection call
@@ -270,19 +266,14 @@ def test_clear_embedding_model_and_update_state(monkeypatch, qtbot):
         def remove_embedding_model(self, profile, coll):
             invocations.setdefault("removed", (profile, coll))
 
-    monkeypatch.setattr("vector_inspector.services.settings_service.SettingsService", Svc)
+    monkeypatch.setattr(settings_service, "SettingsService", Svc)
     panel._clear_embedding_model()
     assert invocations.get("removed") == ("p", "coll")
-    assert invocations.get("invalidated") is not None
+    cache.invalidate.assert_called()
 
 
-def test_configure_embedding_model_flow(monkeypatch, qtbot):
-    mod = __import__("vector_inspector.ui.views.info_panel", fromlist=["*"])
-    app_state = make_fake_app_state()
-    # Prepare panel
-    panel = mod.InfoPanel(app_state, None)
-    qtbot.addWidget(panel)
-    panel.connection = type("Conn", (), {"id": "cid", "name": "p", "get_embedding_model": lambda self, c: None})()
+def test_configure_embedding_model_flow(monkeypatch, panel):
+    panel.connection = _stub_connection(id="cid", name="p")
     panel.current_collection = "coll"
 
     # Fake LoadingDialog to avoid UI
@@ -296,24 +287,13 @@ def test_configure_embedding_model_flow(monkeypatch, qtbot):
         def hide_loading(self):
             pass
 
-    monkeypatch.setattr("vector_inspector.ui.components.loading_dialog.LoadingDialog", FakeLoading)
+    monkeypatch.setattr(loading_dialog, "LoadingDialog", FakeLoading)
 
     # Fake ModelConfigPreparationThread to immediately call finished
-    class Emittable:
-        def __init__(self):
-            self._cb = None
-
-        def connect(self, cb):
-            self._cb = cb
-
-        def emit(self, *a, **k):
-            if self._cb:
-                self._cb(*a, **k)
-
     class FakeModelThread:
         def __init__(self, connection, collection_name, parent=None):
-            self.finished = Emittable()
-            self.error = Emittable()
+            self.finished = _Emittable()
+            self.error = _Emittable()
 
         def start(self):
             self.finished.emit({"vector_dimension": 32})
@@ -341,8 +321,8 @@ def test_configure_embedding_model_flow(monkeypatch, qtbot):
         def get_selection(self):
             return ("mymodel", "stored")
 
-    monkeypatch.setattr("vector_inspector.ui.dialogs.ProviderTypeDialog", PTD)
-    monkeypatch.setattr("vector_inspector.ui.dialogs.EmbeddingConfigDialog", ECD)
+    monkeypatch.setattr(dialogs, "ProviderTypeDialog", PTD)
+    monkeypatch.setattr(dialogs, "EmbeddingConfigDialog", ECD)
 
     # Stub SettingsService.save_embedding_model and cache invalidation
     saved = {}
@@ -354,8 +334,8 @@ def test_configure_embedding_model_flow(monkeypatch, qtbot):
         def save_embedding_model(self, profile, coll, model, mtype):
             saved["args"] = (profile, coll, model, mtype)
 
-    monkeypatch.setattr("vector_inspector.services.settings_service.SettingsService", Svc2)
-    panel.cache_manager = type("C", (), {"invalidate": lambda *a, **k: saved.setdefault("invalidated", True)})()
+    monkeypatch.setattr(settings_service, "SettingsService", Svc2)
+    panel.cache_manager = _stub_cache()
 
     panel._configure_embedding_model()
     assert saved.get("args") == ("p", "coll", "mymodel", "stored")
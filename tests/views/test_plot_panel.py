@@ -7,12 +7,10 @@ from vector_inspector.ui.views.visualization.plot_panel import PlotEventBridge,
 
 @pytest.fixture
 def plot_panel(qtbot, webengine_cleanup):
+    # webengine_cleanup detaches the page on teardown; qtbot closes the panel
     panel = PlotPanel()
     qtbot.addWidget(panel)
-    yield panel
-    panel.web_view.setPage(None)
-    panel.web_view.close()
-    panel.deleteLater()
+    return panel
 
 
 def test_plot_event_bridge_emits_signal(qtbot):
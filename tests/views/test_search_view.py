@@ -577,7 +577,7 @@ def test_copy_vectors_fetches_embedding(sv, qtbot, monkeypatch):
     import json
 
     data = json.loads(clipboard_text[0])
-    assert data["id"] == "id1"
+    assert [d["id"] for d in data] == ["id1"]
     assert info_messages
 
 
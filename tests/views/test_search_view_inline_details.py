@@ -3,19 +3,33 @@
 Uses pytest-qt's qtbot fixture for proper Qt widget testing.
 """
 
-from unittest.mock import patch
-
 import pytest
+from PySide6.QtCore import QCoreApplication
 
+from tests.fakes.fake_provider import FakeProvider
+from vector_inspector.services import ThreadedTaskRunner
 from vector_inspector.state import AppState
 from vector_inspector.ui.views.search_view import SearchView
 
+# Keep the tests on one xdist worker to avoid rebuilding the shared SearchView per worker
+pytestmark = pytest.mark.xdist_group(name="qt_search")
 
-@pytest.fixture
-def mock_connection(fake_provider):
-    """Provide a lightweight fake provider populated with predictable results."""
+# Fixed query results, in the per-query nested shape providers return
+_QUERY_RESULTS = {
+    "ids": [["result1", "result2", "result3"]],
+    "documents": [["Result doc 1", "Result doc 2", "Result doc 3"]],
+    "metadatas": [[{"title": "Result 1"}, {"title": "Result 2"}, {"title": "Result 3"}]],
+    "embeddings": [[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]]],
+    "distances": [[0.1, 0.3, 0.5]],
+}
+
+
+@pytest.fixture(scope="module")
+def _shared_connection():
+    """Fake provider populated with predictable results, built once per module."""
+    provider = FakeProvider()
     # Populate a collection the tests expect
-    fake_provider.create_collection(
+    provider.create_collection(
         "test_collection",
         ["Result doc 1", "Result doc 2", "Result doc 3"],
         [{"title": "Result 1"}, {"title": "Result 2"}, {"title": "Result 3"}],
@@ -23,40 +37,95 @@ def mock_connection(fake_provider):
         ids=["result1", "result2", "result3"],
     )
     # Provide simple embedding helper used by SearchView to compute query embeddings
-    fake_provider.compute_embeddings_for_documents = lambda texts: [[0.1, 0.2, 0.3]]
+    provider.compute_embeddings_for_documents = lambda texts: [[0.1, 0.2, 0.3]]
     # Provide supported filter operators API expected by SearchView
-    fake_provider.get_supported_filter_operators = lambda: []
+    provider.get_supported_filter_operators = lambda: []
+    # Per-test override: a result dict to return, or an exception to raise
+    provider.query_result = None
     # Provide compatibility wrapper so callers using `query_texts` kw work
-    orig_qc = fake_provider.query_collection
+    orig_qc = provider.query_collection
 
     def _qc_compat(collection_name, query_texts=None, n_results=10, where=None, **kwargs):
+        if isinstance(provider.query_result, Exception):
+            raise provider.query_result
+        if provider.query_result is not None:
+            return provider.query_result
         # For deterministic tests, return a fixed ordering when query_texts
         # are provided so tests relying on result ordering remain stable.
         if query_texts:
-            return {
-                "ids": [["result1", "result2", "result3"]],
-                "documents": [["Result doc 1", "Result doc 2", "Result doc 3"]],
-                "metadatas": [[{"title": "Result 1"}, {"title": "Result 2"}, {"title": "Result 3"}]],
-                "embeddings": [[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]]],
-                "distances": [[0.1, 0.3, 0.5]],
-            }
+            return _QUERY_RESULTS
 
         return orig_qc(collection_name, n_results=n_results, where=where)
 
-    fake_provider.query_collection = _qc_compat
-    return fake_provider
+    provider.query_collection = _qc_compat
+    return provider
 
 
 @pytest.fixture
-def search_view(qtbot, mock_connection, task_runner):
-    """Create a search view."""
+def mock_connection(_shared_connection):
+    """The shared fake provider; a query_result set by a test is cleared afterwards."""
+    yield _shared_connection
+    _shared_connection.query_result = None
+
+
+@pytest.fixture(scope="module")
+def _shared_search_view(qapp, _shared_connection):
+    """One SearchView per module; widget construction dominates these tests."""
     app_state = AppState()
-    app_state.provider = mock_connection
-    view = SearchView(app_state, task_runner)
-    qtbot.addWidget(view)
+    app_state.provider = _shared_connection
+    view = SearchView(app_state, ThreadedTaskRunner())
+    yield view
+    view.close()
+    view.deleteLater()
+
+
+def _reset_search_view(view):
+    """Return the shared view to its freshly constructed state."""
+    # Let an in-flight search finish and deliver its result before clearing,
+    # so it cannot land in the next test
+    if view.search_thread is not None:
+        view.search_thread.wait()
+    QCoreApplication.processEvents()
+    view.loading_dialog.hide_loading()
+    view.filter_group.setChecked(False)
+    view._refresh_search()
+
+
+@pytest.fixture
+def search_view(_shared_search_view, mock_connection):
+    """Create a search view."""
+    view = _shared_search_view
     view.current_collection = "test_collection"
     view.current_database = "test_db"
-    return view
+    yield view
+    _reset_search_view(view)
+
+
+class FakeItemDetailsDialog:
+    """Records construction and exec() in place of the modal details dialog."""
+
+    def __init__(self, parent=None, item_data=None, show_search_info=False):
+        self.item_data = item_data
+        self.show_search_info = show_search_info
+        self.executed = False
+
+    def exec(self):
+        self.executed = True
+        return False
+
+
+@pytest.fixture
+def opened_details_dialogs(monkeypatch):
+    """Swap SearchView's ItemDetailsDialog for a recorder; yields the dialogs it opened."""
+    opened = []
+
+    def _open(*args, **kwargs):
+        dialog = FakeItemDetailsDialog(*args, **kwargs)
+        opened.append(dialog)
+        return dialog
+
+    monkeypatch.setattr("vector_inspector.ui.views.search_view.ItemDetailsDialog", _open)
+    return opened
 
 
 def test_inline_details_pane_exists(search_view):
@@ -74,10 +143,7 @@ def test_inline_pane_starts_hidden(search_view):
 
 def test_pane_shows_on_result_selection(qtbot, search_view, mock_connection):
     """Test that pane is updated when item data is provided."""
-    # Perform search
-    search_view.query_input.setText("test query")
-    search_view._perform_search()
-    qtbot.waitUntil(lambda: search_view.results_table.rowCount() > 0, timeout=2000)
+    search_view._apply_search_results(_QUERY_RESULTS)
 
     # Initially should have no item
     assert search_view.details_pane._current_item is None
@@ -100,10 +166,7 @@ def test_pane_shows_on_result_selection(qtbot, search_view, mock_connection):
 
 def test_pane_hides_on_refresh(qtbot, search_view, mock_connection):
     """Test that pane clears data when search is refreshed."""
-    # Perform search and show pane with data
-    search_view.query_input.setText("test query")
-    search_view._perform_search()
-    qtbot.waitUntil(lambda: search_view.results_table.rowCount() > 0, timeout=2000)
+    search_view._apply_search_results(_QUERY_RESULTS)
 
     item_data = {"id": "result1", "document": "doc1", "rank": 1}
     search_view.details_pane.update_item(item_data)
@@ -131,10 +194,7 @@ def test_pane_hides_on_collection_change(qtbot, search_view):
 
 def test_pane_shows_search_metrics(qtbot, search_view, mock_connection):
     """Test that pane shows search-specific metrics."""
-    # Perform search
-    search_view.query_input.setText("test query")
-    search_view._perform_search()
-    qtbot.waitUntil(lambda: search_view.results_table.rowCount() > 0, timeout=2000)
+    search_view._apply_search_results(_QUERY_RESULTS)
 
     # Select first result
     search_view.results_table.selectRow(0)
@@ -147,10 +207,7 @@ def test_pane_shows_search_metrics(qtbot, search_view, mock_connection):
 
 def test_pane_updates_on_selection_change(qtbot, search_view, mock_connection):
     """Test that pane updates when selecting different results."""
-    # Perform search
-    search_view.query_input.setText("test query")
-    search_view._perform_search()
-    qtbot.waitUntil(lambda: search_view.results_table.rowCount() > 0, timeout=2000)
+    search_view._apply_search_results(_QUERY_RESULTS)
 
     # Select first result
     search_view.results_table.selectRow(0)
@@ -166,7 +223,7 @@ def test_pane_updates_on_selection_change(qtbot, search_view, mock_connection):
 def test_pane_hides_on_empty_results(qtbot, search_view, mock_connection):
     """Test that pane hides when search returns no results."""
     # Mock empty search results
-    mock_connection.query_collection = lambda *a, **k: {
+    mock_connection.query_result = {
         "ids": [],
         "documents": [],
         "metadatas": [],
@@ -185,22 +242,17 @@ def test_pane_hides_on_empty_results(qtbot, search_view, mock_connection):
 
 def test_pane_hides_on_search_error(qtbot, search_view, mock_connection):
     """Test that pane hides when search fails."""
+    search_view.details_pane.update_item({"id": "test", "document": "doc"})
+    search_view.details_pane.setVisible(True)
 
-    # Mock search error
-    def _raise_error(*a, **k):
-        raise Exception("Search failed")
-
-    mock_connection.query_collection = _raise_error
-
+    # The search thread reports the failure through _on_search_error
+    mock_connection.query_result = Exception("Search failed")
     search_view.query_input.setText("test query")
-    # Search will raise exception - test that it doesn't crash the app
-    try:
-        search_view._perform_search()
-    except Exception:
-        pass  # Expected
+    search_view._perform_search()
+    qtbot.waitUntil(lambda: search_view.results_status.text().startswith("Search failed"), timeout=2000)
 
-    # Pane should be hidden (or stay hidden)
     assert search_view.details_pane.isVisible() is False
+    assert search_view.results_table.rowCount() == 0
 
 
 def test_search_input_height_reduced(search_view):
@@ -211,69 +263,45 @@ def test_search_input_height_reduced(search_view):
 
 def test_advanced_filters_start_collapsed(search_view):
     """Test that advanced metadata filters start collapsed."""
-    # Filter group should be unchecked
-    assert search_view.filter_group.isChecked() is False
-
     # Filter builder should be hidden
     assert search_view.filter_builder.isVisible() is False
 
 
-def test_advanced_filters_show_when_checked(qtbot, search_view):
-    """Test that advanced filters checkbox toggles properly."""
-    # Initially unchecked
-    assert search_view.filter_group.isChecked() is False
-
-    # Check the box
-    search_view.filter_group.setChecked(True)
-
-    # Should be checked
-    assert search_view.filter_group.isChecked() is True
-
-    # Verify signal is connected to setVisible method
-    # (implementation detail: toggled signal connected to filter_builder.setVisible)
-    assert search_view.filter_builder is not None
-
-
-def test_advanced_filters_hide_when_unchecked(qtbot, search_view):
-    """Test that advanced filters toggle works in both directions."""
-    # Check the box first
-    search_view.filter_group.setChecked(True)
-    assert search_view.filter_group.isChecked() is True
-
-    # Uncheck
-    search_view.filter_group.setChecked(False)
+@pytest.mark.parametrize(
+    ("sequence", "expected"),
+    [
+        pytest.param([], False, id="default"),
+        pytest.param([True], True, id="checked"),
+        pytest.param([True, False], False, id="unchecked"),
+    ],
+)
+def test_advanced_filters_toggle(search_view, sequence, expected):
+    """Test that the advanced filters checkbox starts unchecked and toggles both ways."""
+    for checked in sequence:
+        search_view.filter_group.setChecked(checked)
 
-    # Should be unchecked
-    assert search_view.filter_group.isChecked() is False
+    assert search_view.filter_group.isChecked() is expected
 
 
-def test_open_full_details_from_search_pane(qtbot, search_view, mock_connection):
+def test_open_full_details_from_search_pane(qtbot, search_view, mock_connection, opened_details_dialogs):
     """Test opening full details dialog from search inline pane."""
-    # Perform search and select result
-    search_view.query_input.setText("test query")
-    search_view._perform_search()
-    qtbot.waitUntil(lambda: search_view.results_table.rowCount() > 0, timeout=2000)
+    search_view._apply_search_results(_QUERY_RESULTS)
     search_view.results_table.selectRow(0)
     search_view._on_selection_changed()
 
-    with patch("vector_inspector.ui.views.search_view.ItemDetailsDialog") as MockDialog:
-        mock_dialog = MockDialog.return_value
-        mock_dialog.exec.return_value = False
+    # Click "Open full details" button
+    search_view.details_pane.full_details_btn.click()
 
-        # Click "Open full details" button
-        search_view.details_pane.full_details_btn.click()
-
-        # Should open full details dialog
-        MockDialog.assert_called_once()
+    # Should open full details dialog
+    assert len(opened_details_dialogs) == 1
+    assert opened_details_dialogs[0].executed
 
 
 def test_pane_state_saved_on_close(qtbot, search_view, mock_connection):
     """Test that pane state is saved when view closes."""
     from vector_inspector.services.settings_service import SettingsService
 
-    # Perform search and select result
-    search_view.query_input.setText("test query")
-    search_view._perform_search()
+    search_view._apply_search_results(_QUERY_RESULTS)
     search_view.results_table.selectRow(0)
     search_view._on_selection_changed()
 
@@ -293,26 +321,18 @@ def test_pane_state_saved_on_close(qtbot, search_view, mock_connection):
 
 def test_query_section_content_hugs_top(search_view):
     """Test that query section content is pushed to top."""
-    # The query_layout should have a stretch at the end
-    # This is harder to test directly, but we can verify the layout structure
-    query_widget = search_view.findChild(type(search_view.children()[0]))
-    if query_widget and hasattr(query_widget, "layout"):
-        layout = query_widget.layout()
-        if layout:
-            # Last item should be a stretch
-            last_item = layout.itemAt(layout.count() - 1)
-            # Stretch items have no widget
-            has_stretch = last_item and last_item.widget() is None
-            # This is a proxy check, but indicates stretch was added
-            assert layout.count() > 2  # Should have multiple items
+    layout = search_view.query_section.layout()
+
+    # The query layout ends with a stretch, which has no widget
+    last_item = layout.itemAt(layout.count() - 1)
+    assert last_item.widget() is None
+    assert last_item.spacerItem() is not None
+    assert layout.count() > 2  # Should have multiple items
 
 
 def test_similarity_calculation(qtbot, search_view, mock_connection):
     """Test that similarity score is correctly calculated from distance."""
-    # Perform search
-    search_view.query_input.setText("test query")
-    search_view._perform_search()
-    qtbot.waitUntil(lambda: search_view.results_table.rowCount() > 0, timeout=2000)
+    search_view._apply_search_results(_QUERY_RESULTS)
 
     # Select first result (distance = 0.1)
     search_view.results_table.selectRow(0)
@@ -325,10 +345,7 @@ def test_similarity_calculation(qtbot, search_view, mock_connection):
 
 def test_rank_display(qtbot, search_view, mock_connection):
     """Test that rank is correctly displayed."""
-    # Perform search
-    search_view.query_input.setText("test query")
-    search_view._perform_search()
-    qtbot.waitUntil(lambda: search_view.results_table.rowCount() > 0, timeout=2000)
+    search_view._apply_search_results(_QUERY_RESULTS)
 
     # Select first result
     search_view.results_table.selectRow(0)
@@ -342,7 +359,7 @@ def test_rank_display(qtbot, search_view, mock_connection):
 def test_pane_handles_missing_distance(qtbot, search_view, mock_connection):
     """Test that pane handles missing distance values."""
     # Mock results without distances
-    mock_connection.query_collection = lambda *a, **k: {
+    mock_connection.query_result = {
         "ids": ["result1"],
         "documents": ["Result doc 1"],
         "metadatas": [{"title": "Result 1"}],
@@ -369,43 +386,28 @@ def test_pane_handles_missing_distance(qtbot, search_view, mock_connection):
     assert search_view.details_pane._current_item["distance"] is None
 
 
-def test_double_click_opens_details_in_search(qtbot, search_view, mock_connection):
+def test_double_click_opens_details_in_search(qtbot, search_view, mock_connection, opened_details_dialogs):
     """Test that double-clicking a search result opens details dialog."""
-    # Perform search
-    search_view.query_input.setText("test query")
-    search_view._perform_search()
-    qtbot.waitUntil(lambda: search_view.results_table.rowCount() > 0, timeout=2000)
-
-    with patch("vector_inspector.ui.views.search_view.ItemDetailsDialog") as MockDialog:
-        mock_dialog = MockDialog.return_value
-        mock_dialog.exec.return_value = False
+    search_view._apply_search_results(_QUERY_RESULTS)
 
-        # Select and double-click first result
-        search_view.results_table.selectRow(0)
-        index = search_view.results_table.model().index(0, 0)
+    # Select and double-click first result
+    search_view.results_table.selectRow(0)
+    index = search_view.results_table.model().index(0, 0)
 
-        # Simulate double-click
-        search_view._on_row_double_clicked(index)
+    # Simulate double-click
+    search_view._on_row_double_clicked(index)
 
-        # Should create ItemDetailsDialog
-        MockDialog.assert_called_once()
+    # Should create ItemDetailsDialog
+    assert len(opened_details_dialogs) == 1
 
 
 def test_splitter_allocates_more_space_to_results(qtbot, search_view):
     """Test that splitter gives more space to results than query section."""
-    # Find the main splitter
-    from PySide6.QtWidgets import QSplitter
-
-    splitters = search_view.findChildren(QSplitter)
-
-    if splitters:
-        main_splitter = splitters[0]  # Main vertical splitter
-        sizes = main_splitter.sizes()
-
-        # Results section should get more space than query section
-        # This assumes results is second section (index 1)
-        if len(sizes) >= 2:
-            query_size = sizes[0]
-            results_size = sizes[1]
-            # Results should have more or similar space
-            assert results_size >= query_size * 0.8  # Allow some flexibility
+    splitter = search_view.main_splitter
+
+    # Query section first, results second
+    assert splitter.widget(0) is search_view.query_section
+    assert splitter.count() == 2
+    # Results should get more of the stretch than the query section
+    sizes = splitter.sizes()
+    assert sizes[1] >= sizes[0] * 0.8  # Allow some flexibility